@@ -0,0 +1,255 @@
+"""
+Measure the peak and retained memory of building large numbers of date/time objects.
+
+.. code-block:: bash
+
+    python benchmarks/memory.py --check
+
+Memory is traced with ``tracemalloc``. The peak is the most allocated at once while building the objects, and the
+retained memory is what is still allocated while they are held. Both are reported per object and, with ``--check``,
+compared with the thresholds below; the exit code is ``1`` when any threshold is exceeded.
+
+The thresholds hold only for the default number of objects. Fixed costs are spread over fewer objects at a smaller
+``--scale``, and containers such as sets grow in steps, so the memory per object is not constant; ``--check`` may not
+be combined with another scale.
+
+"""
+# Imports
+
+from argparse import ArgumentParser
+from datetime import date, datetime, timedelta
+import gc
+import sys
+import tracemalloc
+from datetime_machine import DateTime, DateTimeRange, HolidayCalendar, HolidayRule, HolidayRules, Month, MONDAY, \
+    THURSDAY
+
+# Constants
+
+# The maximum peak and retained bytes per object of each scenario. These allow some headroom over the measured values
+# on CPython 3.11, so that only real regressions fail.
+THRESHOLDS = {
+    'date_times': (200, 200),
+    'date_time_ranges': (480, 480),
+    'months': (200, 200),
+    'holiday_list': (60, 60),
+    'holiday_calendar': (180, 8),
+    'holiday_rules': (2400, 2400),
+}
+
+# Classes
+
+
+class Scenario(object):
+    """A way of building objects whose memory is measured."""
+
+    def __init__(self, name, description, count, build):
+        """Initialize a scenario.
+
+        :param name: The name of the scenario, as used in ``THRESHOLDS``.
+        :type name: str
+
+        :param description: A description of what is built.
+        :type description: str
+
+        :param count: The number of objects built.
+        :type count: int
+
+        :param build: A callable that builds and returns the objects.
+        :type build: callable
+
+        """
+        self.build = build
+        self.count = count
+        self.description = description
+        self.name = name
+
+    def measure(self):
+        """Build the objects and measure the memory.
+
+        :rtype: tuple
+        :returns: The peak and retained bytes per object.
+
+        """
+        gc.collect()
+        tracemalloc.start()
+        try:
+            objects = self.build()
+            retained, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        del objects
+        return peak / float(self.count), retained / float(self.count)
+
+# Functions
+
+
+def build_date_time_ranges(count):
+    """Build date/time ranges of up to 90 days.
+
+    :param count: The number of ranges.
+    :type count: int
+
+    :rtype: list[DateTimeRange]
+
+    """
+    start = datetime(2000, 1, 1)
+    return [DateTimeRange(start + timedelta(minutes=i), start + timedelta(minutes=i, days=i % 90))
+            for i in range(count)]
+
+
+def build_date_times(count):
+    """Build date/times a minute apart.
+
+    :param count: The number of date/times.
+    :type count: int
+
+    :rtype: list[DateTime]
+
+    """
+    start = datetime(2000, 1, 1)
+    return [DateTime(start + timedelta(minutes=i)) for i in range(count)]
+
+
+def build_holiday_calendar(count):
+    """Build a holiday calendar from a list of dates. The list is released once the calendar is built.
+
+    :param count: The number of holidays.
+    :type count: int
+
+    :rtype: HolidayCalendar
+
+    """
+    return HolidayCalendar.from_dates(build_holiday_list(count))
+
+
+def build_holiday_list(count):
+    """Build a list of daily holidays.
+
+    :param count: The number of holidays.
+    :type count: int
+
+    :rtype: list[date]
+
+    """
+    start = date(1800, 1, 1)
+    return [start + timedelta(days=i) for i in range(count)]
+
+
+def build_holiday_rules(years):
+    """Build holiday rules and generate the holidays of each year.
+
+    :param years: The number of years.
+    :type years: int
+
+    :rtype: HolidayRules
+
+    """
+    rules = HolidayRules([
+        HolidayRule.fixed("New Year's Day", 1, 1, observed="nearest"),
+        HolidayRule.nth_weekday("Memorial Day", 5, MONDAY, -1),
+        HolidayRule.fixed("Independence Day", 7, 4, observed="nearest"),
+        HolidayRule.nth_weekday("Thanksgiving Day", 11, THURSDAY, 4),
+        HolidayRule.fixed("Christmas Day", 12, 25, observed="nearest"),
+        HolidayRule.easter("Good Friday", days=-2),
+    ])
+
+    for year in range(2000, 2000 + years):
+        _ = date(year, 7, 4) in rules
+
+    return rules
+
+
+def build_months(years):
+    """Build every month across a number of years.
+
+    :param years: The number of years.
+    :type years: int
+
+    :rtype: list[Month]
+
+    """
+    months = [Month(datetime(2000, 1, 1))]
+    for _ in range(years * 12 - 1):
+        months.append(months[-1].next())
+
+    return months
+
+
+def get_scenarios(scale=1.0):
+    """Get the scenarios.
+
+    :param scale: Multiplies the number of objects built, so that a quick run may be made with fewer.
+    :type scale: float
+
+    :rtype: list[Scenario]
+
+    """
+    date_times = max(int(1000000 * scale), 1)
+    date_time_ranges = max(int(100000 * scale), 1)
+    holidays = max(int(100000 * scale), 1)
+
+    return [
+        Scenario("date_times", "%s DateTime" % date_times, date_times, lambda: build_date_times(date_times)),
+        Scenario(
+            "date_time_ranges",
+            "%s DateTimeRange" % date_time_ranges,
+            date_time_ranges,
+            lambda: build_date_time_ranges(date_time_ranges)
+        ),
+        Scenario("months", "every Month of 100 years", 1200, lambda: build_months(100)),
+        Scenario("holiday_list", "%s holidays as a list" % holidays, holidays, lambda: build_holiday_list(holidays)),
+        Scenario(
+            "holiday_calendar",
+            "%s holidays as a HolidayCalendar" % holidays,
+            holidays,
+            lambda: build_holiday_calendar(holidays)
+        ),
+        Scenario("holiday_rules", "holiday rules for 100 years", 100, lambda: build_holiday_rules(100)),
+    ]
+
+
+def main(args=None):
+    """Run the suite.
+
+    :param args: The command line arguments. Defaults to ``sys.argv``.
+    :type args: list[str]
+
+    :rtype: int
+    :returns: The exit code.
+
+    """
+    parser = ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--check", action="store_true", help="Fail when a threshold is exceeded.")
+    parser.add_argument("-s", "--scale", default=1.0, type=float, help="Multiply the number of objects built.")
+    options = parser.parse_args(args)
+
+    if options.check and options.scale != 1.0:
+        parser.error("--check requires the default --scale of 1.0, for which the thresholds are set.")
+
+    failures = list()
+
+    print("%-36s %14s %14s %8s" % ("Scenario", "Peak B/Object", "Kept B/Object", "Status"))
+    for scenario in get_scenarios(scale=options.scale):
+        peak, retained = scenario.measure()
+        peak_threshold, retained_threshold = THRESHOLDS[scenario.name]
+
+        status = "ok"
+        if options.scale != 1.0:
+            status = "-"
+        elif peak > peak_threshold or retained > retained_threshold:
+            status = "FAIL"
+            failures.append(scenario.name)
+
+        print("%-36s %14.1f %14.1f %8s" % (scenario.description, peak, retained, status))
+
+    if options.check and failures:
+        print("Memory thresholds exceeded: %s" % ", ".join(failures))
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+Measure the payload size and (de)serialization time of pickled date/time objects.
+
+.. code-block:: bash
+
+    python benchmarks/pickling.py --count 1000000
+
+For each kind of object, the compact encoding is compared with the default, which pickles the class and the ``__dict__``
+of each instance.
+
+"""
+# Imports
+
+from argparse import ArgumentParser
+from datetime import datetime, timedelta
+import pickle
+import pytz
+import random
+import time
+from datetime_machine import DateTime, DateTimeRange, Month, Week
+
+# Constants
+
+ZONES = ("UTC", "America/New_York", "Europe/London", "Asia/Tokyo")
+
+# Functions
+
+
+def get_objects(kind, count):
+    """Create objects of a kind.
+
+    :param kind: The kind of object.
+    :type kind: str
+
+    :param count: The number of objects.
+    :type count: int
+
+    :rtype: list
+
+    """
+    generator = random.Random(count)
+    start = datetime(2000, 1, 1)
+
+    objects = list()
+    for _ in range(count):
+        dt = start + timedelta(seconds=generator.randint(0, 86400 * 365 * 30),
+                               microseconds=generator.randint(0, 999999))
+        if kind == "DateTime":
+            objects.append(DateTime(dt))
+        elif kind == "DateTime (pytz)":
+            objects.append(DateTime(pytz.timezone(generator.choice(ZONES)).localize(dt)))
+        elif kind == "DateTimeRange":
+            objects.append(DateTimeRange(dt, dt + timedelta(days=generator.randint(0, 90))))
+        elif kind == "Month":
+            objects.append(Month(dt))
+        else:
+            objects.append(Week(dt))
+
+    return objects
+
+
+def get_default_payload(obj):
+    """Get the equivalent of what is pickled by default; the class and the ``__dict__`` of each instance."""
+    if isinstance(obj, DateTimeRange):
+        return DateTimeRange, {'end': get_default_payload(obj.end), 'start': get_default_payload(obj.start)}
+
+    return type(obj), obj.__dict__
+
+
+def main(args=None):
+    """Run the benchmark.
+
+    :param args: The command line arguments. Defaults to ``sys.argv``.
+    :type args: list[str]
+
+    """
+    parser = ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("-c", "--count", default=1000000, type=int, help="The number of objects of each kind.")
+    parser.add_argument(
+        "-p",
+        "--protocol",
+        default=pickle.HIGHEST_PROTOCOL,
+        type=int,
+        help="The pickle protocol."
+    )
+    options = parser.parse_args(args)
+
+    print("%-16s %-8s %12s %10s %10s" % ("Kind", "Encoding", "Bytes/Object", "Dump (s)", "Load (s)"))
+    for kind in ("DateTime", "DateTime (pytz)", "DateTimeRange", "Month", "Week"):
+        objects = get_objects(kind, options.count)
+        for encoding, payload in (("default", [get_default_payload(obj) for obj in objects]), ("compact", objects)):
+            start = time.perf_counter()
+            data = pickle.dumps(payload, protocol=options.protocol)
+            dump_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            pickle.loads(data)
+            load_time = time.perf_counter() - start
+
+            print("%-16s %-8s %12.1f %10.2f %10.2f" % (
+                kind,
+                encoding,
+                len(data) / float(options.count),
+                dump_time,
+                load_time
+            ))
+
+
+if __name__ == "__main__":
+    main()
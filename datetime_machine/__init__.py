@@ -1,7 +1,15 @@
+from importlib import import_module
 from .constants import *
-from .library import DateTime, DateTimeRange, Month, Week, Year
+from .feeds import FeedChecker
+from .formats import Format, compile_format, format_many
+from .holidays import HolidayCalendar, HolidayRule, HolidayRules
+from .library import DateTime, DateTimeRange, DateTimeSet, Month, Quarter, Week, Year
+from .offsets import Offset, compile_offset
+from .scheduler import Job, Scheduler
 from .utils import *
 from .variables import *
+from .windows import SlidingWindow
+from .working import WorkingHours
 
 __all__ = (
     "CURRENT_DT",
@@ -40,15 +48,64 @@ __all__ = (
     "TODAY",
     "WEDNESDAY",
     "UTC",
+    "compile_format",
+    "compile_offset",
+    "count_business_days",
+    "diff",
+    "diff_many",
+    "format_many",
     "get_days_in_month",
+    "get_fiscal_year",
+    "get_quarter",
+    "get_timedelta",
+    "get_timezone",
     "get_year_range",
     "increment",
     "is_business_day",
     "is_holiday",
     "is_leap_year",
+    "resample",
+    "roll",
+    "roll_many",
+    "schedule_many",
+    "truncate",
+    "truncate_many",
     "DateTime",
+    "DateTimeArray",
     "DateTimeRange",
+    "DateTimeSet",
+    "FeedChecker",
+    "Format",
+    "HolidayCalendar",
+    "HolidayRule",
+    "HolidayRules",
+    "Job",
     "Month",
+    "Offset",
+    "Quarter",
+    "Schedule",
+    "Scheduler",
+    "SlidingWindow",
     "Week",
+    "WorkingHours",
     "Year",
 )
+
+# These require NumPy, which is slow to import, so their modules are imported when they are first used.
+LAZY_EXPORTS = {
+    'DateTimeArray': "arrays",
+    'Schedule': "schedules",
+    'diff_many': "arrays",
+    'resample': "series",
+    'schedule_many': "schedules",
+}
+
+
+def __getattr__(name):
+    module = LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+    value = getattr(import_module(".%s" % module, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,825 @@
+"""
+The arrays module provides a columnar container of date/times with the same vocabulary as :py:class:`DateTime`, where
+each operation is performed over the whole array at once.
+
+.. code-block:: python
+
+    from datetime_machine import DateTimeArray
+
+    values = DateTimeArray(datetimes, timezone="America/New_York")
+
+    due = values.increment(business_days=5, holidays=holidays)
+    month_ends = values.end_of_month_dt()
+    mask = values.is_business_day(holidays=holidays)
+
+Values are held as a NumPy ``datetime64[us]`` array of wall clock times that share a single timezone. This mirrors
+:py:class:`DateTime`, whose methods operate on the wall clock of the current date/time.
+
+Interoperability
+----------------
+
+Timestamps already held in columnar form are accepted without creating a ``datetime`` per element:
+
+- NumPy ``datetime64`` arrays are used as is when their unit is microseconds, and otherwise converted in one pass.
+- Integer arrays and objects supporting the buffer protocol (``array.array("q")``, ``memoryview``, ``bytes``) are read
+  as ``int64`` counts of the given ``unit`` since the epoch. With the default unit of microseconds, the buffer is
+  shared.
+- `PyArrow`_ timestamp arrays are read through their data buffer when they have no nulls. Timestamps with a timezone
+  are stored by Arrow as UTC and are converted to the wall clock of that zone.
+
+``to_numpy()`` returns the underlying array and ``to_arrow()`` returns an Arrow array over the same buffer when the
+values have no timezone.
+
+.. _PyArrow: https://arrow.apache.org/docs/python/
+
+.. note::
+    NumPy is required to use this module: ``pip install numpy``. PyArrow support is only enabled when ``pyarrow`` may
+    be imported, and since it is slow to import, it is imported only when an array is converted to Arrow.
+
+"""
+# Imports
+
+from array import array
+from datetime import date, datetime
+import pytz
+import sys
+from .constants import MONDAY, MONTHS_PER_YEAR
+from .holidays import HolidayCalendar, HolidayRules
+from .library import DateTime
+from .utils import DIFF_UNITS, ROLL_CONVENTIONS, ROLL_MARGIN, UNIT_MICROSECONDS, get_timezone, get_truncate_size, \
+    get_week_anchor
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Exports
+
+__all__ = (
+    "DateTimeArray",
+    "diff_many",
+)
+
+# Constants
+
+# The ordinal of the epoch (1970-01-01), used to convert ordinals to datetime64 days.
+EPOCH_ORDINAL = 719163
+
+# The roll argument of numpy.busday_offset() for each convention of roll().
+NUMPY_ROLLS = {
+    'following': "forward",
+    'modified_following': "modifiedfollowing",
+    'modified_preceding': "modifiedpreceding",
+    'preceding': "backward",
+}
+
+# Keyword arguments to increment() that are applied as a timedelta64, and the unit of each.
+TIMEDELTA_UNITS = {
+    'days': "D",
+    'hours': "h",
+    'microseconds': "us",
+    'minutes': "m",
+    'seconds': "s",
+    'weeks': "W",
+}
+
+# Classes
+
+
+class DateTimeArray(object):
+    """An array of date/times sharing one timezone."""
+
+    def __init__(self, values, timezone=None, unit="us"):
+        """Initialize the array.
+
+        :param values: The date/times. These may be ``datetime`` or ``DateTime`` instances, a NumPy ``datetime64``
+                       array, an integer array or buffer of counts since the epoch, or a PyArrow timestamp array.
+        :type values: list[datetime] | numpy.ndarray | memoryview | pyarrow.Array | DateTimeArray
+
+        :param timezone: The timezone shared by the values. Aware ``datetime`` values are converted to this timezone. If
+                         omitted, the timezone of the first aware value (or of the Arrow type) is used.
+        :type timezone: str | tzinfo
+
+        :param unit: The NumPy unit code of integer values; for example ``s``, ``ms``, ``us``, or ``ns``.
+        :type unit: str
+
+        :raise: ImportError
+        :raises: ``ImportError`` when NumPy is not installed.
+
+        """
+        if np is None:
+            raise ImportError("NumPy is required to use DateTimeArray: pip install numpy")
+
+        timezone = get_timezone(timezone)
+
+        # An Arrow array can only have been created once PyArrow was imported.
+        pyarrow = sys.modules.get("pyarrow")
+
+        if isinstance(values, DateTimeArray):
+            timezone = timezone or values.timezone
+            values = values.values
+        elif pyarrow is not None and isinstance(values, (pyarrow.Array, pyarrow.ChunkedArray)):
+            values, timezone = from_arrow(values, timezone)
+        elif isinstance(values, (array, bytearray, bytes, memoryview)):
+            values = np.frombuffer(values, dtype="int64")
+
+        if isinstance(values, np.ndarray):
+            if values.dtype.kind != "M":
+                values = values.astype("int64", copy=False).view("datetime64[%s]" % unit)
+
+            values = values.astype("datetime64[us]", copy=False)
+        else:
+            values, timezone = to_datetime64(values, timezone)
+
+        self.timezone = timezone
+        self.values = values
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            return DateTime(self._to_datetime(self.values[item]))
+
+        return DateTimeArray(self.values[item], timezone=self.timezone)
+
+    def __iter__(self):
+        for dt in self.to_datetimes():
+            yield DateTime(dt)
+
+    def __len__(self):
+        return len(self.values)
+
+    def ceil(self, unit, step=1, start_day=MONDAY):
+        """Get the first boundary of a calendar unit at or after each date/time. See :py:func:`truncate`.
+
+        :rtype: DateTimeArray
+
+        """
+        return self.truncate(unit, step=step, mode="ceil", start_day=start_day)
+
+    def end_of_day_dt(self):
+        """Get the date/time for the end of each date/time. See ``DateTime.end_of_day_dt()``.
+
+        :rtype: DateTimeArray
+
+        """
+        days, _, microseconds = self._split()
+        return self._new(days + np.timedelta64(23 * 3600 + 59 * 60 + 59, "s") + microseconds)
+
+    def end_of_month_dt(self):
+        """Get the date/time for the end of the month of each date/time. See ``DateTime.end_of_month_dt()``.
+
+        :rtype: DateTimeArray
+
+        """
+        days, _, microseconds = self._split()
+        last_days = (days.astype("datetime64[M]") + 1).astype("datetime64[D]") - 1
+        return self._new(last_days + np.timedelta64(23 * 3600 + 59 * 60 + 59, "s") + microseconds)
+
+    def end_of_year_dt(self):
+        """Get the date/time for the end of the year of each date/time. See ``DateTime.end_of_year_dt()``.
+
+        :rtype: DateTimeArray
+
+        """
+        days, _, microseconds = self._split()
+        last_days = (days.astype("datetime64[Y]") + 1).astype("datetime64[D]") - 1
+        return self._new(last_days + np.timedelta64(23 * 3600 + 59 * 60 + 59, "s") + microseconds)
+
+    def floor(self, unit, step=1, start_day=MONDAY):
+        """Get the last boundary of a calendar unit at or before each date/time. See :py:func:`truncate`.
+
+        :rtype: DateTimeArray
+
+        """
+        return self.truncate(unit, step=step, start_day=start_day)
+
+    def get_day_of_week(self, offset=False):
+        """Get the day of the week for each date/time, where Sunday is ``0``. See ``DateTime.get_day_of_week()``.
+
+        :param offset: Increase the day of the week by ``1``.
+        :type offset: bool
+
+        :rtype: numpy.ndarray
+
+        """
+        # The epoch (1970-01-01) is a Thursday.
+        dow = (self.values.astype("datetime64[D]").astype("int64") + 4) % 7
+
+        if offset:
+            dow += 1
+
+        return dow
+
+    def in_range(self, start_dt, end_dt):
+        """Determine whether each date/time falls within a range of two dates.
+
+        :param start_dt: The starting datetime of the range.
+        :type start_dt: datetime
+
+        :param end_dt: The ending datetime of the range.
+        :type end_dt: datetime
+
+        :rtype: numpy.ndarray
+        :returns: A boolean mask.
+
+        """
+        start = self._to_datetime64(start_dt)
+        end = self._to_datetime64(end_dt)
+        return (self.values >= start) & (self.values <= end)
+
+    def increment(self, business_days=0, holidays=None, **kwargs):
+        """Increment each date/time. See :py:func:`increment`.
+
+        :param business_days: The number of business days to increment.
+        :type business_days: int
+
+        :param holidays: Holidays or other time off.
+        :type holidays: list[date] | HolidayCalendar
+
+        The remaining keyword arguments are used to increment the values by the specified amount; ``years``,
+        ``months``, ``weeks``, ``days``, ``hours``, ``minutes``, ``seconds``, and ``microseconds``. As with
+        ``relativedelta``, the day is clamped to the end of the month when incrementing by months or years.
+
+        :rtype: DateTimeArray
+
+        :raise: TypeError, ValueError
+        :raises: ``TypeError`` for an unsupported keyword argument, and ``ValueError`` for non-integer years or
+                 months.
+
+        """
+        values = self.values
+
+        months = 0
+        for key in ("years", "months"):
+            value = kwargs.pop(key, 0)
+            if value != int(value):
+                raise ValueError("Non-integer %s are not supported: %s" % (key, value))
+
+            months += int(value) * (MONTHS_PER_YEAR if key == "years" else 1)
+
+        if months:
+            values = add_months(values, months)
+
+        for key, value in kwargs.items():
+            if key not in TIMEDELTA_UNITS:
+                raise TypeError("Unsupported keyword argument: %s" % key)
+
+            if value:
+                values = values + to_timedelta64(value, TIMEDELTA_UNITS[key])
+
+        if business_days:
+            days = values.astype("datetime64[D]")
+            time_of_day = values - days
+
+            # A date that is not a business day first rolls against the direction of travel, so that the first step
+            # lands on the next business day just as stepping one day at a time would.
+            roll = "backward" if business_days > 0 else "forward"
+            # Allow for weekends and holidays when generating holidays from rules.
+            margin = abs(business_days) * 2 + 14
+            holidays = to_holidays(holidays, days=days, margin=margin)
+            days = np.busday_offset(days, business_days, roll=roll, holidays=holidays)
+            values = days + time_of_day
+
+        return self._new(values)
+
+    def is_business_day(self, holidays=None):
+        """Determine whether each date/time is a business day. See :py:func:`is_business_day`.
+
+        :param holidays: Holidays or other time off.
+        :type holidays: list[date] | HolidayCalendar
+
+        :rtype: numpy.ndarray
+        :returns: A boolean mask.
+
+        """
+        days = self.values.astype("datetime64[D]")
+        return np.is_busday(days, holidays=to_holidays(holidays, days=days))
+
+    def roll(self, convention="following", holidays=None):
+        """Move each date/time that is not on a business day to a business day. See :py:func:`roll`.
+
+        :param convention: ``following``, ``modified_following``, ``preceding``, or ``modified_preceding``.
+        :type convention: str
+
+        :param holidays: Holidays or other time off.
+        :type holidays: list[date] | HolidayCalendar | HolidayRules
+
+        :rtype: DateTimeArray
+
+        :raise: ValueError
+        :raises: ``ValueError`` for an unknown convention.
+
+        """
+        if convention not in ROLL_CONVENTIONS:
+            raise ValueError("Invalid convention (%s), must be one of: %s" % (convention, ", ".join(ROLL_CONVENTIONS)))
+
+        days, time_of_day, _ = self._split()
+        holidays = to_holidays(holidays, days=days, margin=ROLL_MARGIN)
+        days = np.busday_offset(days, 0, roll=NUMPY_ROLLS[convention], holidays=holidays)
+        return self._new(days + time_of_day)
+
+    def round(self, unit, step=1, start_day=MONDAY):
+        """Get the nearest boundary of a calendar unit to each date/time. See :py:func:`truncate`.
+
+        :rtype: DateTimeArray
+
+        """
+        return self.truncate(unit, step=step, mode="round", start_day=start_day)
+
+    def start_of_day_dt(self):
+        """Get the date/time for the beginning of each date/time. See ``DateTime.start_of_day_dt()``.
+
+        :rtype: DateTimeArray
+
+        """
+        days, _, microseconds = self._split()
+        return self._new(days + np.timedelta64(1, "s") + microseconds)
+
+    def start_of_month_dt(self):
+        """Get the date/time for the beginning of the month of each date/time. See ``DateTime.start_of_month_dt()``.
+
+        :rtype: DateTimeArray
+
+        """
+        days, _, microseconds = self._split()
+        first_days = days.astype("datetime64[M]").astype("datetime64[D]")
+        return self._new(first_days + np.timedelta64(1, "s") + microseconds)
+
+    def start_of_year_dt(self):
+        """Get the date/time for the beginning of the year of each date/time. See ``DateTime.start_of_year_dt()``.
+
+        :rtype: DateTimeArray
+
+        """
+        days, _, microseconds = self._split()
+        first_days = days.astype("datetime64[Y]").astype("datetime64[D]")
+        return self._new(first_days + np.timedelta64(1, "s") + microseconds)
+
+    def to_arrow(self):
+        """Get the values as a PyArrow timestamp array.
+
+        :rtype: pyarrow.TimestampArray
+
+        :raise: ImportError
+        :raises: ``ImportError`` when PyArrow is not installed.
+
+        .. note::
+            Without a timezone, the Arrow array shares the buffer of the values. With a timezone, the values are
+            converted to UTC as Arrow requires.
+
+        """
+        pyarrow = get_pyarrow()
+        if pyarrow is None:
+            raise ImportError("PyArrow is required to convert to Arrow: pip install pyarrow")
+
+        if self.timezone is None:
+            return pyarrow.array(self.values)
+
+        zone = getattr(self.timezone, "zone", None) or str(self.timezone)
+        return pyarrow.array(local_to_utc(self.values, self.timezone), type=pyarrow.timestamp("us", tz=zone))
+
+    def to_datetimes(self):
+        """Get the values as ``datetime`` instances in the shared timezone.
+
+        :rtype: list[datetime]
+
+        """
+        return [self._to_datetime(value) for value in self.values]
+
+    def to_numpy(self):
+        """Get the values as a ``datetime64[us]`` array of wall clock times. This is not a copy.
+
+        :rtype: numpy.ndarray
+
+        """
+        return self.values
+
+    def truncate(self, unit, step=1, mode="floor", start_day=MONDAY):
+        """Truncate each date/time to a boundary of a calendar unit. See :py:func:`truncate`.
+
+        :param unit: The unit; ``second``, ``minute``, ``hour``, ``day``, ``week``, ``month``, ``quarter``, or ``year``.
+        :type unit: str
+
+        :param step: The number of units between boundaries.
+        :type step: int
+
+        :param mode: ``floor``, ``ceil``, or ``round``.
+        :type mode: str
+
+        :param start_day: The ISO weekday that starts a week.
+        :type start_day: int
+
+        :rtype: DateTimeArray
+
+        """
+        size, months = get_truncate_size(unit, step, mode)
+
+        if size is not None:
+            # Microseconds from the same origin as truncate(); midnight of ordinal 1.
+            origin = (EPOCH_ORDINAL - 1) * 86400 * 10 ** 6 - get_week_anchor(unit, start_day)
+            remainder = (self.values.view("int64") + origin) % size
+            floor = self.values - remainder.astype("timedelta64[us]")
+            if mode == "floor":
+                return self._new(floor)
+
+            ceil = floor + np.where(remainder > 0, size, 0).astype("timedelta64[us]")
+            if mode == "ceil":
+                return self._new(ceil)
+
+            return self._new(np.where(remainder * 2 >= size, ceil, floor))
+
+        # Months from the first month of year 0, as for truncate().
+        index = self.values.astype("datetime64[M]").astype("int64") + 1970 * MONTHS_PER_YEAR
+        floor_index = index - index % months
+        floor = (floor_index - 1970 * MONTHS_PER_YEAR).astype("datetime64[M]").astype("datetime64[us]")
+        if mode == "floor":
+            return self._new(floor)
+
+        ceil = (floor_index + months - 1970 * MONTHS_PER_YEAR).astype("datetime64[M]").astype("datetime64[us]")
+        ceil = np.where(floor == self.values, floor, ceil)
+        if mode == "ceil":
+            return self._new(ceil)
+
+        return self._new(np.where(self.values - floor >= ceil - self.values, ceil, floor))
+
+    def _new(self, values):
+        """Create an array with the same timezone."""
+        return DateTimeArray(values, timezone=self.timezone)
+
+    def _split(self):
+        """Split the values into days, time of day, and the microseconds of the second."""
+        days = self.values.astype("datetime64[D]")
+        time_of_day = self.values - days
+        microseconds = time_of_day % np.timedelta64(1, "s")
+        return days, time_of_day, microseconds
+
+    def _to_datetime(self, value):
+        """Convert a datetime64 to a datetime in the shared timezone."""
+        dt = value.astype(datetime)
+        if self.timezone is None:
+            return dt
+
+        if hasattr(self.timezone, "localize"):
+            return self.timezone.localize(dt)
+
+        return dt.replace(tzinfo=self.timezone)
+
+    def _to_datetime64(self, dt):
+        """Convert a datetime (or DateTime) to the wall clock of the shared timezone."""
+        if isinstance(dt, DateTime):
+            dt = dt.dt
+
+        if self.timezone is not None and getattr(dt, "tzinfo", None) is not None:
+            dt = dt.astimezone(self.timezone)
+
+        if isinstance(dt, datetime):
+            dt = dt.replace(tzinfo=None)
+
+        return np.datetime64(dt, "us")
+
+# Functions
+
+
+def add_months(values, months):
+    """Add months to wall clock times, clamping the day to the end of the month as ``relativedelta`` does.
+
+    :param values: The wall clock times.
+    :type values: numpy.ndarray
+
+    :param months: The number of months for all values, or for each.
+    :type months: int | numpy.ndarray
+
+    :rtype: numpy.ndarray
+
+    """
+    days = values.astype("datetime64[D]")
+    time_of_day = values - days
+    first_days = days.astype("datetime64[M]")
+    target = first_days + months
+    days_in_month = (target + 1).astype("datetime64[D]") - target.astype("datetime64[D]")
+    day = np.minimum(days - first_days.astype("datetime64[D]"), days_in_month - 1)
+    return target.astype("datetime64[D]") + day + time_of_day
+
+
+def diff_many(starts, ends, units=("years", "months", "days"), holidays=None):
+    """Get the calendar difference between many pairs of date/times at once. See :py:func:`diff`.
+
+    .. code-block:: python
+
+        tenure = diff_many(hire_dates, report_dates, units=("years", "months", "business_days"))
+        print(tenure["years"]) # array([2, 0, 11, ...])
+
+    :param starts: The starting date/times.
+    :type starts: list[datetime] | DateTimeArray
+
+    :param ends: The ending date/times. These are converted to the timezone of the starts.
+    :type ends: list[datetime] | DateTimeArray
+
+    :param units: The units of the result, as for :py:func:`diff`.
+    :type units: tuple[str]
+
+    :param holidays: Holidays or other time off, for business days.
+    :type holidays: list[date] | HolidayCalendar
+
+    :rtype: dict
+    :returns: A NumPy ``int64`` array for each unit.
+
+    :raise: ValueError
+    :raises: ``ValueError`` for an unknown unit, or when the number of starts and ends differ.
+
+    Months are counted with integer month arithmetic and business days with ``numpy.busday_count()``, so no Python
+    objects are created per pair.
+
+    """
+    for unit in units:
+        if unit not in DIFF_UNITS:
+            raise ValueError("Not a valid unit: %s" % unit)
+
+    starts = DateTimeArray(starts)
+    if isinstance(ends, DateTimeArray) and None not in (ends.timezone, starts.timezone):
+        ends = DateTimeArray(utc_to_local(local_to_utc(ends.values, ends.timezone), starts.timezone))
+
+    ends = DateTimeArray(ends, timezone=starts.timezone)
+    if len(starts) != len(ends):
+        raise ValueError("The number of starts and ends must be the same: %s != %s" % (len(starts), len(ends)))
+
+    start_values = starts.values
+    end_values = ends.values
+
+    result = dict()
+
+    shifted = start_values
+    if "months" in units or "years" in units:
+        step = 1 if "months" in units else MONTHS_PER_YEAR
+        months = (end_values.astype("datetime64[M]") - start_values.astype("datetime64[M]")).astype("int64")
+        months = np.sign(months) * (np.abs(months) // step * step)
+
+        # Step back once where the day of the month has not yet been reached.
+        shifted = add_months(start_values, months)
+        forward = end_values >= start_values
+        months = months - np.where(forward & (shifted > end_values), step, 0)
+        months = months + np.where(~forward & (shifted < end_values), step, 0)
+        shifted = add_months(start_values, months)
+
+        if "years" in units:
+            result['years'] = np.sign(months) * (np.abs(months) // MONTHS_PER_YEAR)
+            months = months - result['years'] * MONTHS_PER_YEAR
+
+        if "months" in units:
+            result['months'] = months
+
+    remainder = (end_values - shifted).astype("int64")
+    sign = np.where(remainder < 0, -1, 1)
+    remainder = np.abs(remainder)
+    for unit in DIFF_UNITS[2:-1]:
+        if unit in units:
+            quotient, remainder = np.divmod(remainder, UNIT_MICROSECONDS[unit[:-1]])
+            result[unit] = quotient * sign
+
+    if "business_days" in units:
+        # Going forward, business days after the start date up to and including the end date; busday_count() includes
+        # the first date and excludes the last, so both are moved a day later. Going backward, business days from the
+        # end date up to the start date, as for increment(); busday_count() counts the dates after the end up to and
+        # including the start, so both are moved a day earlier.
+        start_days = start_values.astype("datetime64[D]")
+        end_days = end_values.astype("datetime64[D]")
+        shift = np.where(end_days >= start_days, 1, -1).astype("timedelta64[D]")
+        result['business_days'] = np.busday_count(
+            start_days + shift,
+            end_days + shift,
+            holidays=to_holidays(holidays, days=np.concatenate((start_days, end_days)), margin=1)
+        ).astype("int64")
+
+    return dict((unit, result[unit]) for unit in DIFF_UNITS if unit in result)
+
+
+def from_arrow(values, timezone=None):
+    """Convert a PyArrow timestamp array to a ``datetime64[us]`` array of wall clock times.
+
+    :param values: The timestamps.
+    :type values: pyarrow.Array | pyarrow.ChunkedArray
+
+    :param timezone: The timezone to which the values are converted. Defaults to the timezone of the Arrow type.
+    :type timezone: tzinfo
+
+    :rtype: tuple(numpy.ndarray, tzinfo)
+
+    :raise: TypeError, ValueError
+    :raises: ``TypeError`` when the values are not timestamps, and ``ValueError`` when they contain nulls.
+
+    """
+    pyarrow = get_pyarrow()
+    if isinstance(values, pyarrow.ChunkedArray):
+        values = values.combine_chunks()
+
+    if not pyarrow.types.is_timestamp(values.type):
+        raise TypeError("Not a timestamp array: %s" % values.type)
+
+    if values.null_count:
+        raise ValueError("Null timestamps are not supported.")
+
+    data = values.to_numpy(zero_copy_only=True)
+    if values.type.tz is None:
+        return data, timezone
+
+    if timezone is None:
+        timezone = get_timezone(values.type.tz)
+
+    return utc_to_local(data.astype("datetime64[us]", copy=False), timezone), timezone
+
+
+def get_pyarrow():
+    """Get the PyArrow module, importing it on first use.
+
+    :rtype: module | None
+    :returns: The module, or ``None`` when it is not installed.
+
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        return None
+
+    return pyarrow
+
+
+def get_offsets(timezone):
+    """Get the UTC transition times and offsets of a timezone.
+
+    :param timezone: The timezone.
+    :type timezone: tzinfo
+
+    :rtype: tuple(numpy.ndarray, numpy.ndarray) | None
+    :returns: The transition times and the offset in effect from each, or ``None`` when the timezone does not publish
+              its transitions. A fixed offset has no transitions and a single offset.
+
+    """
+    transitions = getattr(timezone, "_utc_transition_times", None)
+    if transitions is not None:
+        offsets = [info[0] for info in timezone._transition_info]
+        return np.array(transitions, dtype="datetime64[us]"), np.array(offsets, dtype="timedelta64[us]")
+
+    offset = timezone.utcoffset(None)
+    if offset is None:
+        return None
+
+    return np.array(list(), dtype="datetime64[us]"), np.array([offset], dtype="timedelta64[us]")
+
+
+def local_to_utc(values, timezone):
+    """Convert wall clock times to UTC.
+
+    :param values: The wall clock times.
+    :type values: numpy.ndarray
+
+    :param timezone: The timezone of the wall clock.
+    :type timezone: tzinfo
+
+    :rtype: numpy.ndarray
+
+    .. note::
+        Ambiguous and non-existent times around a transition resolve to one of the possible offsets.
+
+    """
+    offsets = get_offsets(timezone)
+    if offsets is None:
+        # The timezone must be consulted one value at a time.
+        utc = list()
+        for value in values.astype(datetime):
+            utc.append(value.replace(tzinfo=timezone).astimezone(pytz.UTC).replace(tzinfo=None))
+
+        return np.array(utc, dtype="datetime64[us]")
+
+    guess = values - lookup_offsets(values, *offsets)
+    return values - lookup_offsets(guess, *offsets)
+
+
+def lookup_offsets(values, transitions, offsets):
+    """Get the offset in effect at each of the given UTC times.
+
+    :param values: The UTC times.
+    :type values: numpy.ndarray
+
+    :param transitions: The UTC transition times.
+    :type transitions: numpy.ndarray
+
+    :param offsets: The offset in effect from each transition.
+    :type offsets: numpy.ndarray
+
+    :rtype: numpy.ndarray
+
+    """
+    if len(transitions) == 0:
+        return np.full(len(values), offsets[0])
+
+    index = np.searchsorted(transitions, values, side="right") - 1
+    return offsets[np.clip(index, 0, len(offsets) - 1)]
+
+
+def to_datetime64(values, timezone=None):
+    """Convert date/times to a ``datetime64[us]`` array of wall clock times.
+
+    :param values: The date/times.
+    :type values: list[date | datetime | DateTime]
+
+    :param timezone: The timezone to which aware values are converted. If omitted, the timezone of the first aware value
+                     is used.
+    :type timezone: tzinfo
+
+    :rtype: tuple(numpy.ndarray, tzinfo)
+
+    """
+    naive = list()
+    for value in values:
+        if isinstance(value, DateTime):
+            value = value.dt
+
+        if isinstance(value, datetime):
+            if value.tzinfo is not None:
+                if timezone is None:
+                    timezone = value.tzinfo
+
+                value = value.astimezone(timezone).replace(tzinfo=None)
+        elif isinstance(value, date):
+            value = datetime(value.year, value.month, value.day)
+
+        naive.append(value)
+
+    return np.array(naive, dtype="datetime64[us]"), timezone
+
+
+def to_holidays(holidays, days=None, margin=0):
+    """Convert holidays to the ``datetime64[D]`` array expected by NumPy's business day functions.
+
+    :param holidays: Holidays or other time off.
+    :type holidays: list[date] | HolidayCalendar | HolidayRules
+
+    :param days: The days to be checked. Holidays are only generated from rules for the span of these days.
+    :type days: numpy.ndarray
+
+    :param margin: The number of days before and after the span for which holidays are also generated.
+    :type margin: int
+
+    :rtype: numpy.ndarray
+
+    """
+    if not holidays:
+        return np.array(list(), dtype="datetime64[D]")
+
+    if isinstance(holidays, HolidayRules):
+        if days is None or not len(days):
+            return np.array(list(), dtype="datetime64[D]")
+
+        start = (days.min() - margin).astype(date)
+        end = (days.max() + margin).astype(date)
+        return np.array(holidays.between(start, end), dtype="datetime64[D]")
+
+    if isinstance(holidays, HolidayCalendar):
+        ordinals = np.asarray(holidays.ordinals, dtype="int64")
+        return (ordinals - EPOCH_ORDINAL).astype("datetime64[D]")
+
+    return np.array(sorted(holidays), dtype="datetime64[D]")
+
+
+def to_timedelta64(value, unit):
+    """Convert an amount of the given unit to a ``timedelta64[us]``.
+
+    :param value: The amount. Fractional amounts are supported.
+    :type value: int | float
+
+    :param unit: The NumPy unit code.
+    :type unit: str
+
+    :rtype: numpy.timedelta64
+
+    """
+    if value == int(value):
+        return np.timedelta64(int(value), unit).astype("timedelta64[us]")
+
+    microseconds = np.timedelta64(1, unit).astype("timedelta64[us]").astype("int64")
+    return np.timedelta64(int(round(value * microseconds)), "us")
+
+
+def utc_to_local(values, timezone):
+    """Convert UTC times to wall clock times.
+
+    :param values: The UTC times.
+    :type values: numpy.ndarray
+
+    :param timezone: The timezone of the wall clock.
+    :type timezone: tzinfo
+
+    :rtype: numpy.ndarray
+
+    """
+    offsets = get_offsets(timezone)
+    if offsets is None:
+        # The timezone must be consulted one value at a time.
+        local = list()
+        for value in values.astype(datetime):
+            local.append(value.replace(tzinfo=pytz.UTC).astimezone(timezone).replace(tzinfo=None))
+
+        return np.array(local, dtype="datetime64[us]")
+
+    return values + lookup_offsets(values, *offsets)
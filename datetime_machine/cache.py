@@ -0,0 +1,163 @@
+"""
+The cache module provides the bounded, thread-safe cache used throughout the package; for example for parsed strings,
+timezones, and holiday calendars.
+
+Reads do not take a lock. A lookup is a single ``dict.get()``, which is atomic in CPython and remains thread-safe in
+free-threaded builds. Writes take a lock so that the size bound is kept, and evict the oldest entries first.
+
+.. code-block:: python
+
+    from datetime_machine.cache import Cache, get_stats
+
+    cache = Cache("example", max_size=100)
+    value = cache.get_or_set(key, lambda: expensive(key))
+
+    print(get_stats()) # {'example': {'evictions': 0, 'hits': 0, 'max_size': 100, 'misses': 1, 'size': 1}, ...}
+
+"""
+# Imports
+
+import threading
+
+# Exports
+
+__all__ = (
+    "Cache",
+    "get_stats",
+)
+
+# Constants
+
+# Caches by name, so that statistics may be collected.
+CACHES = dict()
+
+MISSING = object()
+
+# Classes
+
+
+class Cache(object):
+    """A bounded cache with lock-free reads and first-in, first-out eviction."""
+
+    def __init__(self, name, max_size=1024):
+        """Initialize a cache.
+
+        :param name: The name of the cache, under which its statistics are reported.
+        :type name: str
+
+        :param max_size: The maximum number of entries.
+        :type max_size: int
+
+        """
+        self.max_size = max_size
+        self.name = name
+
+        self._data = dict()
+        self._lock = threading.Lock()
+
+        # Statistics are updated without a lock, so they are approximate under concurrent use.
+        self.evictions = 0
+        self.hits = 0
+        self.misses = 0
+
+        CACHES[name] = self
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.evictions = 0
+            self.hits = 0
+            self.misses = 0
+
+    def get(self, key, default=None):
+        """Get a value from the cache.
+
+        :param key: The key.
+
+        :param default: The value returned when the key is not cached.
+
+        """
+        value = self._data.get(key, MISSING)
+        if value is MISSING:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        return value
+
+    def get_or_set(self, key, factory):
+        """Get a value from the cache, creating and caching it if necessary.
+
+        :param key: The key.
+
+        :param factory: A callable that creates the value.
+        :type factory: callable
+
+        .. note::
+            The factory is called without holding the lock, so two threads that miss at the same time may both call it.
+            The first value to be stored wins and is returned to both.
+
+        """
+        value = self._data.get(key, MISSING)
+        if value is not MISSING:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        return self.set(key, factory())
+
+    def set(self, key, value):
+        """Add a value to the cache.
+
+        :param key: The key.
+
+        :param value: The value.
+
+        :returns: The cached value, which is an existing value when another thread stored one first.
+
+        """
+        with self._lock:
+            existing = self._data.get(key, MISSING)
+            if existing is not MISSING:
+                return existing
+
+            while len(self._data) >= self.max_size > 0:
+                del self._data[next(iter(self._data))]
+                self.evictions += 1
+
+            if self.max_size > 0:
+                self._data[key] = value
+
+        return value
+
+    def stats(self):
+        """Get the statistics of the cache.
+
+        :rtype: dict
+
+        """
+        return {
+            'evictions': self.evictions,
+            'hits': self.hits,
+            'max_size': self.max_size,
+            'misses': self.misses,
+            'size': len(self._data),
+        }
+
+# Functions
+
+
+def get_stats():
+    """Get the statistics of every cache by name.
+
+    :rtype: dict
+
+    """
+    return dict((name, cache.stats()) for name, cache in sorted(CACHES.items()))
@@ -0,0 +1,625 @@
+"""
+The command line interface transforms timestamps as a stream, reading one timestamp per line (or a column of CSV) from
+files or standard input and writing each result as it goes.
+
+.. code-block:: bash
+
+    # Five business days later, skipping holidays.
+    cat events.log | python -m datetime_machine --increment business_days=5 --holidays us.holidays
+
+    # The month of the second column of a CSV export, in New York time.
+    python -m datetime_machine --column 2 --header --tz America/New_York --bucket month export.csv
+
+Operations are applied in this order: ``--tz``, ``--increment``, ``--start-of`` or ``--end-of``, then ``--bucket``
+or ``--output-format``. Naive input is treated as UTC when ``--tz`` is given.
+
+"""
+# Imports
+
+from argparse import ArgumentParser
+import csv
+from datetime import date, datetime
+from dateutil import parser as datetime_parser
+import pytz
+import sys
+from .constants import MONDAY, SUNDAY
+from .holidays import MAGIC, HolidayCalendar
+from .library import Month, Quarter, Week, Year
+from .utils import get_timezone, increment
+from .version import VERSION
+
+# Exports
+
+__all__ = (
+    "main",
+)
+
+# Constants
+
+BUFFER_SIZE = 1024 * 1024
+
+EXIT_ERROR = 1
+
+EXIT_OK = 0
+
+EXIT_USAGE = 2
+
+PERIODS = ("day", "hour", "month", "quarter", "week", "year")
+
+# Classes
+
+
+class TransformError(Exception):
+    """Raised when a value cannot be transformed."""
+    pass
+
+
+class Transform(object):
+    """The operations to be applied to each timestamp."""
+
+    def __init__(self, bucket=None, end_of=None, holidays=None, increments=None, input_format=None,
+                 output_format=None, start_day=MONDAY, start_of=None, timezone=None):
+        """Initialize the transformation. Each parameter corresponds to the command line option of the same name.
+
+        :param increments: Keyword arguments for :py:func:`increment`, such as ``business_days``.
+        :type increments: dict
+
+        :param timezone: The name of the timezone to which timestamps are converted.
+        :type timezone: str
+
+        """
+        self.bucket = bucket
+        self.end_of = end_of
+        self.holidays = holidays
+        self.increments = increments or dict()
+        self.input_format = input_format
+        self.output_format = output_format
+        self.start_day = start_day
+        self.start_of = start_of
+        self.timezone = get_timezone(timezone) if timezone else None
+
+    def apply(self, value, number=None, on_error="fail"):
+        """Transform a single value.
+
+        :param value: The timestamp.
+        :type value: str
+
+        :param number: The line number, for error messages.
+        :type number: int
+
+        :param on_error: ``fail``, ``keep``, or ``skip``.
+        :type on_error: str
+
+        :rtype: str | None
+        :returns: The result, or ``None`` when the value is skipped.
+
+        :raise: TransformError
+        :raises: ``TransformError`` when the value cannot be parsed or transformed (for example, when incrementing it
+                 would pass the last year), and ``on_error`` is ``fail``.
+
+        """
+        try:
+            dt = self.parse(value.strip())
+        except (OverflowError, ValueError):
+            return self._fail(value, "Line %s: could not parse %r" % (number, value), on_error)
+
+        try:
+            return self.transform(dt)
+        except (OverflowError, ValueError) as e:
+            return self._fail(value, "Line %s: could not transform %r: %s" % (number, value, e), on_error)
+
+    def localize(self, dt):
+        """Get the offset of the timezone for the wall clock of a date/time, which may have crossed DST.
+
+        :param dt: The date/time.
+        :type dt: datetime
+
+        :rtype: datetime
+
+        """
+        if self.timezone is None or dt.tzinfo is None:
+            return dt
+
+        return self.timezone.localize(dt.replace(tzinfo=None))
+
+    def parse(self, value):
+        """Parse a timestamp.
+
+        :param value: The timestamp.
+        :type value: str
+
+        :rtype: datetime
+
+        """
+        if self.input_format:
+            return datetime.strptime(value, self.input_format)
+
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return datetime_parser.parse(value)
+
+    def transform(self, dt):
+        """Transform a parsed timestamp.
+
+        :param dt: The timestamp.
+        :type dt: datetime
+
+        :rtype: str
+
+        """
+        if self.timezone is not None:
+            if dt.tzinfo is None:
+                dt = pytz.UTC.localize(dt)
+
+            dt = dt.astimezone(self.timezone)
+
+        if self.increments:
+            dt = self.localize(increment(dt, holidays=self.holidays, **self.increments))
+
+        if self.start_of:
+            dt = self.localize(start_of(dt, self.start_of, start_day=self.start_day))
+        elif self.end_of:
+            dt = self.localize(end_of(dt, self.end_of, start_day=self.start_day))
+
+        if self.bucket:
+            return bucket(dt, self.bucket, start_day=self.start_day)
+
+        if self.output_format:
+            return dt.strftime(self.output_format)
+
+        return dt.isoformat()
+
+    def _fail(self, value, message, on_error):
+        """Keep, skip, or fail on a value that could not be transformed."""
+        if on_error == "keep":
+            return value
+        elif on_error == "skip":
+            return None
+
+        raise TransformError(message)
+
+# Functions
+
+
+def bucket(dt, period, start_day=MONDAY):
+    """Get the label of the period to which a date/time belongs.
+
+    :param dt: The date/time.
+    :type dt: datetime
+
+    :param period: The period; ``day``, ``hour``, ``month``, ``quarter``, ``week``, or ``year``.
+    :type period: str
+
+    :param start_day: The ISO weekday that starts a week.
+    :type start_day: int
+
+    :rtype: str
+
+    """
+    if period == "day":
+        return dt.strftime("%Y-%m-%d")
+    elif period == "hour":
+        return dt.strftime("%Y-%m-%dT%H")
+    elif period == "month":
+        return dt.strftime("%Y-%m")
+    elif period == "quarter":
+        return "%04d-Q%d" % (dt.year, (dt.month - 1) // 3 + 1)
+    elif period == "week":
+        return Week(dt, start_day=start_day).start_dt.strftime("%Y-%m-%d")
+    else:
+        return "%04d" % dt.year
+
+
+def end_of(dt, period, start_day=MONDAY):
+    """Get the end of the period to which a date/time belongs.
+
+    :param dt: The date/time.
+    :type dt: datetime
+
+    :param period: The period; ``day``, ``hour``, ``month``, ``quarter``, ``week``, or ``year``.
+    :type period: str
+
+    :param start_day: The ISO weekday that starts a week.
+    :type start_day: int
+
+    :rtype: datetime
+
+    """
+    if period == "day":
+        return dt.replace(hour=23, minute=59, second=59, microsecond=0)
+    elif period == "hour":
+        return dt.replace(minute=59, second=59, microsecond=0)
+
+    return get_period(dt, period, start_day=start_day).end_dt
+
+
+def get_parser():
+    """Get the command line argument parser.
+
+    :rtype: ArgumentParser
+
+    """
+    parser = ArgumentParser(
+        prog="datetime_machine",
+        description="Transform timestamps read line by line, or from a CSV column, and write the results."
+    )
+
+    parser.add_argument(
+        "paths",
+        default=["-"],
+        help="Files to read. Use - (the default) for standard input.",
+        metavar="PATH",
+        nargs="*"
+    )
+
+    parser.add_argument(
+        "-b",
+        "--bucket",
+        choices=PERIODS,
+        dest="bucket",
+        help="Output the label of the period to which each timestamp belongs."
+    )
+
+    parser.add_argument(
+        "-c",
+        "--column",
+        dest="column",
+        help="Read and replace the timestamp in this CSV column; a 1-based number, or a name with --header."
+    )
+
+    parser.add_argument(
+        "--delimiter",
+        default=",",
+        dest="delimiter",
+        help="The CSV delimiter."
+    )
+
+    parser.add_argument(
+        "-e",
+        "--end-of",
+        choices=PERIODS,
+        dest="end_of",
+        help="Move each timestamp to the end of its period."
+    )
+
+    parser.add_argument(
+        "--header",
+        action="store_true",
+        dest="header",
+        help="The CSV input has a header row, which is written unchanged."
+    )
+
+    parser.add_argument(
+        "-H",
+        "--holidays",
+        dest="holidays",
+        help="A holiday calendar file, or a text file with one YYYY-MM-DD date per line."
+    )
+
+    parser.add_argument(
+        "-i",
+        "--increment",
+        action="append",
+        default=list(),
+        dest="increments",
+        help="Increment each timestamp; for example business_days=5 or months=-1. May be given more than once.",
+        metavar="KEY=VALUE"
+    )
+
+    parser.add_argument(
+        "--input-format",
+        dest="input_format",
+        help="The strptime format of the input. By default ISO 8601 is expected, then any format is attempted."
+    )
+
+    parser.add_argument(
+        "--on-error",
+        choices=("fail", "keep", "skip"),
+        default="fail",
+        dest="on_error",
+        help="What to do with a value that cannot be parsed: stop (the default), write it unchanged, or drop it."
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output-format",
+        dest="output_format",
+        help="The strftime format of the output. Defaults to ISO 8601."
+    )
+
+    parser.add_argument(
+        "-s",
+        "--start-of",
+        choices=PERIODS,
+        dest="start_of",
+        help="Move each timestamp to the start of its period."
+    )
+
+    parser.add_argument(
+        "--sunday",
+        action="store_true",
+        dest="sunday",
+        help="Weeks start on Sunday rather than Monday."
+    )
+
+    parser.add_argument(
+        "-t",
+        "--tz",
+        dest="timezone",
+        help="Convert each timestamp to this timezone; for example America/New_York."
+    )
+
+    parser.add_argument(
+        "-v",
+        action="version",
+        help="Show version number and exit.",
+        version=VERSION
+    )
+
+    return parser
+
+
+def get_period(dt, period, start_day=MONDAY):
+    """Get the period instance to which a date/time belongs.
+
+    :param dt: The date/time.
+    :type dt: datetime
+
+    :param period: The period; ``month``, ``quarter``, ``week``, or ``year``.
+    :type period: str
+
+    :param start_day: The ISO weekday that starts a week.
+    :type start_day: int
+
+    :rtype: Month | Quarter | Week | Year
+
+    """
+    if period == "month":
+        return Month(dt)
+    elif period == "quarter":
+        return Quarter(dt)
+    elif period == "week":
+        return Week(dt, start_day=start_day)
+    else:
+        return Year(dt)
+
+
+def load_holidays(path):
+    """Load holidays from a holiday calendar file or a text file of dates.
+
+    :param path: The path to the file.
+    :type path: str
+
+    :rtype: HolidayCalendar | set[date]
+
+    :raise: OSError, ValueError
+    :raises: ``OSError`` when the file cannot be read, and ``ValueError`` for a line that is not a date.
+
+    """
+    with open(path, "rb") as f:
+        magic = f.read(len(MAGIC))
+
+    if magic == MAGIC:
+        return HolidayCalendar.open(path)
+
+    holidays = set()
+    with open(path, "r") as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if line and not line.startswith("#"):
+                try:
+                    holidays.add(date.fromisoformat(line[:10]))
+                except ValueError:
+                    raise ValueError("%s, line %s: not a date: %r" % (path, number, line))
+
+    return holidays
+
+
+def main(args=None, stdin=None, stdout=None, stderr=None):
+    """Run the command line interface.
+
+    :param args: The command line arguments. Defaults to ``sys.argv``.
+    :type args: list[str]
+
+    :param stdin: The stream read for the ``-`` path. Defaults to standard input.
+    :param stdout: The stream to which results are written. Defaults to standard output.
+    :param stderr: The stream to which errors are written. Defaults to standard error.
+
+    :rtype: int
+    :returns: The exit code.
+
+    """
+    if stdin is None:
+        stdin = open(sys.stdin.fileno(), "r", buffering=BUFFER_SIZE, closefd=False, newline="")
+
+    if stdout is None:
+        stdout = open(sys.stdout.fileno(), "w", buffering=BUFFER_SIZE, closefd=False, newline="")
+
+    stderr = stderr or sys.stderr
+
+    parser = get_parser()
+    options = parser.parse_args(args)
+
+    if options.start_of and options.end_of:
+        stderr.write("--start-of and --end-of may not be used together.\n")
+        return EXIT_USAGE
+
+    if options.timezone and options.timezone not in pytz.all_timezones_set:
+        stderr.write("Unknown timezone: %s\n" % options.timezone)
+        return EXIT_USAGE
+
+    try:
+        increments = parse_increments(options.increments)
+    except ValueError as e:
+        stderr.write("%s\n" % e)
+        return EXIT_USAGE
+
+    holidays = None
+    if options.holidays:
+        try:
+            holidays = load_holidays(options.holidays)
+        except (OSError, ValueError) as e:
+            stderr.write("Could not load holidays from %s: %s\n" % (options.holidays, e))
+            return EXIT_USAGE
+
+    transform = Transform(
+        bucket=options.bucket,
+        end_of=options.end_of,
+        holidays=holidays,
+        increments=increments,
+        input_format=options.input_format,
+        output_format=options.output_format,
+        start_day=SUNDAY if options.sunday else MONDAY,
+        start_of=options.start_of,
+        timezone=options.timezone
+    )
+
+    try:
+        for path in options.paths:
+            if path == "-":
+                stream = stdin
+            else:
+                stream = open(path, "r", buffering=BUFFER_SIZE, newline="")
+
+            try:
+                if options.column is not None:
+                    process_csv(stream, stdout, transform, options.column, header=options.header,
+                                delimiter=options.delimiter, on_error=options.on_error)
+                else:
+                    process_lines(stream, stdout, transform, on_error=options.on_error)
+            finally:
+                if stream is not stdin:
+                    stream.close()
+
+        stdout.flush()
+    except BrokenPipeError:
+        # The reader has gone away, for example when piped to head.
+        return EXIT_OK
+    except TransformError as e:
+        stdout.flush()
+        stderr.write("%s\n" % e)
+        return EXIT_ERROR
+
+    return EXIT_OK
+
+
+def parse_increments(values):
+    """Parse ``KEY=VALUE`` increments.
+
+    :param values: The increments.
+    :type values: list[str]
+
+    :rtype: dict
+    :raise: ValueError
+
+    """
+    keys = ("business_days", "days", "hours", "microseconds", "minutes", "months", "seconds", "weeks", "years")
+
+    increments = dict()
+    for value in values:
+        key, _, amount = value.partition("=")
+        key = key.strip()
+        if key not in keys:
+            raise ValueError("Invalid increment (%s), must be one of: %s" % (key, ", ".join(keys)))
+
+        try:
+            increments[key] = increments.get(key, 0) + int(amount)
+        except ValueError:
+            raise ValueError("Invalid increment amount for %s: %s" % (key, amount))
+
+    return increments
+
+
+def process_csv(stream, writer, transform, column, header=False, delimiter=",", on_error="fail"):
+    """Transform a column of CSV.
+
+    :param stream: The input.
+    :param writer: The output.
+
+    :param transform: The transformation.
+    :type transform: Transform
+
+    :param column: The 1-based column number, or the column name when there is a header.
+    :type column: str
+
+    """
+    reader = csv.reader(stream, delimiter=delimiter)
+    output = csv.writer(writer, delimiter=delimiter, lineterminator="\n")
+
+    if column.isdigit():
+        index = int(column) - 1
+    else:
+        index = None
+
+    if header:
+        row = next(reader, None)
+        if row is None:
+            return
+
+        if index is None:
+            try:
+                index = row.index(column)
+            except ValueError:
+                raise TransformError("Column not found: %s" % column)
+
+        output.writerow(row)
+    elif index is None:
+        raise TransformError("A column name requires --header: %s" % column)
+
+    for number, row in enumerate(reader, start=2 if header else 1):
+        if index >= len(row):
+            raise TransformError("Line %s has no column %s." % (number, index + 1))
+
+        value = transform.apply(row[index], number=number, on_error=on_error)
+        if value is None:
+            continue
+
+        row[index] = value
+        output.writerow(row)
+
+
+def process_lines(stream, writer, transform, on_error="fail"):
+    """Transform one timestamp per line. Blank lines are written unchanged.
+
+    :param stream: The input.
+    :param writer: The output.
+
+    :param transform: The transformation.
+    :type transform: Transform
+
+    """
+    write = writer.write
+    for number, line in enumerate(stream, start=1):
+        line = line.rstrip("\r\n")
+        if not line.strip():
+            write("\n")
+            continue
+
+        value = transform.apply(line, number=number, on_error=on_error)
+        if value is not None:
+            write(value)
+            write("\n")
+
+
+def start_of(dt, period, start_day=MONDAY):
+    """Get the start of the period to which a date/time belongs.
+
+    :param dt: The date/time.
+    :type dt: datetime
+
+    :param period: The period; ``day``, ``hour``, ``month``, ``quarter``, ``week``, or ``year``.
+    :type period: str
+
+    :param start_day: The ISO weekday that starts a week.
+    :type start_day: int
+
+    :rtype: datetime
+
+    """
+    if period == "day":
+        return dt.replace(hour=0, minute=0, second=0, microsecond=0)
+    elif period == "hour":
+        return dt.replace(minute=0, second=0, microsecond=0)
+
+    return get_period(dt, period, start_day=start_day).start_dt
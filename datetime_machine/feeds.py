@@ -0,0 +1,254 @@
+"""
+The feeds module validates streams of timestamps, such as the rows of a daily or hourly feed, for missing periods and
+duplicates.
+
+.. code-block:: python
+
+    from datetime_machine import FeedChecker
+
+    checker = FeedChecker("business_day", holidays=holidays, disorder=100)
+    for kind, value in checker.check(timestamps, start_dt=start_dt, end_dt=end_dt):
+        if kind == "gap":
+            print("missing", value.start, value.end)
+        else:
+            print("duplicate", value)
+
+Each timestamp falls within a period; an ``hour``, ``day``, ``business_day``, ``week``, or ``month``. A period without
+a timestamp is missing, and consecutive missing periods are reported as a single :py:class:`DateTimeRange` from the
+start of the first to the end of the last. A timestamp within a period that already has one is a duplicate.
+
+Timestamps are consumed one at a time and only the previous period is kept, so a feed of any length is checked in
+linear time and constant memory. Timestamps that are out of order by at most ``disorder`` places are sorted with a heap
+of that size.
+
+.. note::
+    Periods are of the wall clock, as for :py:func:`truncate`. Timestamps on days off do not fill a business day and are
+    not reported.
+
+"""
+# Imports
+
+from datetime import timedelta
+import heapq
+from .constants import MONDAY
+from .library import DateTimeRange, to_datetime
+from .utils import add_months, increment, is_business_day, truncate
+
+# Exports
+
+__all__ = (
+    "FeedChecker",
+)
+
+# Constants
+
+DUPLICATE = "duplicate"
+
+GAP = "gap"
+
+ONE_SECOND = timedelta(seconds=1)
+
+PERIODS = ("hour", "day", "business_day", "week", "month")
+
+# Classes
+
+
+class FeedChecker(object):
+    """Finds missing periods and duplicates in a stream of timestamps."""
+
+    def __init__(self, period="day", holidays=None, disorder=0, start_day=MONDAY):
+        """Initialize the checker.
+
+        :param period: ``hour``, ``day``, ``business_day``, ``week``, or ``month``.
+        :type period: str
+
+        :param holidays: Holidays or other time off, for business days.
+        :type holidays: list[date] | HolidayCalendar | HolidayRules
+
+        :param disorder: The number of places by which a timestamp may be out of order.
+        :type disorder: int
+
+        :param start_day: The ISO weekday that starts a week.
+        :type start_day: int
+
+        :raise: ValueError
+        :raises: ``ValueError`` for an unknown period or a negative disorder.
+
+        """
+        if period not in PERIODS:
+            raise ValueError("Invalid period (%s), must be one of: %s" % (period, ", ".join(PERIODS)))
+
+        if disorder < 0:
+            raise ValueError("The disorder may not be negative: %s" % disorder)
+
+        self.disorder = disorder
+        self.holidays = holidays
+        self.period = period
+        self.start_day = start_day
+
+    def check(self, dts, start_dt=None, end_dt=None):
+        """Find the missing periods and duplicates. Results are produced as the timestamps are consumed, so the
+        timestamps may be a stream.
+
+        :param dts: The timestamps, in order or nearly so.
+        :type dts: collections.Iterable[datetime | DateTime]
+
+        :param start_dt: When given, the periods from this date/time are expected, and timestamps before it are ignored.
+        :type start_dt: datetime
+
+        :param end_dt: When given, the periods up to this date/time are expected, and timestamps after it are ignored.
+        :type end_dt: datetime
+
+        :rtype: collections.Iterable[tuple]
+        :returns: ``gap`` and a ``DateTimeRange`` of the missing periods, or ``duplicate`` and the timestamp.
+
+        :raise: ValueError
+        :raises: ``ValueError`` when a timestamp is further out of order than the disorder allows.
+
+        """
+        # Periods are compared on the wall clock, since their starts may have different offsets across a change of
+        # daylight saving time. The timezone is attached again to the gaps.
+        expected = None
+        if start_dt is not None:
+            expected = self.get_start_dt(start_dt.replace(tzinfo=None))
+            if expected is None:
+                expected = self.get_next_start_dt(start_dt.replace(tzinfo=None))
+
+        last = None
+        for dt in self._sort(dts):
+            if start_dt is not None and dt < start_dt:
+                continue
+
+            if end_dt is not None and dt > end_dt:
+                continue
+
+            current = self.get_start_dt(dt.replace(tzinfo=None))
+            if current is None:
+                continue
+
+            if current == last:
+                yield DUPLICATE, dt
+                continue
+
+            if expected is not None and expected < current:
+                yield GAP, self._get_gap(expected, self.get_previous_start_dt(current), dt.tzinfo)
+
+            expected = self.get_next_start_dt(current)
+            last = current
+
+        if end_dt is not None and expected is not None:
+            final = self.get_start_dt(end_dt.replace(tzinfo=None))
+            if final is None:
+                final = self.get_previous_start_dt(end_dt.replace(tzinfo=None))
+
+            if expected <= final:
+                yield GAP, self._get_gap(expected, final, end_dt.tzinfo)
+
+    def get_end_dt(self, start_dt):
+        """Get the end of a period.
+
+        :param start_dt: The start of the period.
+        :type start_dt: datetime
+
+        :rtype: datetime
+
+        """
+        if self.period == "business_day":
+            return start_dt + timedelta(days=1) - ONE_SECOND
+
+        return self.get_next_start_dt(start_dt) - ONE_SECOND
+
+    def get_next_start_dt(self, dt):
+        """Get the start of the first period after the one in which a date/time falls.
+
+        :param dt: The date/time; usually the start of a period.
+        :type dt: datetime
+
+        :rtype: datetime
+
+        """
+        if self.period == "business_day":
+            return increment(truncate(dt, "day"), business_days=1, holidays=self.holidays)
+        elif self.period == "month":
+            return add_months(truncate(dt, "month"), 1)
+
+        return truncate(dt, self.period, start_day=self.start_day) + self._get_size()
+
+    def get_previous_start_dt(self, dt):
+        """Get the start of the last period before the one in which a date/time falls.
+
+        :param dt: The date/time; usually the start of a period.
+        :type dt: datetime
+
+        :rtype: datetime
+
+        """
+        if self.period == "business_day":
+            return increment(truncate(dt, "day"), business_days=-1, holidays=self.holidays)
+        elif self.period == "month":
+            return add_months(truncate(dt, "month"), -1)
+
+        return truncate(dt, self.period, start_day=self.start_day) - self._get_size()
+
+    def get_start_dt(self, dt):
+        """Get the start of the period in which a date/time falls.
+
+        :param dt: The date/time.
+        :type dt: datetime
+
+        :rtype: datetime | None
+        :returns: The start of the period, or ``None`` for a day off when the period is ``business_day``.
+
+        """
+        if self.period == "business_day":
+            if not is_business_day(dt, self.holidays):
+                return None
+
+            return truncate(dt, "day")
+
+        return truncate(dt, self.period, start_day=self.start_day)
+
+    def _get_gap(self, start_dt, last_dt, tzinfo):
+        """Get the range from the start of the first missing period to the end of the last, on the wall clock of the
+        given timezone.
+        """
+        end_dt = self.get_end_dt(last_dt)
+        if hasattr(tzinfo, "localize"):
+            return DateTimeRange(tzinfo.localize(start_dt), tzinfo.localize(end_dt))
+
+        return DateTimeRange(start_dt.replace(tzinfo=tzinfo), end_dt.replace(tzinfo=tzinfo))
+
+    def _get_size(self):
+        """Get the length of an hour, day, or week."""
+        if self.period == "hour":
+            return timedelta(hours=1)
+        elif self.period == "day":
+            return timedelta(days=1)
+
+        return timedelta(weeks=1)
+
+    def _sort(self, dts):
+        """Sort timestamps that are out of order by at most the disorder."""
+        heap = list()
+        last = None
+        for value in dts:
+            dt = to_datetime(value, strict=True)
+            if last is not None and dt < last:
+                raise ValueError("Timestamps are out of order by more than %s: %s is before %s" % (
+                    self.disorder,
+                    dt,
+                    last
+                ))
+
+            if not self.disorder:
+                last = dt
+                yield dt
+                continue
+
+            heapq.heappush(heap, dt)
+            if len(heap) > self.disorder:
+                last = heapq.heappop(heap)
+                yield last
+
+        while heap:
+            yield heapq.heappop(heap)
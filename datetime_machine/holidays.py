@@ -0,0 +1,592 @@
+"""
+The holidays module provides calendars of holidays (or other time off) that may be given as the ``holidays`` argument of
+:py:func:`increment`, :py:func:`is_business_day`, and :py:func:`is_holiday`.
+
+Holiday Calendar Files
+----------------------
+
+A holiday calendar may be written to a compact binary file and opened with ``mmap``, so that any number of processes
+share the same pages of memory rather than each holding its own list of dates.
+
+.. code-block:: python
+
+    from datetime_machine import HolidayCalendar, increment
+
+    HolidayCalendar.write("us.holidays", holidays)
+
+    calendar = HolidayCalendar.open("us.holidays")
+    due = increment(dt, business_days=5, holidays=calendar)
+
+The file consists of a 12 byte header followed by the proleptic Gregorian ordinals of the holidays as sorted, unique,
+little-endian 32 bit integers:
+
+- 4 bytes: the magic number ``DTMH``.
+- 2 bytes: the format version (unsigned, little-endian).
+- 2 bytes: reserved.
+- 4 bytes: the number of holidays (unsigned, little-endian).
+
+Holiday Rules
+-------------
+
+Rather than listing dates by hand, holidays may be defined by rules. The holidays of a year are generated the first time
+a date in that year is checked, and are then cached, so rules may be used for any number of years.
+
+.. code-block:: python
+
+    from datetime_machine import MONDAY, THURSDAY, HolidayRule, HolidayRules, is_business_day
+
+    rules = HolidayRules([
+        HolidayRule.fixed("New Year's Day", 1, 1, observed="nearest"),
+        HolidayRule.nth_weekday("Memorial Day", 5, MONDAY, -1),
+        HolidayRule.nth_weekday("Thanksgiving Day", 11, THURSDAY, 4),
+        HolidayRule.easter("Good Friday", days=-2),
+    ])
+
+    is_business_day(dt, holidays=rules)
+
+"""
+# Imports
+
+from array import array
+from bisect import bisect_left
+from datetime import date, timedelta
+from dateutil.easter import easter
+import mmap
+import os
+import struct
+import sys
+from .cache import Cache
+from .constants import SATURDAY, SUNDAY
+
+# Exports
+
+__all__ = (
+    "HolidayCalendar",
+    "HolidayRule",
+    "HolidayRules",
+)
+
+# Constants
+
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct("<4sHHI")
+
+# Calendars shared by load(), by path, modification time, and size.
+LOAD_CACHE = Cache("holiday_calendars", max_size=64)
+
+MAGIC = b"DTMH"
+
+# Ways of moving a holiday that falls on a weekend to a business day.
+OBSERVED = ("nearest", "next")
+
+# The holidays of each year by rules and year.
+YEAR_CACHE = Cache("holiday_years", max_size=4096)
+
+# Classes
+
+
+class HolidayCalendar(object):
+    """A sorted, read-only collection of holidays.
+
+    Membership is tested with a binary search over the ordinals, and dates are only created when iterating.
+
+    """
+
+    def __init__(self, data, source=None):
+        """Initialize a calendar from the contents of a holiday calendar file.
+
+        :param data: The file contents. This may be ``bytes`` or any object supporting the buffer protocol, such as an
+                     ``mmap``.
+        :type data: bytes | mmap.mmap
+
+        :param source: The memory map from which the data was obtained, if any, so it may be closed.
+        :type source: mmap.mmap
+
+        :raise: ValueError
+        :raises: ``ValueError`` when the data is not a holiday calendar.
+
+        .. tip::
+            Use the ``from_dates()`` or ``open()`` class methods rather than calling this directly.
+
+        """
+        self._mmap = source
+        self._view = memoryview(data)
+
+        try:
+            validate(self._view)
+        except ValueError:
+            self._view.release()
+            raise
+
+        body = self._view[HEADER.size:]
+        if sys.byteorder == "little":
+            # Zero-copy; the ordinals are read directly from the buffer.
+            self._ordinals = body.cast("i")
+        else:
+            self._ordinals = array("i")
+            self._ordinals.frombytes(body.tobytes())
+            self._ordinals.byteswap()
+
+    def __contains__(self, value):
+        ordinal = value.toordinal()
+        index = bisect_left(self._ordinals, ordinal)
+        return index < len(self._ordinals) and self._ordinals[index] == ordinal
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __iter__(self):
+        for ordinal in self._ordinals:
+            yield date.fromordinal(ordinal)
+
+    def __len__(self):
+        return len(self._ordinals)
+
+    @property
+    def ordinals(self):
+        """The sorted ordinals of the holidays. For a memory mapped file on a little-endian system, this is a view of
+        the file rather than a copy.
+
+        :rtype: memoryview | array
+
+        """
+        return self._ordinals
+
+    def close(self):
+        """Release the underlying buffer and close the memory map, if any."""
+        if isinstance(self._ordinals, memoryview):
+            self._ordinals.release()
+
+        self._view.release()
+
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    @classmethod
+    def from_dates(cls, dates):
+        """Create an in-memory calendar.
+
+        :param dates: The holidays.
+        :type dates: list[date]
+
+        :rtype: HolidayCalendar
+
+        """
+        return cls(to_bytes(dates))
+
+    @classmethod
+    def load(cls, path):
+        """Get a shared calendar for a holiday calendar file. The file is opened once, and opened again only if it
+        changes.
+
+        :param path: The path to the file.
+        :type path: str
+
+        :rtype: HolidayCalendar
+
+        .. warning::
+            Calendars returned by ``load()`` are shared, so they must not be closed. Use ``open()`` for a calendar with
+            its own lifetime.
+
+        """
+        path = os.path.realpath(path)
+        status = os.stat(path)
+        key = (path, status.st_mtime_ns, status.st_size)
+
+        calendar = LOAD_CACHE.get(key)
+        if calendar is not None:
+            return calendar
+
+        # Another thread may open the same file at the same time, in which case its calendar is used and this one is
+        # closed.
+        calendar = cls.open(path)
+        cached = LOAD_CACHE.set(key, calendar)
+        if cached is not calendar:
+            calendar.close()
+
+        return cached
+
+    @classmethod
+    def open(cls, path):
+        """Open a holiday calendar file using a read-only memory map.
+
+        :param path: The path to the file.
+        :type path: str
+
+        :rtype: HolidayCalendar
+
+        """
+        with open(path, "rb") as f:
+            source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            return cls(source, source=source)
+        except ValueError:
+            source.close()
+            raise
+
+    @staticmethod
+    def write(path, dates):
+        """Write a holiday calendar file.
+
+        :param path: The path to the file.
+        :type path: str
+
+        :param dates: The holidays.
+        :type dates: list[date]
+
+        .. note::
+            The file is written to a temporary path and then moved into place, so processes that already have the file
+            open are unaffected.
+
+        """
+        temp_path = "%s.%s.tmp" % (path, os.getpid())
+        with open(temp_path, "wb") as f:
+            f.write(to_bytes(dates))
+
+        os.replace(temp_path, path)
+
+
+class HolidayRule(object):
+    """A rule that gives the date of a holiday in any year.
+
+    .. tip::
+        Use the ``easter()``, ``fixed()``, and ``nth_weekday()`` class methods rather than calling this directly.
+
+    """
+
+    def __init__(self, name, kind, month=None, day=None, weekday=None, n=None, days=0, observed=None,
+                 start_year=None, end_year=None):
+        """Initialize a rule.
+
+        :param name: The name of the holiday.
+        :type name: str
+
+        :param kind: ``easter``, ``fixed``, or ``nth_weekday``.
+        :type kind: str
+
+        :param observed: When the holiday falls on a weekend, ``nearest`` moves a Saturday to the Friday before and a
+                         Sunday to the Monday after, and ``next`` moves either to the Monday after. By default the
+                         holiday is not moved.
+        :type observed: str
+
+        :param start_year: The first year of the holiday, if any.
+        :type start_year: int
+
+        :param end_year: The last year of the holiday, if any.
+        :type end_year: int
+
+        :raise: ValueError
+
+        """
+        if observed is not None and observed not in OBSERVED:
+            raise ValueError("Not a valid observance: %s" % observed)
+
+        self.day = day
+        self.days = days
+        self.end_year = end_year
+        self.kind = kind
+        self.month = month
+        self.n = n
+        self.name = name
+        self.observed = observed
+        self.start_year = start_year
+        self.weekday = weekday
+
+    def __eq__(self, other):
+        if not isinstance(other, HolidayRule):
+            return NotImplemented
+
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return "<%s %r>" % (self.__class__.__name__, self.name)
+
+    @classmethod
+    def easter(cls, name, days=0, **kwargs):
+        """Create a rule for a holiday relative to Easter Sunday (Western).
+
+        :param name: The name of the holiday.
+        :type name: str
+
+        :param days: The number of days from Easter; for example ``-2`` for Good Friday or ``1`` for Easter Monday.
+        :type days: int
+
+        The remaining keyword arguments (``observed``, ``start_year``, and ``end_year``) are passed to the constructor.
+
+        :rtype: HolidayRule
+
+        """
+        return cls(name, "easter", days=days, **kwargs)
+
+    @classmethod
+    def fixed(cls, name, month, day, **kwargs):
+        """Create a rule for a holiday on the same date every year.
+
+        :param name: The name of the holiday.
+        :type name: str
+
+        :param month: The month.
+        :type month: int
+
+        :param day: The day of the month.
+        :type day: int
+
+        :rtype: HolidayRule
+
+        """
+        return cls(name, "fixed", month=month, day=day, **kwargs)
+
+    def get_date(self, year):
+        """Get the date of the holiday in a year, after moving it from a weekend when it is observed.
+
+        :param year: The year.
+        :type year: int
+
+        :rtype: date | None
+        :returns: The date, or ``None`` when there is no holiday in the year.
+
+        """
+        if (self.start_year is not None and year < self.start_year) or \
+                (self.end_year is not None and year > self.end_year):
+            return None
+
+        if self.kind == "easter":
+            value = easter(year) + timedelta(days=self.days)
+        elif self.kind == "fixed":
+            try:
+                value = date(year, self.month, self.day)
+            except ValueError:
+                # February 29th.
+                return None
+        else:
+            value = get_nth_weekday(year, self.month, self.weekday, self.n)
+            if value is None:
+                return None
+
+        if self.observed is not None:
+            weekday = value.isoweekday()
+            if weekday == SATURDAY:
+                value += timedelta(days=-1 if self.observed == "nearest" else 2)
+            elif weekday == SUNDAY:
+                value += timedelta(days=1)
+
+        return value
+
+    @classmethod
+    def nth_weekday(cls, name, month, weekday, n, **kwargs):
+        """Create a rule for a holiday on the nth weekday of a month.
+
+        :param name: The name of the holiday.
+        :type name: str
+
+        :param month: The month.
+        :type month: int
+
+        :param weekday: The ISO weekday.
+        :type weekday: int
+
+        :param n: The occurrence of the weekday; ``1`` for the first, or ``-1`` for the last.
+        :type n: int
+
+        :rtype: HolidayRule
+
+        """
+        if not n:
+            raise ValueError("The occurrence must not be zero.")
+
+        return cls(name, "nth_weekday", month=month, weekday=weekday, n=n, **kwargs)
+
+    def _key(self):
+        """Get the values by which rules are compared and hashed."""
+        return (self.name, self.kind, self.month, self.day, self.weekday, self.n, self.days, self.observed,
+                self.start_year, self.end_year)
+
+
+class HolidayRules(object):
+    """A set of holiday rules that behaves like a collection of the dates they produce, for any year.
+
+    Membership is tested against the holidays of the year of the date, which are generated once for each year and then
+    cached. Since there is no last year, the dates may not be iterated directly; use ``between()`` or ``get_dates()``.
+
+    """
+
+    def __init__(self, rules):
+        """Initialize the rules.
+
+        :param rules: The rules.
+        :type rules: list[HolidayRule]
+
+        """
+        self.rules = tuple(rules)
+
+    def __bool__(self):
+        return len(self.rules) > 0
+
+    def __contains__(self, value):
+        return value.toordinal() in self._get_year(value.year)[1]
+
+    def __eq__(self, other):
+        if not isinstance(other, HolidayRules):
+            return NotImplemented
+
+        return self.rules == other.rules
+
+    def __hash__(self):
+        # Not cached, so that the holidays of a year are generated again (and tables computed from them are not reused)
+        # when a rule is changed.
+        return hash(self.rules)
+
+    def between(self, start, end):
+        """Get the holidays from the start up to and including the end.
+
+        :param start: The starting date.
+        :type start: date
+
+        :param end: The ending date.
+        :type end: date
+
+        :rtype: list[date]
+
+        """
+        start_ordinal = start.toordinal()
+        end_ordinal = end.toordinal()
+
+        dates = list()
+        for year in range(start.year, end.year + 1):
+            for value in self.get_dates(year):
+                if start_ordinal <= value.toordinal() <= end_ordinal:
+                    dates.append(value)
+
+        return dates
+
+    def get_dates(self, year):
+        """Get the holidays of a year.
+
+        :param year: The year.
+        :type year: int
+
+        :rtype: tuple[date]
+
+        """
+        return tuple(name_date[0] for name_date in self._get_year(year)[0])
+
+    def get_holidays(self, year):
+        """Get the holidays of a year with their names.
+
+        :param year: The year.
+        :type year: int
+
+        :rtype: tuple[tuple]
+        :returns: The date and name of each holiday, in order.
+
+        """
+        return self._get_year(year)[0]
+
+    def _get_year(self, year):
+        """Get the sorted holidays of a year and their ordinals, generating them on first use."""
+        key = (self, year)
+        value = YEAR_CACHE.get(key)
+        if value is None:
+            value = YEAR_CACHE.set(key, self._generate(year))
+
+        return value
+
+    def _generate(self, year):
+        """Generate the holidays of a year. Observed dates may cross the end of a year, as when January 1st is a
+        Saturday, so the neighbouring years are included."""
+        holidays = list()
+        for rule in self.rules:
+            for _year in (year - 1, year, year + 1):
+                value = rule.get_date(_year)
+                if value is not None and value.year == year:
+                    holidays.append((value, rule.name))
+
+        holidays.sort()
+        return tuple(holidays), frozenset(value.toordinal() for value, _ in holidays)
+
+# Functions
+
+
+def get_nth_weekday(year, month, weekday, n):
+    """Get the nth weekday of a month.
+
+    :param year: The year.
+    :type year: int
+
+    :param month: The month.
+    :type month: int
+
+    :param weekday: The ISO weekday.
+    :type weekday: int
+
+    :param n: The occurrence of the weekday; ``1`` for the first, or ``-1`` for the last.
+    :type n: int
+
+    :rtype: date | None
+    :returns: The date, or ``None`` when the month has fewer occurrences.
+
+    """
+    if n > 0:
+        first = date(year, month, 1)
+        value = first + timedelta(days=(weekday - first.isoweekday()) % 7 + (n - 1) * 7)
+    else:
+        if month == 12:
+            last = date(year, 12, 31)
+        else:
+            last = date(year, month + 1, 1) - timedelta(days=1)
+
+        value = last - timedelta(days=(last.isoweekday() - weekday) % 7 + (-n - 1) * 7)
+
+    if value.month != month:
+        return None
+
+    return value
+
+
+def to_bytes(dates):
+    """Encode holidays using the holiday calendar file format.
+
+    :param dates: The holidays.
+    :type dates: list[date]
+
+    :rtype: bytes
+
+    """
+    ordinals = array("i", sorted(set(d.toordinal() for d in dates)))
+    if sys.byteorder != "little":
+        ordinals.byteswap()
+
+    return HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(ordinals)) + ordinals.tobytes()
+
+
+def validate(data):
+    """Validate the header of a holiday calendar.
+
+    :param data: The file contents.
+    :type data: bytes | memoryview
+
+    :raise: ValueError
+    :raises: ``ValueError`` when the data is not a holiday calendar.
+
+    """
+    if len(data) < HEADER.size:
+        raise ValueError("Holiday calendar data is too short.")
+
+    magic, version, _, count = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not a holiday calendar.")
+
+    if version != FORMAT_VERSION:
+        raise ValueError("Unsupported holiday calendar version: %s" % version)
+
+    if len(data) != HEADER.size + count * 4:
+        raise ValueError("Holiday calendar data is truncated.")
@@ -1,11 +1,14 @@
 # Imports
 
+from bisect import bisect_left, bisect_right
 from datetime import date, datetime, timedelta
 from dateutil import parser as datetime_parser
-from dateutil.relativedelta import relativedelta
 import pytz
-from .constants import MONDAY, SUNDAY
-from .utils import get_days_in_month, increment, is_business_day, is_leap_year
+from .cache import Cache
+from .constants import DAYS_PER_WEEK, MONDAY, MONTHS_PER_YEAR
+from .formats import compile_format
+from .utils import diff, get_days_in_month, get_fiscal_year, get_quarter, get_timezone, increment, is_business_day, \
+    is_leap_year, roll, truncate
 from .variables import CURRENT_DT
 
 # Exports
@@ -13,11 +16,23 @@ from .variables import CURRENT_DT
 __all__ = (
     "DateTime",
     "DateTimeRange",
+    "DateTimeSet",
     "Month",
+    "Quarter",
     "Week",
     "Year",
 )
 
+# Constants
+
+# The origin of pickled date/times; midnight of ordinal 1.
+EPOCH = datetime(1, 1, 1)
+
+ONE_MICROSECOND = timedelta(microseconds=1)
+
+# Parsed date/times by string and input format. Since datetime is immutable, the results may be shared.
+PARSE_CACHE = Cache("parsed_strings", max_size=10000)
+
 # Classes
 
 
@@ -36,9 +51,13 @@ class DateTime(object):
         due.increment(business_days=30)
         print(due) # 2016-06-06 14:35:58.805607+00:00
 
-    """
+    Instances are ordered and hashed by the current date/time, and may be compared with ``datetime`` instances.
+
+    .. warning::
+        Since methods such as ``increment()`` change the current date/time, and so the hash, an instance should not be
+        changed while it is a member of a ``set`` or a key of a ``dict``.
 
-    # TODO: Implement is_in_quarter() or in_quarter() method.
+    """
 
     # TODO: Implement is_same(self, dt) or is_same_as()
 
@@ -68,9 +87,80 @@ class DateTime(object):
         self._ending_dt = dt
         self._starting_dt = dt
 
+    def __eq__(self, other):
+        other = to_datetime(other)
+        if other is None:
+            return NotImplemented
+
+        return self._current_dt == other
+
+    def __ge__(self, other):
+        other = to_datetime(other)
+        if other is None:
+            return NotImplemented
+
+        return self._current_dt >= other
+
+    def __getstate__(self):
+        # Date/times are pickled as integers, with the original and ending date/times only when they differ.
+        state = encode_datetime(self._current_dt)
+        if self._starting_dt is self._current_dt and self._ending_dt is self._current_dt:
+            return state
+
+        return state, encode_datetime(self._starting_dt), encode_datetime(self._ending_dt)
+
+    def __gt__(self, other):
+        other = to_datetime(other)
+        if other is None:
+            return NotImplemented
+
+        return self._current_dt > other
+
+    def __hash__(self):
+        return hash(self._current_dt)
+
+    def __le__(self, other):
+        other = to_datetime(other)
+        if other is None:
+            return NotImplemented
+
+        return self._current_dt <= other
+
+    def __lt__(self, other):
+        other = to_datetime(other)
+        if other is None:
+            return NotImplemented
+
+        return self._current_dt < other
+
+    def __setstate__(self, state):
+        if state.__class__ is tuple and len(state) == 3:
+            self._current_dt, self._starting_dt, self._ending_dt = [decode_datetime(value) for value in state]
+        else:
+            self._current_dt = decode_datetime(state)
+            self._ending_dt = self._current_dt
+            self._starting_dt = self._current_dt
+
     def __str__(self):
         return str(self.dt)
 
+    def ceil(self, unit, step=1, start_day=MONDAY):
+        """Get the first boundary of a calendar unit at or after the current date/time. See :py:func:`truncate`.
+
+        :param unit: The unit; ``second``, ``minute``, ``hour``, ``day``, ``week``, ``month``, ``quarter``, or ``year``.
+        :type unit: str
+
+        :param step: The number of units between boundaries.
+        :type step: int
+
+        :param start_day: The ISO weekday that starts a week.
+        :type start_day: int
+
+        :rtype: datetime
+
+        """
+        return truncate(self._current_dt, unit, step=step, mode="ceil", start_day=start_day)
+
     @property
     def current(self):
         """Always returns the date and time as currently represented by the
@@ -123,6 +213,28 @@ class DateTime(object):
         """See ``current``."""
         return self._current_dt
 
+    def diff(self, other, units=("years", "months", "days"), holidays=None):
+        """Get the calendar difference from the current date/time to another. See :py:func:`diff`.
+
+        .. code-block:: python
+
+            hired = DateTime(datetime(2019, 1, 31))
+            print(hired.diff(datetime(2021, 3, 1))) # {'years': 2, 'months': 1, 'days': 1}
+
+        :param other: The other date/time.
+        :type other: datetime | DateTime
+
+        :param units: The units of the result, including ``business_days``.
+        :type units: tuple[str]
+
+        :param holidays: Holidays or other time off, for business days.
+        :type holidays: list[date] | set[date] | HolidayCalendar
+
+        :rtype: dict
+
+        """
+        return diff(self._current_dt, to_datetime(other, strict=True), units=units, holidays=holidays)
+
     def end_of_day_dt(self):
         """Get the date/time for the end of the current date/time.
 
@@ -148,8 +260,13 @@ class DateTime(object):
         return dt
 
     def end_of_year_dt(self):
+        """Get the date/time for the end of the year for the current date/time.
+
+        :rtype: datetime
+
+        """
         dt = self._current_dt
-        dt = dt.replace(day=31, hour=23, minute=29, month=12, second=59)
+        dt = dt.replace(day=31, hour=23, minute=59, month=12, second=59)
 
         return dt
 
@@ -221,6 +338,40 @@ class DateTime(object):
 
         return self.dt
 
+    def floor(self, unit, step=1, start_day=MONDAY):
+        """Get the last boundary of a calendar unit at or before the current date/time. See :py:func:`truncate`.
+
+        .. code-block:: python
+
+            dt = DateTime(datetime(2021, 3, 10, 10, 37))
+            print(dt.floor("minute", 15)) # 2021-03-10 10:30:00
+            print(dt.floor("quarter")) # 2021-01-01 00:00:00
+
+        :param unit: The unit; ``second``, ``minute``, ``hour``, ``day``, ``week``, ``month``, ``quarter``, or ``year``.
+        :type unit: str
+
+        :param step: The number of units between boundaries.
+        :type step: int
+
+        :param start_day: The ISO weekday that starts a week.
+        :type start_day: int
+
+        :rtype: datetime
+
+        """
+        return truncate(self._current_dt, unit, step=step, start_day=start_day)
+
+    def format(self, fmt):
+        """Format the current date/time. This is faster than ``strftime()``; see :py:class:`Format`.
+
+        :param fmt: ``iso8601``, ``rfc3339``, or a ``strftime()`` format.
+        :type fmt: str
+
+        :rtype: str
+
+        """
+        return compile_format(fmt).apply(self._current_dt)
+
     @classmethod
     def from_date(cls, value):
         """Create a new ``DateTime`` instance from a date object.
@@ -252,9 +403,11 @@ class DateTime(object):
         """
         # https://stackoverflow.com/a/18706449
         if input_format is not None:
-            return cls(datetime.strptime(value, input_format))
-        else:
-            return cls(datetime_parser.parse(value))
+            return cls(PARSE_CACHE.get_or_set((value, input_format), lambda: parse_string(value, input_format)))
+
+        # A partial string such as "March 5" or "10:30" is completed from today, so the day is part of the key.
+        today = date.today()
+        return cls(PARSE_CACHE.get_or_set((value, today), lambda: parse_string(value, default_date=today)))
 
     def get_day_of_week(self, offset=False):
         """Get the day of the week for the current date/time.
@@ -265,7 +418,8 @@ class DateTime(object):
         :rtype: int
 
         """
-        dow = int(self._current_dt.strftime("%w"))
+        # Sunday is 0, as for strftime("%w").
+        dow = self._current_dt.isoweekday() % DAYS_PER_WEEK
 
         if offset:
             dow += 1
@@ -307,6 +461,36 @@ class DateTime(object):
 
         return self.dt
 
+    def in_quarter(self, quarter, year=None, fiscal_start=1):
+        """Determine whether the date and time falls within a quarter.
+
+        :param quarter: The quarter number (1 - 4) or a :py:class:`Quarter` instance.
+        :type quarter: int | Quarter
+
+        :param year: The fiscal year of the quarter. If omitted, any year matches. Ignored when ``quarter`` is a
+                     ``Quarter`` instance.
+        :type year: int
+
+        :param fiscal_start: The month number that begins the fiscal year. Ignored when ``quarter`` is a ``Quarter``
+                             instance.
+        :type fiscal_start: int
+
+        :rtype: bool
+
+        """
+        dt = self._current_dt
+
+        if isinstance(quarter, Quarter):
+            return quarter.includes(dt)
+
+        if get_quarter(dt.month, fiscal_start=fiscal_start) != quarter:
+            return False
+
+        if year is None:
+            return True
+
+        return get_fiscal_year(dt, fiscal_start) == year
+
     def in_range(self, start_dt, end_dt):
         """Determine whether the date and time falls within a range of two
         dates.
@@ -345,6 +529,15 @@ class DateTime(object):
         """
         return self._starting_dt
 
+    @property
+    def quarter(self):
+        """The (calendar) quarter number of the current date/time.
+
+        :rtype: int
+
+        """
+        return (self._current_dt.month - 1) // 3 + 1
+
     def replace(self, key, value):
         """Replace a value in the current date/time.
 
@@ -380,7 +573,7 @@ class DateTime(object):
 
         _kwargs = dict()
         if key in ("timezone", "tz", "tzinfo"):
-            _kwargs['tzinfo'] = pytz.timezone(value)
+            _kwargs['tzinfo'] = get_timezone(value)
         else:
             _kwargs[key] = value
 
@@ -452,6 +645,38 @@ class DateTime(object):
 
         return self.fast_forward(business_days=reverse_business_days, holidays=holidays, **reverse_kwargs)
 
+    def roll(self, convention="following", holidays=None):
+        """Get the current date/time moved to a business day. See :py:func:`roll`.
+
+        :param convention: ``following``, ``modified_following``, ``preceding``, or ``modified_preceding``.
+        :type convention: str
+
+        :param holidays: Holidays or other time off.
+        :type holidays: list[date] | HolidayCalendar | HolidayRules
+
+        :rtype: datetime
+
+        """
+        return roll(self._current_dt, convention=convention, holidays=holidays)
+
+    def round(self, unit, step=1, start_day=MONDAY):
+        """Get the nearest boundary of a calendar unit to the current date/time. Halfway rounds up. See
+        :py:func:`truncate`.
+
+        :param unit: The unit; ``second``, ``minute``, ``hour``, ``day``, ``week``, ``month``, ``quarter``, or ``year``.
+        :type unit: str
+
+        :param step: The number of units between boundaries.
+        :type step: int
+
+        :param start_day: The ISO weekday that starts a week.
+        :type start_day: int
+
+        :rtype: datetime
+
+        """
+        return truncate(self._current_dt, unit, step=step, mode="round", start_day=start_day)
+
     def set_day(self, value):
         """Set the day of the current date/time.
 
@@ -488,7 +713,7 @@ class DateTime(object):
         :rtype: datetime
 
         """
-        timezone = pytz.timezone(timezone)
+        timezone = get_timezone(timezone)
         self._current_dt = self._current_dt.replace(tzinfo=timezone)
         return self.dt
 
@@ -563,6 +788,45 @@ class DateTimeRange(object):
         else:
             self.end = DateTime(end_dt)
 
+    def __eq__(self, other):
+        if not isinstance(other, DateTimeRange):
+            return NotImplemented
+
+        return self._key() == other._key()
+
+    def __ge__(self, other):
+        if not isinstance(other, DateTimeRange):
+            return NotImplemented
+
+        return self._key() >= other._key()
+
+    def __getstate__(self):
+        return self.start, self.end
+
+    def __gt__(self, other):
+        if not isinstance(other, DateTimeRange):
+            return NotImplemented
+
+        return self._key() > other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __le__(self, other):
+        if not isinstance(other, DateTimeRange):
+            return NotImplemented
+
+        return self._key() <= other._key()
+
+    def __lt__(self, other):
+        if not isinstance(other, DateTimeRange):
+            return NotImplemented
+
+        return self._key() < other._key()
+
+    def __setstate__(self, state):
+        self.start, self.end = state
+
     def __str__(self):
         return u"%s - %s" % (self.start.dt, self.end.dt)
 
@@ -592,6 +856,275 @@ class DateTimeRange(object):
 
         return self.start.dt <= dt <= self.end.dt
 
+    def split(self, by=None, n=None, max_duration=None, start_day=MONDAY):
+        """Split the range into contiguous sub-ranges. Sub-ranges are created as they are iterated.
+
+        .. code-block:: python
+
+            for sub_range in dt_range.split(by="month"):
+                pool.submit(scan, sub_range.start.dt, sub_range.end.dt)
+
+        :param by: Align the sub-ranges to periods; ``day``, ``week``, ``month``, ``quarter``, or ``year``. The first
+                   and last sub-ranges are clipped to the range.
+        :type by: str
+
+        :param n: Split into this many sub-ranges of equal duration.
+        :type n: int
+
+        :param max_duration: Split into sub-ranges no longer than this.
+        :type max_duration: timedelta
+
+        :param start_day: The ISO weekday that starts a week when splitting by week.
+        :type start_day: int
+
+        :rtype: collections.Iterable[DateTimeRange]
+
+        :raise: ValueError
+        :raises: ``ValueError`` unless exactly one of ``by``, ``n``, or ``max_duration`` is given, or when it is
+                 invalid.
+
+        .. note::
+            As with ``includes()``, each sub-range includes its end, which is one microsecond before the start of the
+            next. Together the sub-ranges cover the range exactly once.
+
+        """
+        if len([i for i in (by, n, max_duration) if i is not None]) != 1:
+            raise ValueError("Exactly one of by, n, or max_duration is required.")
+
+        start_dt = self.start.dt
+        end_dt = self.end.dt
+
+        if by is not None:
+            boundaries = get_period_starts(start_dt, by, start_day=start_day)
+            next(boundaries)
+        elif n is not None:
+            if n < 1:
+                raise ValueError("The number of sub-ranges must be at least 1: %s" % n)
+
+            duration = end_dt - start_dt
+            boundaries = (start_dt + duration * i // n for i in range(1, n))
+        else:
+            if max_duration <= timedelta():
+                raise ValueError("The maximum duration must be positive: %s" % max_duration)
+
+            boundaries = get_steps(start_dt, max_duration)
+
+        return self._split(boundaries)
+
+    def _key(self):
+        """Get the start and end date/times, by which ranges are compared and hashed."""
+        return self.start.dt, self.end.dt
+
+    def _split(self, boundaries):
+        """Generate the sub-ranges between the given boundaries."""
+        start_dt = self.start.dt
+        end_dt = self.end.dt
+
+        if end_dt < start_dt:
+            return
+
+        for boundary in boundaries:
+            if boundary > end_dt:
+                break
+
+            if boundary > start_dt:
+                yield DateTimeRange(start_dt, boundary - ONE_MICROSECOND)
+                start_dt = boundary
+
+        yield DateTimeRange(start_dt, end_dt)
+
+
+class DateTimeSet(object):
+    """A sorted set of date/times.
+
+    .. code-block:: python
+
+        from datetime_machine import DateTimeSet
+
+        events = DateTimeSet(timestamps)
+        events.add(dt)
+
+        print(events.after(dt)) # The next event.
+        print(len(events.between(start_dt, end_dt))) # The number of events within a range.
+
+    Values are held in a sorted list that is searched by bisection. Membership, rank, and nearest value queries take
+    logarithmic time. Adding a value takes a logarithmic search and a move of the values after it, so ``update()``
+    should be used to add many values at once.
+
+    """
+
+    def __init__(self, values=None):
+        """Initialize the set.
+
+        :param values: The date/times.
+        :type values: list[datetime | DateTime]
+
+        """
+        self._values = sorted(set(to_datetime(value, strict=True) for value in values or list()))
+
+    def __contains__(self, value):
+        value = to_datetime(value)
+        if value is None:
+            return False
+
+        index = bisect_left(self._values, value)
+        return index < len(self._values) and self._values[index] == value
+
+    def __eq__(self, other):
+        if not isinstance(other, DateTimeSet):
+            return NotImplemented
+
+        return self._values == other._values
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return DateTimeSet._from_sorted(self._values[item])
+
+        return self._values[item]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __reversed__(self):
+        return reversed(self._values)
+
+    def __str__(self):
+        return u"{%s}" % u", ".join(str(value) for value in self._values)
+
+    def add(self, value):
+        """Add a date/time.
+
+        :param value: The date/time.
+        :type value: datetime | DateTime
+
+        """
+        value = to_datetime(value, strict=True)
+        index = bisect_left(self._values, value)
+        if index == len(self._values) or self._values[index] != value:
+            self._values.insert(index, value)
+
+    def after(self, value, inclusive=False):
+        """Get the nearest date/time after the given value.
+
+        :param value: The date/time.
+        :type value: datetime | DateTime
+
+        :param inclusive: Also match a date/time equal to the value.
+        :type inclusive: bool
+
+        :rtype: datetime | None
+
+        """
+        value = to_datetime(value, strict=True)
+        if inclusive:
+            index = bisect_left(self._values, value)
+        else:
+            index = bisect_right(self._values, value)
+
+        if index < len(self._values):
+            return self._values[index]
+
+        return None
+
+    def before(self, value, inclusive=False):
+        """Get the nearest date/time before the given value.
+
+        :param value: The date/time.
+        :type value: datetime | DateTime
+
+        :param inclusive: Also match a date/time equal to the value.
+        :type inclusive: bool
+
+        :rtype: datetime | None
+
+        """
+        value = to_datetime(value, strict=True)
+        if inclusive:
+            index = bisect_right(self._values, value)
+        else:
+            index = bisect_left(self._values, value)
+
+        if index > 0:
+            return self._values[index - 1]
+
+        return None
+
+    def between(self, start_dt, end_dt):
+        """Get the date/times within a range, including the start and end.
+
+        :param start_dt: The start of the range.
+        :type start_dt: datetime | DateTime
+
+        :param end_dt: The end of the range.
+        :type end_dt: datetime | DateTime
+
+        :rtype: DateTimeSet
+
+        """
+        start = bisect_left(self._values, to_datetime(start_dt, strict=True))
+        end = bisect_right(self._values, to_datetime(end_dt, strict=True))
+        return DateTimeSet._from_sorted(self._values[start:end])
+
+    def discard(self, value):
+        """Remove a date/time if it is present.
+
+        :param value: The date/time.
+        :type value: datetime | DateTime
+
+        """
+        value = to_datetime(value, strict=True)
+        index = bisect_left(self._values, value)
+        if index < len(self._values) and self._values[index] == value:
+            del self._values[index]
+
+    def rank(self, value):
+        """Get the number of date/times before the given value. For a member of the set, this is its index.
+
+        :param value: The date/time.
+        :type value: datetime | DateTime
+
+        :rtype: int
+
+        """
+        return bisect_left(self._values, to_datetime(value, strict=True))
+
+    def remove(self, value):
+        """Remove a date/time.
+
+        :param value: The date/time.
+        :type value: datetime | DateTime
+
+        :raise: KeyError
+        :raises: ``KeyError`` when the date/time is not present.
+
+        """
+        if value not in self:
+            raise KeyError(value)
+
+        self.discard(value)
+
+    def update(self, values):
+        """Add any number of date/times, sorting once rather than inserting each.
+
+        :param values: The date/times.
+        :type values: list[datetime | DateTime]
+
+        """
+        values = set(to_datetime(value, strict=True) for value in values)
+        values.update(self._values)
+        self._values = sorted(values)
+
+    @classmethod
+    def _from_sorted(cls, values):
+        """Create a set from a list that is already sorted and unique."""
+        instance = cls.__new__(cls)
+        instance._values = values
+
+        return instance
+
 
 class Month(object):
     """Represents a month of time."""
@@ -621,6 +1154,13 @@ class Month(object):
 
         self.total_days = get_days_in_month(self.dt.month, year=self.dt.year)
 
+    def __getstate__(self):
+        return encode_datetime(self.dt)
+
+    def __setstate__(self, state):
+        self.dt = decode_datetime(state)
+        self.total_days = get_days_in_month(self.dt.month, year=self.dt.year)
+
     @property
     def end_dt(self):
         """Get the ending date/time for the last day of the month.
@@ -642,8 +1182,7 @@ class Month(object):
         :rtype: Month
 
         """
-        start_dt = self.start_dt + relativedelta(months=months, years=years)
-        return Month(dt=start_dt)
+        return self._shift((months or 0) + (years or 0) * MONTHS_PER_YEAR)
 
     def next(self):
         """Get the month after the current month.
@@ -651,8 +1190,7 @@ class Month(object):
         :rtype: Month
 
         """
-        start_dt = self.start_dt + relativedelta(months=1)
-        return Month(dt=start_dt)
+        return self._shift(1)
 
     def previous(self):
         """Get the previous month before the current month.
@@ -660,8 +1198,7 @@ class Month(object):
         :rtype: Month
 
         """
-        start_dt = self.start_dt - relativedelta(months=1)
-        return Month(dt=start_dt)
+        return self._shift(-1)
 
     def rewind(self, months=None, years=None):
         """Shift the frame backward by months or years.
@@ -675,8 +1212,7 @@ class Month(object):
         :rtype: Month
 
         """
-        start_dt = self.start_dt - relativedelta(months=months, years=years)
-        return Month(dt=start_dt)
+        return self._shift(-((months or 0) + (years or 0) * MONTHS_PER_YEAR))
 
     @property
     def start_dt(self):
@@ -687,9 +1223,226 @@ class Month(object):
         """
         return self.dt.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
+    def _shift(self, months):
+        """Create a new month without repeating the input dispatch of the constructor."""
+        year, month = divmod(self.dt.year * MONTHS_PER_YEAR + self.dt.month - 1 + months, MONTHS_PER_YEAR)
+        month += 1
+
+        instance = Month.__new__(Month)
+        instance.dt = self.dt.replace(year=year, month=month, day=1, hour=0, minute=0, second=0, microsecond=0)
+        instance.total_days = get_days_in_month(month, year=year)
+
+        return instance
+
+
+class Quarter(object):
+    """Represents a quarter of a (fiscal) year.
+
+    .. code-block:: python
+
+        from datetime_machine import Quarter
+
+        # A fiscal year beginning in October.
+        quarter = Quarter(datetime(2021, 11, 15), fiscal_start=10)
+        print(quarter.number) # 1
+        print(quarter.fiscal_year) # 2022
+        print(quarter.next().start_dt) # 2022-01-01 00:00:00
+
+    Navigation is performed with integer month arithmetic, so walking many quarters does not construct any
+    ``relativedelta`` instances.
+
+    """
+
+    def __init__(self, dt=None, input_format=None, fiscal_start=1):
+        """Initialize a quarter instance.
+
+        :param dt: The starting date/time for the quarter. Defaults to the current date/time.
+        :type dt: str | date | datetime | DateTime
+
+        :param input_format: See the ``from_string()`` method on :py:class:`DateTime`.
+
+        :param fiscal_start: The month number that begins the fiscal year.
+        :type fiscal_start: int
+
+        .. tip::
+            The starting value need not be the beginning of the quarter.
+
+        """
+        if isinstance(dt, DateTime):
+            self.dt = dt.dt
+        elif type(dt) is date:
+            self.dt = DateTime.from_date(dt).dt
+        elif type(dt) is datetime:
+            self.dt = dt
+        elif type(dt) is str:
+            self.dt = DateTime.from_string(dt, input_format=input_format).dt
+        else:
+            self.dt = CURRENT_DT
+
+        if fiscal_start not in range(1, MONTHS_PER_YEAR + 1):
+            raise ValueError("Not a valid month number: %s" % fiscal_start)
+
+        self.fiscal_start = fiscal_start
+
+        index = self.dt.year * MONTHS_PER_YEAR + self.dt.month - 1
+        self._index = index - (self.dt.month - fiscal_start) % 3
+
+    def __getstate__(self):
+        return encode_datetime(self.dt), self.fiscal_start
+
+    def __setstate__(self, state):
+        self.__init__(decode_datetime(state[0]), fiscal_start=state[1])
+
+    @property
+    def end_dt(self):
+        """Get the ending date/time for the last day of the quarter.
+
+        :rtype: datetime
+
+        """
+        year, month = divmod(self._index + 2, MONTHS_PER_YEAR)
+        month += 1
+
+        return self.dt.replace(
+            year=year,
+            month=month,
+            day=get_days_in_month(month, year=year),
+            hour=23,
+            minute=59,
+            second=59,
+            microsecond=0
+        )
+
+    @property
+    def fiscal_year(self):
+        """The fiscal year to which the quarter belongs. This is named for the calendar year in which the fiscal year
+        ends.
+
+        :rtype: int
+
+        """
+        return get_fiscal_year(self.start_dt, self.fiscal_start)
+
+    def forward(self, quarters=None, years=None):
+        """Shift the frame forward by quarters or years.
+
+        :param quarters: The number of quarters to increment.
+        :type quarters: int
+
+        :param years: The number of years to increment.
+        :type years: int
+
+        :rtype: Quarter
+
+        """
+        return self._shift((quarters or 0) * 3 + (years or 0) * MONTHS_PER_YEAR)
+
+    def includes(self, dt):
+        """Determine whether the given date/time falls within the quarter.
+
+        :param dt: The date/time to be checked.
+        :type dt: date | datetime | DateTime
+
+        :rtype: bool
+
+        """
+        if isinstance(dt, DateTime):
+            dt = dt.dt
+
+        index = dt.year * MONTHS_PER_YEAR + dt.month - 1
+
+        return self._index <= index < self._index + 3
+
+    def next(self):
+        """Get the quarter after the current quarter.
+
+        :rtype: Quarter
+
+        """
+        return self._shift(3)
+
+    @property
+    def number(self):
+        """The quarter number (1 - 4) within the fiscal year.
+
+        :rtype: int
+
+        """
+        return get_quarter(self._index % MONTHS_PER_YEAR + 1, fiscal_start=self.fiscal_start)
+
+    def previous(self):
+        """Get the previous quarter before the current quarter.
+
+        :rtype: Quarter
+
+        """
+        return self._shift(-3)
+
+    def rewind(self, quarters=None, years=None):
+        """Shift the frame backward by quarters or years.
+
+        :param quarters: The number of quarters to reverse.
+        :type quarters: int
+
+        :param years: The number of years to reverse.
+        :type years: int
+
+        :rtype: Quarter
+
+        """
+        return self._shift(-((quarters or 0) * 3 + (years or 0) * MONTHS_PER_YEAR))
+
+    @property
+    def start_dt(self):
+        """Get the starting date/time for the first day of the quarter.
+
+        :rtype: datetime
+
+        """
+        year, month = divmod(self._index, MONTHS_PER_YEAR)
+
+        return self.dt.replace(year=year, month=month + 1, day=1, hour=0, minute=0, second=0, microsecond=0)
+
+    @property
+    def total_days(self):
+        """The number of days in the quarter.
+
+        :rtype: int
+
+        """
+        total = 0
+        for index in range(self._index, self._index + 3):
+            year, month = divmod(index, MONTHS_PER_YEAR)
+            total += get_days_in_month(month + 1, year=year)
+
+        return total
+
+    def _shift(self, months):
+        """Create a new quarter without repeating the input dispatch of the constructor."""
+        quarter = Quarter.__new__(Quarter)
+        quarter.fiscal_start = self.fiscal_start
+        quarter._index = self._index + months
+        quarter.dt = self.dt
+        quarter.dt = quarter.start_dt
+
+        return quarter
+
 
 class Week(object):
-    """Represents a week of time."""
+    """Represents a week of time.
+
+    Weeks are numbered as in ISO 8601; the first week of a year is the one whose fourth day falls in that year. For
+    weeks starting on a Monday this is exactly the ISO week number.
+
+    .. code-block:: python
+
+        from datetime_machine import Week
+
+        week = Week.from_iso(2021, 1)
+        print(week.start_dt) # 2021-01-04 00:00:00+00:00
+        print(week.number, week.iso_year) # 1 2021
+
+    """
 
     def __init__(self, dt=None, input_format=None, start_day=MONDAY):
         """Initialize a week instance.
@@ -719,6 +1472,20 @@ class Week(object):
 
         self.start_day = start_day
 
+        # Boundaries are computed on first use and then cached.
+        self._end_dt = None
+        self._start_dt = None
+
+    def __getstate__(self):
+        # The cached boundaries are not pickled.
+        return encode_datetime(self.dt), self.start_day
+
+    def __setstate__(self, state):
+        self.dt = decode_datetime(state[0])
+        self.start_day = state[1]
+        self._end_dt = None
+        self._start_dt = None
+
     @property
     def end_dt(self):
         """Get the ending date/time for the last day of the week.
@@ -726,11 +1493,11 @@ class Week(object):
         :rtype: datetime
 
         """
-        dt = self.start_dt + timedelta(days=6)
+        if self._end_dt is None:
+            dt = self.start_dt + timedelta(days=6)
+            self._end_dt = dt.replace(hour=23, minute=59, second=59, microsecond=0)
 
-        dt = dt.replace(hour=23, minute=59, second=59, microsecond=0)
-
-        return dt
+        return self._end_dt
 
     def forward(self, months=None, weeks=None, years=None):
         """Shift the frame forward by weeks, months or years.
@@ -747,8 +1514,49 @@ class Week(object):
         :rtype: Week
 
         """
-        start_dt = self.start_dt + relativedelta(weeks=weeks, months=months, years=years)
-        return Week(dt=start_dt)
+        if not months and not years:
+            return self._shift((weeks or 0) * DAYS_PER_WEEK)
+
+        start_dt = increment(self.start_dt, **get_period_kwargs(months=months, weeks=weeks, years=years))
+        return Week(dt=start_dt, start_day=self.start_day)
+
+    @classmethod
+    def from_iso(cls, year, number, start_day=MONDAY, timezone=pytz.UTC):
+        """Create a week from its year and week number.
+
+        :param year: The (ISO) year to which the week belongs.
+        :type year: int
+
+        :param number: The week number, from ``1`` to ``52`` or ``53``.
+        :type number: int
+
+        :param start_day: The ISO weekday that starts a week.
+        :type start_day: int
+
+        :param timezone: The timezone of the week. As with ``DateTime.from_date()``, this is UTC by default.
+        :type timezone: tzinfo
+
+        :rtype: Week
+
+        :raise: ValueError
+        :raises: ``ValueError`` when the year does not have the given week number.
+
+        """
+        first = get_first_week_ordinal(year, start_day)
+        total = (get_first_week_ordinal(year + 1, start_day) - first) // DAYS_PER_WEEK
+        if number < 1 or number > total:
+            raise ValueError("Week %s is not valid for %s, which has %s weeks." % (number, year, total))
+
+        return cls._from_ordinal(first + (number - 1) * DAYS_PER_WEEK, start_day, timezone)
+
+    @property
+    def iso_year(self):
+        """The year to which the week belongs, which may differ from the calendar year of its first or last days.
+
+        :rtype: int
+
+        """
+        return date.fromordinal(self.start_dt.toordinal() + 3).year
 
     def next(self):
         """Get the week after the current week.
@@ -756,8 +1564,18 @@ class Week(object):
         :rtype: Week
 
         """
-        start_dt = self.start_dt + timedelta(days=7)
-        return Week(dt=start_dt, start_day=self.start_day)
+        return self._shift(DAYS_PER_WEEK)
+
+    @property
+    def number(self):
+        """The week number within its (ISO) year.
+
+        :rtype: int
+
+        """
+        middle = self.start_dt.toordinal() + 3
+        first = date(date.fromordinal(middle).year, 1, 1).toordinal()
+        return (middle - first) // DAYS_PER_WEEK + 1
 
     def previous(self):
         """Get the previous week before the current week.
@@ -765,8 +1583,7 @@ class Week(object):
         :rtype: Week
 
         """
-        start_dt = self.start_dt - timedelta(days=7)
-        return Week(dt=start_dt, start_day=self.start_day)
+        return self._shift(-DAYS_PER_WEEK)
 
     def rewind(self, months=None, weeks=None, years=None):
         """Shift the frame backward by months or years.
@@ -783,8 +1600,11 @@ class Week(object):
         :rtype: Week
 
         """
-        start_dt = self.start_dt - relativedelta(weeks=weeks, months=months, years=years)
-        return Week(dt=start_dt)
+        if not months and not years:
+            return self._shift(-(weeks or 0) * DAYS_PER_WEEK)
+
+        start_dt = increment(self.start_dt, **get_period_kwargs(months=months, weeks=weeks, years=years, sign=-1))
+        return Week(dt=start_dt, start_day=self.start_day)
 
     @property
     def start_dt(self):
@@ -793,14 +1613,27 @@ class Week(object):
         :rtype: datetime
 
         """
-        if self.start_day == SUNDAY:
-            dt = self.dt - timedelta(days=self.dt.isoweekday() % 7)
-        else:
-            dt = self.dt - timedelta(days=self.dt.isoweekday() - 1)
+        if self._start_dt is None:
+            dt = self.dt - timedelta(days=(self.dt.isoweekday() - self.start_day) % DAYS_PER_WEEK)
+            self._start_dt = dt.replace(hour=0, minute=0, second=0, microsecond=0)
 
-        dt = dt.replace(hour=0, minute=0, second=0, microsecond=0)
+        return self._start_dt
 
-        return dt
+    @classmethod
+    def _from_ordinal(cls, ordinal, start_day, tzinfo):
+        """Create a week starting on the given day without repeating the input dispatch of the constructor."""
+        instance = cls.__new__(cls)
+        instance.dt = datetime.fromordinal(ordinal).replace(tzinfo=tzinfo)
+        instance.start_day = start_day
+        instance._end_dt = None
+        instance._start_dt = instance.dt
+
+        return instance
+
+    def _shift(self, days):
+        """Create the week starting the given number of days from this one."""
+        start_dt = self.start_dt
+        return Week._from_ordinal(start_dt.toordinal() + days, self.start_day, start_dt.tzinfo)
 
 
 class Year(object):
@@ -836,6 +1669,12 @@ class Year(object):
         else:
             self.total_days = 365
 
+    def __getstate__(self):
+        return encode_datetime(self.dt)
+
+    def __setstate__(self, state):
+        self.__init__(decode_datetime(state))
+
     @property
     def end_dt(self):
         """Get the ending date/time for the last day of the year.
@@ -851,11 +1690,10 @@ class Year(object):
         :param years: The number of years to increment.
         :type years: int
 
-        :rtype: Week
+        :rtype: Year
 
         """
-        start_dt = self.start_dt + relativedelta(years=years)
-        return Year(dt=start_dt)
+        return self._shift(years or 0)
 
     def next(self):
         """Get the year after the current year.
@@ -863,8 +1701,7 @@ class Year(object):
         :rtype: Year
 
         """
-        start_dt = self.start_dt + relativedelta(years=1)
-        return Year(dt=start_dt)
+        return self._shift(1)
 
     def previous(self):
         """Get the previous year before the current year.
@@ -872,8 +1709,7 @@ class Year(object):
         :rtype: Year
 
         """
-        start_dt = self.start_dt - relativedelta(years=1)
-        return Year(dt=start_dt)
+        return self._shift(-1)
 
     def rewind(self, years=1):
         """Shift the frame backward by one or more years.
@@ -884,8 +1720,7 @@ class Year(object):
         :rtype: Year
 
         """
-        start_dt = self.start_dt - relativedelta(years=years)
-        return Year(dt=start_dt)
+        return self._shift(-(years or 0))
 
     @property
     def start_dt(self):
@@ -895,3 +1730,222 @@ class Year(object):
 
         """
         return self.dt.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
+
+    def weeks(self, start_day=MONDAY):
+        """Get the weeks of the year. Weeks are created as they are iterated.
+
+        :param start_day: The ISO weekday that starts a week.
+        :type start_day: int
+
+        :rtype: collections.Iterable[Week]
+
+        .. note::
+            As with ISO 8601, these are the weeks numbered within the year. The first may begin in December of the
+            previous year, and the last may end in January of the next.
+
+        """
+        year = self.dt.year
+        first = get_first_week_ordinal(year, start_day)
+        last = get_first_week_ordinal(year + 1, start_day)
+        for ordinal in range(first, last, DAYS_PER_WEEK):
+            yield Week._from_ordinal(ordinal, start_day, self.dt.tzinfo)
+
+    def _shift(self, years):
+        """Create a new year without repeating the input dispatch of the constructor."""
+        year = self.dt.year + years
+
+        instance = Year.__new__(Year)
+        instance.dt = self.dt.replace(year=year, month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
+        instance.is_leap_year = is_leap_year(year)
+        instance.total_days = 366 if instance.is_leap_year else 365
+
+        return instance
+
+# Functions
+
+
+def decode_datetime(value):
+    """Decode a date/time encoded by ``encode_datetime()``.
+
+    :param value: The encoded date/time.
+    :type value: int | tuple
+
+    :rtype: datetime
+
+    """
+    if value.__class__ is int:
+        return EPOCH + timedelta(microseconds=value)
+
+    microseconds, tzinfo = value
+    return (EPOCH + timedelta(microseconds=microseconds)).replace(tzinfo=tzinfo)
+
+
+def encode_datetime(dt):
+    """Encode a date/time compactly for pickling.
+
+    :param dt: The date/time.
+    :type dt: datetime
+
+    :rtype: int | tuple
+    :returns: The microseconds since midnight of ordinal 1 to the wall clock, paired with the ``tzinfo`` when there is
+              one. A ``pytz`` timezone pickles as its zone and exact offset, so the offset is restored as it was, even
+              when it was attached with ``replace()`` rather than ``localize()``.
+
+    """
+    microseconds = (dt.replace(tzinfo=None) - EPOCH) // ONE_MICROSECOND
+    if dt.tzinfo is None:
+        return microseconds
+
+    return microseconds, dt.tzinfo
+
+
+def get_first_week_ordinal(year, start_day=MONDAY):
+    """Get the ordinal of the first day of the first week of a year; the week whose fourth day falls in the year.
+
+    :param year: The year.
+    :type year: int
+
+    :param start_day: The ISO weekday that starts a week.
+    :type start_day: int
+
+    :rtype: int
+
+    """
+    january_1st = date(year, 1, 1).toordinal()
+
+    # Ordinal 1 is a Monday, so the ISO weekday of an ordinal is (ordinal - 1) % 7 + 1.
+    middle_day = (start_day + 2) % DAYS_PER_WEEK + 1
+    middle = january_1st + (middle_day - ((january_1st - 1) % DAYS_PER_WEEK + 1)) % DAYS_PER_WEEK
+
+    return middle - 3
+
+
+def get_period_starts(dt, period, start_day=MONDAY):
+    """Get the starting date/times of a period and those that follow it, without end.
+
+    :param dt: A date/time within the first period.
+    :type dt: datetime
+
+    :param period: The period; ``day``, ``week``, ``month``, ``quarter``, or ``year``.
+    :type period: str
+
+    :param start_day: The ISO weekday that starts a week.
+    :type start_day: int
+
+    :rtype: collections.Iterable[datetime]
+
+    :raise: ValueError
+    :raises: ``ValueError`` for an invalid period.
+
+    """
+    if period == "day":
+        start_dt = dt.replace(hour=0, minute=0, second=0, microsecond=0)
+        return get_steps(start_dt, timedelta(days=1))
+    elif period == "week":
+        instance = Week(dt, start_day=start_day)
+    elif period == "month":
+        instance = Month(dt)
+    elif period == "quarter":
+        instance = Quarter(dt)
+    elif period == "year":
+        instance = Year(dt)
+    else:
+        raise ValueError("Invalid period (%s), must be one of: day, week, month, quarter, year" % period)
+
+    return get_period_instance_starts(instance)
+
+
+def get_period_instance_starts(instance):
+    """Get the starting date/time of a period instance and each that follows it.
+
+    :param instance: The period.
+    :type instance: Month | Quarter | Week | Year
+
+    :rtype: collections.Iterable[datetime]
+
+    """
+    while True:
+        yield instance.start_dt
+        instance = instance.next()
+
+
+def get_period_kwargs(sign=1, **kwargs):
+    """Get the keyword arguments for :py:func:`increment` from period navigation arguments, which may be ``None``.
+
+    :param sign: ``1`` to move forward, ``-1`` to move backward.
+    :type sign: int
+
+    :rtype: dict
+
+    """
+    _kwargs = dict()
+    for key, value in kwargs.items():
+        if value:
+            _kwargs[key] = value * sign
+
+    return _kwargs
+
+
+def get_steps(dt, step):
+    """Get a date/time and each that follows it by the given step, without end.
+
+    :param dt: The first date/time.
+    :type dt: datetime
+
+    :param step: The step.
+    :type step: timedelta
+
+    :rtype: collections.Iterable[datetime]
+
+    """
+    while True:
+        yield dt
+        dt += step
+
+
+def parse_string(value, input_format=None, default_date=None):
+    """Parse a date/time string. See ``DateTime.from_string()``.
+
+    :param value: The value to be parsed.
+    :type value: str
+
+    :param input_format: The strptime format of the value. If omitted, the format is detected.
+    :type input_format: str
+
+    :param default_date: The date from which the missing fields of a detected format are taken. Defaults to today.
+    :type default_date: date
+
+    :rtype: datetime
+
+    """
+    if input_format is not None:
+        return datetime.strptime(value, input_format)
+
+    if default_date is None:
+        return datetime_parser.parse(value)
+
+    return datetime_parser.parse(value, default=datetime(default_date.year, default_date.month, default_date.day))
+
+
+def to_datetime(value, strict=False):
+    """Get the ``datetime`` of a value for comparison.
+
+    :param value: The value.
+    :type value: datetime | DateTime
+
+    :param strict: Raise an error rather than return ``None`` for any other type.
+    :type strict: bool
+
+    :rtype: datetime | None
+
+    :raise: TypeError
+
+    """
+    if isinstance(value, DateTime):
+        return value.dt
+    elif isinstance(value, datetime):
+        return value
+    elif strict:
+        raise TypeError("Not a datetime or DateTime: %r" % (value,))
+
+    return None
@@ -0,0 +1,369 @@
+"""
+The offsets module compiles relative offset expressions, such as those stored by rules engines, into reusable objects.
+
+.. code-block:: python
+
+    from datetime_machine import compile_offset
+
+    offset = compile_offset("-1 month then end of month")
+    due = offset.apply(dt)
+
+    # Any number of values; a list, or a DateTimeArray for vectorized evaluation.
+    dues = compile_offset("+3 business days").apply(datetimes, holidays=holidays)
+
+An expression is one or more steps separated by ``then`` (or a comma), applied from left to right:
+
+- An amount, such as ``+3 business days``, ``-1 month``, or ``2 weeks``. The units are those of :py:func:`increment`
+  (business days, years, months, weeks, days, hours, minutes, seconds, and microseconds) plus quarters.
+- A boundary: ``start of`` or ``end of`` a ``day``, ``week``, ``month``, or ``year``.
+- A weekday: ``next monday`` or ``last friday``, optionally followed by a time of day such as ``09:00``. The weekday
+  is always after (or before) the current date. The time of day is otherwise kept.
+- A time of day: ``09:00``, ``at 17:30``, or ``23:59:59``.
+
+Expressions are not case sensitive. Compiled offsets are cached by their text, so ``compile_offset()`` may be called
+for every event without parsing the expression again.
+
+"""
+# Imports
+
+from datetime import timedelta
+import re
+import sys
+from .cache import Cache
+from .constants import DAYS_PER_WEEK, FRIDAY, MONDAY, MONTHS_PER_YEAR, SATURDAY, SUNDAY, THURSDAY, TUESDAY, WEDNESDAY
+from .library import DateTime, Week
+from .utils import increment
+
+# Exports
+
+__all__ = (
+    "Offset",
+    "compile_offset",
+)
+
+# Constants
+
+AMOUNT_PATTERN = re.compile(
+    r"^(?P<sign>[+-]?)\s*(?P<number>\d+)\s+(?P<unit>business days?|days?|hours?|microseconds?|minutes?|months?|"
+    r"quarters?|seconds?|weeks?|years?)$"
+)
+
+# The module of DateTimeArray, which is imported only when arrays are used.
+ARRAYS_MODULE = "%s.arrays" % __package__
+
+BOUNDARY_PATTERN = re.compile(r"^(?P<boundary>start|end) of (?:the )?(?P<period>day|month|week|year)$")
+
+# Compiled offsets by expression and start day. Offsets are immutable, so they may be shared.
+OFFSET_CACHE = Cache("offsets", max_size=1024)
+
+STEP_SEPARATOR = re.compile(r"\s*(?:,|\bthen\b)\s*")
+
+TIME_PATTERN = re.compile(r"^(?:at )?(?P<hour>\d{1,2}):(?P<minute>\d{2})(?::(?P<second>\d{2}))?$")
+
+WEEKDAY_PATTERN = re.compile(
+    r"^(?P<direction>next|last|previous) (?P<weekday>monday|tuesday|wednesday|thursday|friday|saturday|sunday)"
+    r"(?: (?:at )?(?P<hour>\d{1,2}):(?P<minute>\d{2})(?::(?P<second>\d{2}))?)?$"
+)
+
+WEEKDAYS = {
+    'monday': MONDAY,
+    'tuesday': TUESDAY,
+    'wednesday': WEDNESDAY,
+    'thursday': THURSDAY,
+    'friday': FRIDAY,
+    'saturday': SATURDAY,
+    'sunday': SUNDAY,
+}
+
+# Classes
+
+
+class Offset(object):
+    """A compiled relative offset expression."""
+
+    def __init__(self, expression, start_day=MONDAY):
+        """Compile an offset expression.
+
+        :param expression: The expression, such as ``-1 month then end of month``.
+        :type expression: str
+
+        :param start_day: The ISO weekday that starts a week, for ``start of week`` and ``end of week``.
+        :type start_day: int
+
+        :raise: ValueError
+        :raises: ``ValueError`` when the expression may not be parsed.
+
+        .. tip::
+            Use :py:func:`compile_offset` to reuse offsets that have already been compiled.
+
+        """
+        self.expression = expression
+        self.start_day = start_day
+
+        steps = list()
+        for text in STEP_SEPARATOR.split(normalize(expression)):
+            steps.append(parse_step(text, expression))
+
+        self.steps = tuple(steps)
+
+    def __repr__(self):
+        return "<%s %r>" % (self.__class__.__name__, self.expression)
+
+    def apply(self, value, holidays=None):
+        """Apply the offset.
+
+        :param value: The date/time or date/times. A ``DateTime`` is not changed; a new instance is returned.
+        :type value: datetime | DateTime | list[datetime] | DateTimeArray
+
+        :param holidays: Holidays or other time off, for business days.
+        :type holidays: list[date] | HolidayCalendar
+
+        :returns: A value of the same type; a list for a list or tuple.
+
+        """
+        # A DateTimeArray can only have been created once its module (and NumPy) was imported.
+        arrays = sys.modules.get(ARRAYS_MODULE)
+        if arrays is not None and isinstance(value, arrays.DateTimeArray):
+            return self._apply_array(value, holidays)
+        elif isinstance(value, DateTime):
+            return DateTime(self._apply_dt(value.dt, holidays))
+        elif isinstance(value, (list, tuple)):
+            return [self.apply(v, holidays=holidays) for v in value]
+
+        return self._apply_dt(value, holidays)
+
+    def _apply_array(self, values, holidays):
+        """Apply each step to an array."""
+        import numpy as np
+        from .arrays import DateTimeArray
+
+        for step, args in self.steps:
+            if step == "amount":
+                values = values.increment(holidays=holidays, **args)
+            elif step == "boundary":
+                boundary, period = args
+                if period == "week":
+                    values = get_week_boundaries(values, boundary, self.start_day)
+                else:
+                    values = getattr(values, "%s_of_%s_dt" % (boundary, period))()
+            elif step == "time":
+                days = values.values.astype("datetime64[D]")
+                values = DateTimeArray(days + np.timedelta64(args, "us"), timezone=values.timezone)
+            else:
+                values = get_weekdays(values, *args)
+
+        return values
+
+    def _apply_dt(self, dt, holidays):
+        """Apply each step to a date/time."""
+        for step, args in self.steps:
+            if step == "amount":
+                dt = increment(dt, holidays=holidays, **args)
+            elif step == "boundary":
+                boundary, period = args
+                if period == "week":
+                    week = Week(dt, start_day=self.start_day)
+                    dt = week.start_dt if boundary == "start" else week.end_dt
+                else:
+                    dt = getattr(DateTime(dt), "%s_of_%s_dt" % (boundary, period))()
+            elif step == "time":
+                dt = set_time_of_day(dt, args)
+            else:
+                direction, weekday, time_of_day = args
+                if direction > 0:
+                    start_dt = Week(dt, start_day=weekday).next().start_dt
+                else:
+                    start_dt = Week(dt - timedelta(days=1), start_day=weekday).start_dt
+
+                dt = dt.replace(year=start_dt.year, month=start_dt.month, day=start_dt.day)
+                if time_of_day is not None:
+                    dt = set_time_of_day(dt, time_of_day)
+
+        return dt
+
+# Functions
+
+
+def compile_offset(expression, start_day=MONDAY):
+    """Get the compiled offset for an expression. See :py:class:`Offset`.
+
+    :param expression: The expression, such as ``+3 business days``.
+    :type expression: str
+
+    :param start_day: The ISO weekday that starts a week.
+    :type start_day: int
+
+    :rtype: Offset
+
+    :raise: ValueError
+    :raises: ``ValueError`` when the expression may not be parsed.
+
+    """
+    return OFFSET_CACHE.get_or_set((expression, start_day), lambda: Offset(expression, start_day=start_day))
+
+
+def get_time_of_day(match):
+    """Get the time of day matched by a pattern as microseconds from midnight.
+
+    :param match: A match of ``TIME_PATTERN`` or ``WEEKDAY_PATTERN``.
+
+    :rtype: int | None
+
+    :raise: ValueError
+
+    """
+    if match.group("hour") is None:
+        return None
+
+    hour = int(match.group("hour"))
+    minute = int(match.group("minute"))
+    second = int(match.group("second") or 0)
+    if hour > 23 or minute > 59 or second > 59:
+        raise ValueError("Invalid time of day: %s" % match.group(0))
+
+    return ((hour * 60 + minute) * 60 + second) * 1000000
+
+
+def get_week_boundaries(values, boundary, start_day):
+    """Get the start or end of the week of each date/time. See the ``start_dt`` and ``end_dt`` of :py:class:`Week`.
+
+    :param values: The date/times.
+    :type values: DateTimeArray
+
+    :param boundary: ``start`` or ``end``.
+    :type boundary: str
+
+    :param start_day: The ISO weekday that starts a week.
+    :type start_day: int
+
+    :rtype: DateTimeArray
+
+    """
+    import numpy as np
+    from .arrays import DateTimeArray
+
+    days = values.values.astype("datetime64[D]")
+
+    # The epoch (1970-01-01) is a Thursday.
+    isoweekday = (days.astype("int64") + 3) % DAYS_PER_WEEK + 1
+    start_days = days - (isoweekday - start_day) % DAYS_PER_WEEK
+
+    if boundary == "start":
+        return DateTimeArray(start_days.astype("datetime64[us]"), timezone=values.timezone)
+
+    end = np.timedelta64(6, "D") + np.timedelta64(23 * 3600 + 59 * 60 + 59, "s")
+    return DateTimeArray(start_days + end, timezone=values.timezone)
+
+
+def get_weekdays(values, direction, weekday, time_of_day):
+    """Get the next (or last) given weekday of each date/time.
+
+    :param values: The date/times.
+    :type values: DateTimeArray
+
+    :param direction: ``1`` for the next weekday, or ``-1`` for the last.
+    :type direction: int
+
+    :param weekday: The ISO weekday.
+    :type weekday: int
+
+    :param time_of_day: Microseconds from midnight, or ``None`` to keep the time of day.
+    :type time_of_day: int
+
+    :rtype: DateTimeArray
+
+    """
+    import numpy as np
+    from .arrays import DateTimeArray
+
+    days = values.values.astype("datetime64[D]")
+    isoweekday = (days.astype("int64") + 3) % DAYS_PER_WEEK + 1
+
+    if direction > 0:
+        target = days + (weekday - isoweekday - 1) % DAYS_PER_WEEK + 1
+    else:
+        target = days - (isoweekday - weekday - 1) % DAYS_PER_WEEK - 1
+
+    if time_of_day is None:
+        result = target + (values.values - days)
+    else:
+        result = target + np.timedelta64(time_of_day, "us")
+
+    return DateTimeArray(result, timezone=values.timezone)
+
+
+def normalize(expression):
+    """Normalize the case and whitespace of an expression.
+
+    :param expression: The expression.
+    :type expression: str
+
+    :rtype: str
+
+    """
+    return " ".join(expression.lower().split())
+
+
+def parse_step(text, expression):
+    """Parse a single step of an expression.
+
+    :param text: The normalized text of the step.
+    :type text: str
+
+    :param expression: The whole expression, for error messages.
+    :type expression: str
+
+    :rtype: tuple
+    :returns: The name of the step and its arguments.
+
+    :raise: ValueError
+
+    """
+    match = AMOUNT_PATTERN.match(text)
+    if match is not None:
+        number = int(match.group("number"))
+        if match.group("sign") == "-":
+            number = -number
+
+        unit = match.group("unit").replace(" ", "_")
+        if not unit.endswith("s"):
+            unit += "s"
+
+        if unit == "quarters":
+            unit, number = "months", number * MONTHS_PER_YEAR // 4
+
+        return "amount", {unit: number}
+
+    match = BOUNDARY_PATTERN.match(text)
+    if match is not None:
+        return "boundary", (match.group("boundary"), match.group("period"))
+
+    match = TIME_PATTERN.match(text)
+    if match is not None:
+        return "time", get_time_of_day(match)
+
+    match = WEEKDAY_PATTERN.match(text)
+    if match is not None:
+        direction = 1 if match.group("direction") == "next" else -1
+        return "weekday", (direction, WEEKDAYS[match.group("weekday")], get_time_of_day(match))
+
+    raise ValueError("Invalid offset expression: %r" % expression)
+
+
+def set_time_of_day(dt, time_of_day):
+    """Set the time of day of a date/time.
+
+    :param dt: The date/time.
+    :type dt: datetime
+
+    :param time_of_day: Microseconds from midnight.
+    :type time_of_day: int
+
+    :rtype: datetime
+
+    """
+    seconds, microsecond = divmod(time_of_day, 1000000)
+    minutes, second = divmod(seconds, 60)
+    hour, minute = divmod(minutes, 60)
+
+    return dt.replace(hour=hour, minute=minute, second=second, microsecond=microsecond)
@@ -0,0 +1,328 @@
+"""
+The scheduler module computes the next run times for recurring jobs. Jobs are held in a min-heap ordered by the
+date/time they are next due, so that only the jobs which have actually fired are recomputed on each tick.
+
+.. code-block:: python
+
+    from datetime_machine import Job, Scheduler
+
+    scheduler = Scheduler()
+    scheduler.add(Job("hourly-report", hours=1))
+    scheduler.add(Job("month-end", anchor="month", business_days=-1))
+
+    for job in scheduler.pop_due(now):
+        print(job.name, job.due_dt)
+
+"""
+# Imports
+
+from datetime import datetime, timedelta
+import heapq
+import itertools
+from .constants import MONDAY, UTC
+from .library import Month, Week, Year
+from .utils import increment
+
+# Exports
+
+__all__ = (
+    "Job",
+    "Scheduler",
+)
+
+# Constants
+
+ANCHORS = ("month", "week", "year")
+
+# The date/time against which the interval of a job is checked.
+REFERENCE_DT = datetime(2000, 1, 3)
+
+# Classes
+
+
+class Job(object):
+    """A recurring specification.
+
+    A job recurs by an interval (``days``, ``hours``, ``months``, and so on), by a number of business days, or from the
+    start of each month, week, or year. When an anchor is given, the interval and business days are applied as an
+    offset from the start of the period; a positive number of business days counts the start of the period as the first
+    (when it is a business day), and a negative number counts back from the end of the previous period.
+
+    .. code-block:: python
+
+        # Every 15 minutes.
+        Job("poll", minutes=15)
+
+        # Every 5 business days, skipping holidays.
+        Job("invoice", business_days=5, holidays=holidays)
+
+        # The 3rd business day of each month.
+        Job("payroll", anchor="month", business_days=3)
+
+        # The last business day of each month.
+        Job("month-end", anchor="month", business_days=-1)
+
+    """
+
+    def __init__(self, name, anchor=None, business_days=0, holidays=None, start_day=MONDAY, start_dt=None, **kwargs):
+        """Initialize a job.
+
+        :param name: The name of the job.
+        :type name: str
+
+        :param anchor: The period to which the job is anchored; ``month``, ``week``, or ``year``.
+        :type anchor: str
+
+        :param business_days: The number of business days between runs, or the offset from the anchor.
+        :type business_days: int
+
+        :param holidays: Holidays or other time off.
+        :type holidays: list
+
+        :param start_day: The ISO weekday that starts a week when the anchor is ``week``.
+        :type start_day: int
+
+        :param start_dt: The date/time of the first run. If omitted, the first run is computed when the job is added to
+                         a scheduler.
+        :type start_dt: datetime
+
+        The remaining keyword arguments are passed to :py:func:`increment` to compute the interval.
+
+        :raise: ValueError
+        :raises: ``ValueError`` when the anchor is invalid or the job would never advance.
+
+        """
+        if anchor is not None and anchor not in ANCHORS:
+            raise ValueError("Invalid anchor (%s), must be one of: %s" % (anchor, ", ".join(ANCHORS)))
+
+        if anchor is None and not business_days and not any(kwargs.values()):
+            raise ValueError("A job requires an anchor, business days, or an interval.")
+
+        if anchor is None and increment(REFERENCE_DT, business_days=business_days, **kwargs) <= REFERENCE_DT:
+            raise ValueError("The interval of a job must be positive.")
+
+        self.anchor = anchor
+        self.business_days = business_days
+        self.due_dt = None
+        self.holidays = holidays
+        self.interval = kwargs
+        self.name = name
+        self.next_dt = None
+        self.start_day = start_day
+        self.start_dt = start_dt
+
+    def __repr__(self):
+        return "<%s %s>" % (self.__class__.__name__, self.name)
+
+    def get_next_dt(self, dt):
+        """Get the date/time at which the job is next due after the given date/time.
+
+        :param dt: The date/time after which the job should run.
+        :type dt: datetime
+
+        :rtype: datetime
+        :returns: A date/time that is always after ``dt``.
+
+        """
+        if self.anchor is None:
+            return increment(dt, business_days=self.business_days, holidays=self.holidays, **self.interval)
+
+        # The offset of a period may fall before it (or in a later one), so step until it is after the date/time.
+        period = self._get_period(dt)
+        next_dt = self._get_offset_dt(period.start_dt)
+        while next_dt <= dt:
+            period = period.next()
+            next_dt = self._get_offset_dt(period.start_dt)
+
+        return next_dt
+
+    def _get_offset_dt(self, start_dt):
+        """Apply the interval and business days to the start of an anchored period."""
+        if self.business_days > 0:
+            # Count from the day before, so that the start of the period is the first business day.
+            start_dt -= timedelta(days=1)
+
+        return increment(start_dt, business_days=self.business_days, holidays=self.holidays, **self.interval)
+
+    def _get_period(self, dt):
+        """Get the anchored period for the given date/time."""
+        if self.anchor == "month":
+            return Month(dt)
+        elif self.anchor == "week":
+            return Week(dt, start_day=self.start_day)
+        else:
+            return Year(dt)
+
+
+class Scheduler(object):
+    """Holds recurring jobs in a min-heap of next due date/times.
+
+    Only jobs that have fired are recomputed, so a tick costs ``O(k log n)`` for ``k`` due jobs rather than
+    ``O(n)`` for the full set.
+
+    """
+
+    def __init__(self, jobs=None, now=None):
+        """Initialize the scheduler.
+
+        :param jobs: Jobs to be added immediately.
+        :type jobs: list[Job]
+
+        :param now: The current date/time used to compute the first run of jobs without a ``start_dt``.
+        :type now: datetime
+
+        """
+        self._counter = itertools.count()
+        self._entries = dict()
+        self._heap = list()
+
+        if jobs:
+            for job in jobs:
+                self.add(job, now=now)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, job, now=None):
+        """Add a job to the scheduler.
+
+        :param job: The job to be added.
+        :type job: Job
+
+        :param now: The current date/time. Used only when the job has no ``start_dt``. Defaults to the current time.
+        :type now: datetime
+
+        :rtype: datetime
+        :returns: The date/time at which the job is first due.
+
+        """
+        if job.start_dt is not None:
+            next_dt = job.start_dt
+        else:
+            next_dt = job.get_next_dt(now or get_current_dt())
+
+        self._push(next_dt, job)
+
+        return next_dt
+
+    def peek(self):
+        """Get the date/time of the next job to become due.
+
+        :rtype: datetime | None
+        :returns: The next due date/time, or ``None`` if there are no jobs.
+
+        """
+        self._prune()
+        if not self._heap:
+            return None
+
+        return self._heap[0][0]
+
+    def pop_due(self, now=None):
+        """Get the jobs that are due and schedule their next run.
+
+        :param now: The current date/time. Defaults to the current time.
+        :type now: datetime
+
+        :rtype: list[Job]
+
+        .. note::
+            Runs missed because ``pop_due()`` was not called in time are coalesced; a job is returned at most once per
+            call and is rescheduled for the first run after ``now``. The run being reported is available as
+            ``job.due_dt``.
+
+        """
+        if now is None:
+            now = get_current_dt()
+
+        due = list()
+        self._prune()
+        while self._heap and self._heap[0][0] <= now:
+            due_dt, _, job = heapq.heappop(self._heap)
+            if job is None:
+                continue
+
+            next_dt = job.get_next_dt(due_dt)
+            while next_dt <= now:
+                next_dt = job.get_next_dt(next_dt)
+
+            job.due_dt = due_dt
+            self._push(next_dt, job)
+            due.append(job)
+
+        return due
+
+    def remove(self, job):
+        """Remove a job from the scheduler.
+
+        :param job: The job to be removed.
+        :type job: Job
+
+        .. note::
+            Removal is lazy; the heap entry is discarded when it reaches the top of the heap.
+
+        """
+        entry = self._entries.pop(id(job), None)
+        if entry is not None:
+            entry[-1] = None
+
+    async def run(self, clock=None, max_sleep=60):
+        """Asynchronously yield jobs as they become due.
+
+        .. code-block:: python
+
+            async for job in scheduler.run():
+                await handle(job)
+
+        :param clock: A callable returning the current date/time. Defaults to the current time in UTC.
+        :type clock: callable
+
+        :param max_sleep: The maximum number of seconds to sleep between checks, so that jobs added while sleeping are
+                          noticed.
+        :type max_sleep: int | float
+
+        The generator stops when no jobs remain.
+
+        """
+        # asyncio is slow to import, and is only needed to run the scheduler.
+        import asyncio
+
+        if clock is None:
+            clock = get_current_dt
+
+        while True:
+            now = clock()
+            for job in self.pop_due(now):
+                yield job
+
+            next_dt = self.peek()
+            if next_dt is None:
+                return
+
+            seconds = (next_dt - clock()).total_seconds()
+            await asyncio.sleep(min(max(seconds, 0), max_sleep))
+
+    def _prune(self):
+        """Discard removed jobs from the top of the heap."""
+        while self._heap and self._heap[0][-1] is None:
+            heapq.heappop(self._heap)
+
+    def _push(self, next_dt, job):
+        """Add (or replace) a job on the heap. The counter breaks ties so that jobs themselves are never compared."""
+        self.remove(job)
+
+        entry = [next_dt, next(self._counter), job]
+        self._entries[id(job)] = entry
+        job.next_dt = next_dt
+        heapq.heappush(self._heap, entry)
+
+# Functions
+
+
+def get_current_dt():
+    """Get the current date/time in UTC.
+
+    :rtype: datetime
+
+    """
+    return datetime.now(UTC)
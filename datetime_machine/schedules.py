@@ -0,0 +1,320 @@
+"""
+The schedules module generates periodic schedules of dates, such as the billing dates of a contract or the coupon dates
+of a bond.
+
+.. code-block:: python
+
+    from datetime_machine import Schedule, schedule_many
+
+    # Every 3 months from January 31st, keeping to the end of the month, with a short stub at the end.
+    schedule = Schedule(datetime(2021, 1, 31), datetime(2022, 3, 15), months=3, end_of_month=True,
+                        convention="modified_following", holidays=holidays)
+    for dt in schedule:
+        print(dt)
+
+    # The same for thousands of contracts at once.
+    indices, dates = schedule_many(starts, ends, months=3, end_of_month=True)
+
+A schedule begins with its start and ends with its end. The regular dates between them are counted from one end, so that
+any short (stub) period falls at the other; by default they are counted from the start, and the stub is at the end.
+
+Every regular date is computed from the first by integer month arithmetic, rather than by stepping from the previous
+date, so the day of the month does not drift after a short month; the quarterly dates from January 31st are April 30th,
+July 31st, and October 31st. The day is clamped to the end of shorter months. With the end of month rule, a schedule
+that is counted from the last day of a month falls on the last day of every month.
+
+Dates may then be adjusted to business days by one of the conventions of :py:func:`roll`.
+
+"""
+# Imports
+
+from .arrays import DateTimeArray
+from .constants import MONTHS_PER_YEAR
+from .library import DateTimeRange, to_datetime
+from .utils import ROLL_CONVENTIONS, add_months, get_days_in_month, roll_many
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Exports
+
+__all__ = (
+    "Schedule",
+    "schedule_many",
+)
+
+# Constants
+
+# Where the short period of a schedule may fall.
+STUBS = ("end", "start")
+
+# Classes
+
+
+class Schedule(object):
+    """A periodic schedule of dates."""
+
+    def __init__(self, start_dt, end_dt, months=None, years=None, end_of_month=False, convention=None, holidays=None,
+                 stub="end"):
+        """Generate a schedule.
+
+        :param start_dt: The start of the schedule.
+        :type start_dt: datetime | DateTime
+
+        :param end_dt: The end of the schedule.
+        :type end_dt: datetime | DateTime
+
+        :param months: The number of months between regular dates. Defaults to ``1`` when no years are given.
+        :type months: int
+
+        :param years: The number of years between regular dates, added to the months.
+        :type years: int
+
+        :param end_of_month: Whether the regular dates fall on the last day of each month when counted from the last
+                             day of a month.
+        :type end_of_month: bool
+
+        :param convention: The convention by which dates are adjusted to business days. See :py:func:`roll`. By
+                           default, dates are not adjusted.
+        :type convention: str
+
+        :param holidays: Holidays or other time off, for the convention.
+        :type holidays: list[date] | HolidayCalendar | HolidayRules
+
+        :param stub: ``end`` to count regular dates from the start, leaving any short period at the end, or ``start``
+                     to count them back from the end.
+        :type stub: str
+
+        :raise: ValueError
+        :raises: ``ValueError`` for an invalid frequency, convention, or stub, or when the end is not after the start.
+
+        """
+        self.convention = convention
+        self.end_dt = to_datetime(end_dt, strict=True)
+        self.end_of_month = end_of_month
+        self.holidays = holidays
+        self.months = get_step(months, years, convention, stub)
+        self.start_dt = to_datetime(start_dt, strict=True)
+        self.stub = stub
+
+        if self.end_dt <= self.start_dt:
+            raise ValueError("The end of a schedule must be after its start: %s <= %s" % (self.end_dt, self.start_dt))
+
+        self._dates = None
+
+    def __iter__(self):
+        return iter(self.get_dates())
+
+    def __len__(self):
+        return len(self.get_dates(adjusted=False))
+
+    def get_dates(self, adjusted=True):
+        """Get the dates of the schedule, from the start to the end.
+
+        :param adjusted: Whether dates are adjusted by the convention.
+        :type adjusted: bool
+
+        :rtype: list[datetime]
+
+        """
+        if self._dates is None:
+            self._dates = self._generate()
+
+        if not adjusted or self.convention is None:
+            return list(self._dates)
+
+        return roll_many(self._dates, convention=self.convention, holidays=self.holidays)
+
+    def get_periods(self, adjusted=True):
+        """Get the periods between consecutive dates of the schedule.
+
+        :param adjusted: Whether dates are adjusted by the convention.
+        :type adjusted: bool
+
+        :rtype: list[DateTimeRange]
+
+        """
+        dates = self.get_dates(adjusted=adjusted)
+        return [DateTimeRange(start_dt, end_dt) for start_dt, end_dt in zip(dates[:-1], dates[1:])]
+
+    def _generate(self):
+        """Generate the unadjusted dates in a single pass."""
+        if self.stub == "end":
+            anchor, other, sign = self.start_dt, self.end_dt, 1
+        else:
+            anchor, other, sign = self.end_dt, self.start_dt, -1
+
+        end_of_month = self.end_of_month and anchor.day == get_days_in_month(anchor.month, year=anchor.year)
+
+        regular = list()
+        count = 1
+        while True:
+            dt = get_schedule_date(anchor, sign * count * self.months, end_of_month)
+            if (dt >= other) if sign > 0 else (dt <= other):
+                break
+
+            regular.append(dt)
+            count += 1
+
+        if sign < 0:
+            regular.reverse()
+
+        return [self.start_dt] + regular + [self.end_dt]
+
+# Functions
+
+
+def get_month_lengths(months):
+    """Get the number of days in each month.
+
+    :param months: The months, as counts since the epoch.
+    :type months: numpy.ndarray
+
+    :rtype: numpy.ndarray
+
+    """
+    first = months.astype("datetime64[M]").astype("datetime64[D]")
+    following = (months + 1).astype("datetime64[M]").astype("datetime64[D]")
+    return (following - first).astype("int64")
+
+
+def get_schedule_date(anchor, months, end_of_month=False):
+    """Get a date of a schedule from the date from which it is counted.
+
+    :param anchor: The date from which the schedule is counted.
+    :type anchor: datetime
+
+    :param months: The number of months from the anchor, which may be negative.
+    :type months: int
+
+    :param end_of_month: Whether the date falls on the last day of the month.
+    :type end_of_month: bool
+
+    :rtype: datetime
+
+    """
+    dt = add_months(anchor, months)
+    if end_of_month:
+        return dt.replace(day=get_days_in_month(dt.month, year=dt.year))
+
+    return dt
+
+
+def get_step(months, years, convention, stub):
+    """Validate the arguments of a schedule and get the number of months between regular dates.
+
+    :param months: The number of months between regular dates.
+    :type months: int
+
+    :param years: The number of years between regular dates.
+    :type years: int
+
+    :param convention: The convention by which dates are adjusted, if any.
+    :type convention: str
+
+    :param stub: Where the short period falls.
+    :type stub: str
+
+    :rtype: int
+
+    :raise: ValueError
+
+    """
+    if months is None and years is None:
+        months = 1
+
+    step = (months or 0) + (years or 0) * MONTHS_PER_YEAR
+    if step != int(step) or step < 1:
+        raise ValueError("The frequency of a schedule must be a positive whole number of months: %s" % step)
+
+    if convention is not None and convention not in ROLL_CONVENTIONS:
+        raise ValueError("Invalid convention (%s), must be one of: %s" % (convention, ", ".join(ROLL_CONVENTIONS)))
+
+    if stub not in STUBS:
+        raise ValueError("Invalid stub (%s), must be one of: %s" % (stub, ", ".join(STUBS)))
+
+    return int(step)
+
+
+def schedule_many(starts, ends, months=None, years=None, end_of_month=False, convention=None, holidays=None,
+                  stub="end"):
+    """Generate the schedules of many contracts at once. See :py:class:`Schedule`.
+
+    .. code-block:: python
+
+        indices, dates = schedule_many(starts, ends, months=3)
+        first_contract = dates[indices == 0]
+
+    :param starts: The start of each schedule.
+    :type starts: list[datetime] | DateTimeArray
+
+    :param ends: The end of each schedule. These are converted to the timezone of the starts.
+    :type ends: list[datetime] | DateTimeArray
+
+    The remaining arguments are shared by every schedule, as for :py:class:`Schedule`.
+
+    :rtype: tuple(numpy.ndarray, DateTimeArray)
+    :returns: The index of the contract of each date, and the dates; sorted by contract and then by date.
+
+    :raise: ValueError
+    :raises: ``ValueError`` for an invalid frequency, convention, or stub, when the number of starts and ends differ,
+             or when an end is not after its start.
+
+    The dates of every schedule are computed together with NumPy month arithmetic, without creating a ``datetime`` per
+    date.
+
+    """
+    step = get_step(months, years, convention, stub)
+
+    starts = DateTimeArray(starts)
+    ends = DateTimeArray(ends, timezone=starts.timezone)
+    if len(starts) != len(ends):
+        raise ValueError("The number of starts and ends must be the same: %s != %s" % (len(starts), len(ends)))
+
+    start_values = starts.values
+    end_values = ends.values
+    if np.any(end_values <= start_values):
+        raise ValueError("The end of a schedule must be after its start.")
+
+    if stub == "end":
+        anchors, others, sign = start_values, end_values, 1
+    else:
+        anchors, others, sign = end_values, start_values, -1
+
+    anchor_days = anchors.astype("datetime64[D]")
+    anchor_months = anchors.astype("datetime64[M]").astype("int64")
+    days = (anchor_days - anchors.astype("datetime64[M]").astype("datetime64[D]")).astype("int64") + 1
+    time_of_day = anchors - anchor_days
+    month_ends = days == get_month_lengths(anchor_months)
+
+    # Each schedule has at most this many regular dates, which are then filtered.
+    other_months = others.astype("datetime64[M]").astype("int64")
+    counts = np.abs(other_months - anchor_months) // step + 1
+    contracts = np.repeat(np.arange(len(starts)), counts)
+    steps = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + 1
+
+    regular_months = anchor_months[contracts] + sign * steps * step
+    lengths = get_month_lengths(regular_months)
+    if end_of_month:
+        regular_days = np.where(month_ends[contracts], lengths, np.minimum(days[contracts], lengths))
+    else:
+        regular_days = np.minimum(days[contracts], lengths)
+
+    regular = (regular_months.astype("datetime64[M]").astype("datetime64[D]") + (regular_days - 1)
+               + time_of_day[contracts])
+    if sign > 0:
+        keep = regular < others[contracts]
+    else:
+        keep = regular > others[contracts]
+
+    indices = np.concatenate((np.arange(len(starts)), contracts[keep], np.arange(len(ends))))
+    values = np.concatenate((start_values, regular[keep], end_values))
+    order = np.lexsort((values, indices))
+
+    dates = DateTimeArray(values[order], timezone=starts.timezone)
+    if convention is not None:
+        dates = dates.roll(convention=convention, holidays=holidays)
+
+    return indices[order], dates
@@ -0,0 +1,325 @@
+"""
+The series module aggregates time series into a contiguous spine of periods, such as for charts that must show every
+day of a range even when nothing happened on it.
+
+.. code-block:: python
+
+    from datetime_machine import DateTimeRange, resample
+
+    # The number of events on each day of January, including days without any.
+    counts = resample(timestamps, by="day", dt_range=DateTimeRange(datetime(2021, 1, 1), datetime(2021, 1, 31)))
+
+    # The total of each month.
+    for start_dt, total in resample(timestamps, amounts, by="month", aggregate="sum"):
+        print(start_dt, total)
+
+The spine is the start of each period from the start of the range to its end, from the boundaries of :py:class:`Week`,
+:py:class:`Month`, :py:class:`Quarter`, and :py:class:`Year`. Without a range, the spine covers the first to the last
+timestamp.
+
+Lists are aggregated in a single pass over the sorted timestamps, moving along the spine as they are consumed. NumPy
+arrays and :py:class:`DateTimeArray` instances are assigned to periods with ``numpy.searchsorted()`` and aggregated with
+ufuncs, without creating a ``datetime`` per timestamp; they need not be sorted.
+
+An empty period has a count and sum of ``0``, and a minimum, maximum, and mean of ``None``.
+
+.. note::
+    Periods are of the wall clock, as for :py:func:`truncate`. The timestamps of a list are taken as they are, and the
+    spine has the timezone of the start of the range (or of the first timestamp). The timestamps of an array and the
+    range are in the timezone of the array.
+
+"""
+# Imports
+
+from .arrays import DateTimeArray
+from .constants import MONDAY
+from .library import get_period_starts, to_datetime
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Exports
+
+__all__ = (
+    "resample",
+)
+
+# Constants
+
+AGGREGATES = ("count", "max", "mean", "min", "sum")
+
+PERIODS = ("day", "week", "month", "quarter", "year")
+
+# Functions
+
+
+def get_limit(dtype, sign):
+    """Get the largest (or smallest) value of a NumPy type, from which the extremes of a period are found.
+
+    :param dtype: The type.
+    :type dtype: numpy.dtype
+
+    :param sign: ``1`` for the largest value, or ``-1`` for the smallest.
+    :type sign: int
+
+    :rtype: int | float
+
+    """
+    if dtype.kind == "f":
+        return sign * np.inf
+
+    info = np.iinfo(dtype)
+    return info.max if sign > 0 else info.min
+
+
+def get_result(aggregate, count, total, extreme):
+    """Get the aggregate of a period from its running count, total, and extreme.
+
+    :param aggregate: The aggregate.
+    :type aggregate: str
+
+    :param count: The number of values.
+    :type count: int
+
+    :param total: The sum of the values.
+    :type total: int | float
+
+    :param extreme: The minimum or maximum value, if any.
+    :type extreme: int | float
+
+    :rtype: int | float | None
+
+    """
+    if aggregate == "count":
+        return count
+    elif aggregate == "sum":
+        return total
+    elif aggregate == "mean":
+        return total / count if count else None
+
+    return extreme
+
+
+def get_spine(start_dt, end_dt, by, start_day=MONDAY):
+    """Get the start of each period from the one that includes the start up to the one that includes the end.
+
+    :param start_dt: The start of the range.
+    :type start_dt: datetime
+
+    :param end_dt: The end of the range.
+    :type end_dt: datetime
+
+    :param by: The period; ``day``, ``week``, ``month``, ``quarter``, or ``year``.
+    :type by: str
+
+    :param start_day: The ISO weekday that starts a week.
+    :type start_day: int
+
+    :rtype: tuple(list[datetime], datetime)
+    :returns: The starts of the periods, and the start of the period that follows the last.
+
+    """
+    spine = list()
+    for dt in get_period_starts(start_dt, by, start_day=start_day):
+        if dt > end_dt:
+            return spine, dt
+
+        spine.append(dt)
+
+
+def resample(dts, values=None, by="day", dt_range=None, aggregate="count", start_day=MONDAY):
+    """Aggregate a time series into every period of a range.
+
+    :param dts: The timestamps. A list must be sorted.
+    :type dts: list[datetime | DateTime] | numpy.ndarray | DateTimeArray
+
+    :param values: The value of each timestamp. Required unless counting.
+    :type values: list[int | float] | numpy.ndarray
+
+    :param by: The period; ``day``, ``week``, ``month``, ``quarter``, or ``year``.
+    :type by: str
+
+    :param dt_range: The range of the spine. Timestamps outside of the periods of the range are ignored. Defaults to
+                     the first and last timestamps.
+    :type dt_range: DateTimeRange
+
+    :param aggregate: ``count``, ``sum``, ``mean``, ``min``, or ``max``.
+    :type aggregate: str
+
+    :param start_day: The ISO weekday that starts a week.
+    :type start_day: int
+
+    :rtype: list[tuple]
+    :returns: The start of each period and its aggregate.
+
+    :raise: ValueError
+    :raises: ``ValueError`` for an unknown period or aggregate, a missing value, or when a list is not sorted.
+
+    """
+    if by not in PERIODS:
+        raise ValueError("Invalid period (%s), must be one of: %s" % (by, ", ".join(PERIODS)))
+
+    if aggregate not in AGGREGATES:
+        raise ValueError("Not a valid aggregate: %s" % aggregate)
+
+    if values is None and aggregate != "count":
+        raise ValueError("Values are required to aggregate by %s." % aggregate)
+
+    if np is not None and isinstance(dts, (np.ndarray, DateTimeArray)):
+        return resample_array(DateTimeArray(dts), values, by, dt_range, aggregate, start_day)
+
+    return resample_list(dts, values, by, dt_range, aggregate, start_day)
+
+
+def resample_array(dts, values, by, dt_range, aggregate, start_day):
+    """Aggregate an array of timestamps. See :py:func:`resample`."""
+    timezone = dts.timezone
+    wall = dts.values
+
+    if dt_range is None:
+        if not len(wall):
+            return list()
+
+        start_dt = wall.min().astype(object)
+        end_dt = wall.max().astype(object)
+    else:
+        start_dt = to_wall_clock(dt_range.start.dt, timezone)
+        end_dt = to_wall_clock(dt_range.end.dt, timezone)
+
+    spine, following = get_spine(start_dt, end_dt, by, start_day=start_day)
+    edges = np.array(spine + [following], dtype="datetime64[us]")
+
+    index = np.searchsorted(edges, wall, side="right") - 1
+    mask = (index >= 0) & (index < len(spine))
+    index = index[mask]
+
+    counts = np.bincount(index, minlength=len(spine))
+    if aggregate == "count":
+        results = counts.tolist()
+    else:
+        values = np.asarray(values)[mask]
+        if aggregate in ("mean", "sum"):
+            totals = np.zeros(len(spine), dtype=np.result_type(values.dtype, np.int64))
+            np.add.at(totals, index, values)
+            if aggregate == "sum":
+                results = totals.tolist()
+            else:
+                results = [None if count == 0 else total / count for total, count in zip(totals.tolist(), counts)]
+        else:
+            if aggregate == "max":
+                ufunc, initial = np.maximum, get_limit(values.dtype, -1)
+            else:
+                ufunc, initial = np.minimum, get_limit(values.dtype, 1)
+
+            extrema = np.full(len(spine), initial, dtype=values.dtype)
+            ufunc.at(extrema, index, values)
+
+            results = [None if count == 0 else value for value, count in zip(extrema.tolist(), counts)]
+
+    return [(to_local(dt, timezone), result) for dt, result in zip(spine, results)]
+
+
+def resample_list(dts, values, by, dt_range, aggregate, start_day):
+    """Aggregate a sorted list of timestamps in a single pass. See :py:func:`resample`."""
+    dts = [to_datetime(dt, strict=True) for dt in dts]
+
+    if dt_range is None:
+        if not dts:
+            return list()
+
+        timezone = dts[0].tzinfo
+        start_dt = dts[0].replace(tzinfo=None)
+        end_dt = dts[-1].replace(tzinfo=None)
+    else:
+        timezone = dt_range.start.dt.tzinfo
+        start_dt = dt_range.start.dt.replace(tzinfo=None)
+        end_dt = dt_range.end.dt.replace(tzinfo=None)
+
+    spine, following = get_spine(start_dt, end_dt, by, start_day=start_day)
+    spine.append(following)
+
+    if values is None:
+        values = [None] * len(dts)
+
+    results = list()
+    position = 0
+    count = 0
+    total = 0
+    extreme = None
+    previous_dt = None
+    for dt, value in zip(dts, values):
+        if previous_dt is not None and dt < previous_dt:
+            raise ValueError("Timestamps must be sorted: %s is before %s" % (dt, previous_dt))
+
+        previous_dt = dt
+        dt = dt.replace(tzinfo=None)
+        if dt < spine[0]:
+            continue
+
+        while position < len(spine) - 1 and dt >= spine[position + 1]:
+            results.append(get_result(aggregate, count, total, extreme))
+            position += 1
+            count = 0
+            total = 0
+            extreme = None
+
+        if position == len(spine) - 1:
+            continue
+
+        count += 1
+        if aggregate in ("mean", "sum"):
+            total += value
+        elif aggregate == "max":
+            extreme = value if extreme is None or value > extreme else extreme
+        elif aggregate == "min":
+            extreme = value if extreme is None or value < extreme else extreme
+
+    while position < len(spine) - 1:
+        results.append(get_result(aggregate, count, total, extreme))
+        position += 1
+        count = 0
+        total = 0
+        extreme = None
+
+    return [(to_local(dt, timezone), result) for dt, result in zip(spine, results)]
+
+
+def to_local(dt, timezone):
+    """Attach a timezone to a wall clock date/time.
+
+    :param dt: The naive date/time.
+    :type dt: datetime
+
+    :param timezone: The timezone, if any.
+    :type timezone: tzinfo
+
+    :rtype: datetime
+
+    """
+    if timezone is None:
+        return dt
+
+    if hasattr(timezone, "localize"):
+        return timezone.localize(dt)
+
+    return dt.replace(tzinfo=timezone)
+
+
+def to_wall_clock(dt, timezone):
+    """Get the naive wall clock of a date/time in a timezone.
+
+    :param dt: The date/time.
+    :type dt: datetime
+
+    :param timezone: The timezone, if any. A naive date/time is assumed to already be in it.
+    :type timezone: tzinfo
+
+    :rtype: datetime
+
+    """
+    if dt.tzinfo is not None and timezone is not None:
+        dt = dt.astimezone(timezone)
+
+    return dt.replace(tzinfo=None)
@@ -5,25 +5,236 @@ these.
 """
 # Imports
 
+from array import array
+from bisect import bisect_right
 import calendar
+from datetime import date, datetime, timedelta
 from dateutil.relativedelta import relativedelta
-from .constants import SATURDAY, SUNDAY
+import pytz
+from .cache import Cache
+from .constants import MICROSECONDS_PER_SECOND, MONDAY, MONTHS_PER_YEAR, SATURDAY, SECONDS_PER_DAY, SUNDAY
+from .holidays import HolidayRules
 from .variables import CURRENT_YEAR, DAYS_PER_MONTH
 
 # Exports
 
 __all__ = (
+    "count_business_days",
+    "diff",
     "get_days_in_month",
+    "get_fiscal_year",
+    "get_quarter",
+    "get_timedelta",
+    "get_timezone",
     "get_year_range",
     "increment",
     "is_business_day",
     "is_holiday",
     "is_leap_year",
+    "roll",
+    "roll_many",
+    "truncate",
+    "truncate_many",
 )
 
+# Constants
+
+# Month numbers accepted by get_days_in_month(). Membership in a range is constant time.
+VALID_MONTHS = range(1, MONTHS_PER_YEAR + 1)
+
+# Keyword arguments to increment() that may be applied with a timedelta instead of a relativedelta.
+TIMEDELTA_KEYS = ("days", "hours", "microseconds", "minutes", "seconds", "weeks")
+
+# Units of diff(), largest first.
+DIFF_UNITS = ("years", "months", "weeks", "days", "hours", "minutes", "seconds", "microseconds", "business_days")
+
+# The sorted ordinals of the holidays that fall on weekdays, by holidays.
+HOLIDAY_ORDINAL_CACHE = Cache("holiday_ordinals", max_size=64)
+
+# Conventions of roll().
+ROLL_CONVENTIONS = ("following", "modified_following", "preceding", "modified_preceding")
+
+# The distances to the next and previous business day from each day of a year, by holidays and year.
+ROLL_CACHE = Cache("roll_tables", max_size=1024)
+
+# The number of days before and after a year that are checked when computing its roll tables. Longer runs of days off
+# are stepped through one day at a time.
+ROLL_MARGIN = 31
+
+# Modes of truncate().
+TRUNCATE_MODES = ("ceil", "floor", "round")
+
+# Units of truncate() that are a whole number of months.
+UNIT_MONTHS = {
+    'month': 1,
+    'quarter': 3,
+    'year': MONTHS_PER_YEAR,
+}
+
+# Units of truncate() that are a fixed number of microseconds.
+UNIT_MICROSECONDS = {
+    'microsecond': 1,
+    'second': MICROSECONDS_PER_SECOND,
+    'minute': 60 * MICROSECONDS_PER_SECOND,
+    'hour': 3600 * MICROSECONDS_PER_SECOND,
+    'day': SECONDS_PER_DAY * MICROSECONDS_PER_SECOND,
+    'week': 7 * SECONDS_PER_DAY * MICROSECONDS_PER_SECOND,
+}
+
+# Timezones by name.
+TIMEZONE_CACHE = Cache("timezones", max_size=512)
+
 # Functions
 
 
+def add_months(dt, months):
+    """Add months to a date/time, clamping the day to the end of the month as ``relativedelta`` does.
+
+    :param dt: The date/time.
+    :type dt: datetime
+
+    :param months: The number of months, which may be negative.
+    :type months: int
+
+    :rtype: datetime
+
+    """
+    index = dt.year * MONTHS_PER_YEAR + dt.month - 1 + months
+    year, month = divmod(index, MONTHS_PER_YEAR)
+    month += 1
+
+    return dt.replace(year=year, month=month, day=min(dt.day, get_days_in_month(month, year=year)))
+
+
+def count_business_days(start_dt, end_dt, holidays=None):
+    """Count the business days by which :py:func:`increment` moves from the start date toward the end date.
+
+    Going forward, these are the business days after the start up to and including the end. Going backward, they are
+    the business days from the end up to (not including) the start, since ``increment()`` steps back from the day
+    before the start. Either way, ``increment(start_dt, business_days=count)`` falls on the end date when it is a
+    business day, and otherwise on the last business day short of it.
+
+    :param start_dt: The starting date/time.
+    :type start_dt: date | datetime
+
+    :param end_dt: The ending date/time.
+    :type end_dt: date | datetime
+
+    :param holidays: Holidays or other time off.
+    :type holidays: list[date] | set[date] | HolidayCalendar | HolidayRules
+
+    :rtype: int
+    :returns: The number of business days, which is negative when the end is before the start.
+
+    """
+    start = start_dt.toordinal()
+    end = end_dt.toordinal()
+    sign = 1
+    if end < start:
+        start, end, sign = end - 1, start - 1, -1
+
+    # Days are counted after the start up to and including the end. Whole weeks contain 5 business days, and the
+    # remaining days are checked one by one. Ordinal 1 is a Monday.
+    weeks, extra = divmod(end - start, 7)
+    count = weeks * 5
+    for ordinal in range(end - extra + 1, end + 1):
+        if (ordinal - 1) % 7 + 1 not in (SATURDAY, SUNDAY):
+            count += 1
+
+    if holidays:
+        if isinstance(holidays, HolidayRules):
+            # Rules have no last year, so only the holidays within the span are generated.
+            ordinals = set(value.toordinal() for value in holidays.between(date.fromordinal(start + 1),
+                                                                         date.fromordinal(max(end, 1))))
+            count -= len([ordinal for ordinal in ordinals if (ordinal - 1) % 7 + 1 not in (SATURDAY, SUNDAY)])
+        else:
+            ordinals = get_holiday_ordinals(holidays)
+            count -= bisect_right(ordinals, end) - bisect_right(ordinals, start)
+
+    return sign * count
+
+
+def diff(start_dt, end_dt, units=("years", "months", "days"), holidays=None):
+    """Get the calendar difference between two date/times, as ``relativedelta(end_dt, start_dt)`` would.
+
+    .. code-block:: python
+
+        diff(datetime(2019, 1, 31), datetime(2021, 3, 1), units=("years", "months", "days", "business_days"))
+        # {'years': 2, 'months': 1, 'days': 1, 'business_days': 542}
+
+    :param start_dt: The starting date/time.
+    :type start_dt: datetime
+
+    :param end_dt: The ending date/time. An aware date/time is converted to the timezone of the start.
+    :type end_dt: datetime
+
+    :param units: The units of the result; any of ``years``, ``months``, ``weeks``, ``days``, ``hours``,
+                  ``minutes``, ``seconds``, ``microseconds``, and ``business_days``. The difference is expressed in
+                  the given calendar units from largest to smallest, and whatever is smaller than the smallest unit is
+                  dropped. Business days are counted separately with :py:func:`count_business_days`.
+    :type units: tuple[str]
+
+    :param holidays: Holidays or other time off, for business days.
+    :type holidays: list[date] | set[date] | HolidayCalendar
+
+    :rtype: dict
+    :returns: The number of each unit, which is negative when the end is before the start.
+
+    :raise: ValueError
+    :raises: ``ValueError`` for an unknown unit.
+
+    """
+    for unit in units:
+        if unit not in DIFF_UNITS:
+            raise ValueError("Not a valid unit: %s" % unit)
+
+    if start_dt.tzinfo is not None and end_dt.tzinfo is not None:
+        end_dt = end_dt.astimezone(start_dt.tzinfo)
+
+    start_dt = start_dt.replace(tzinfo=None)
+    end_dt = end_dt.replace(tzinfo=None)
+
+    result = dict()
+
+    # Whole months (or years) first, stepping back once when the day of the month has not yet been reached.
+    shifted_dt = start_dt
+    if "months" in units or "years" in units:
+        step = 1 if "months" in units else MONTHS_PER_YEAR
+        months = (end_dt.year - start_dt.year) * MONTHS_PER_YEAR + end_dt.month - start_dt.month
+        months = int(months / step) * step
+
+        shifted_dt = add_months(start_dt, months)
+        if end_dt >= start_dt and shifted_dt > end_dt:
+            months -= step
+            shifted_dt = add_months(start_dt, months)
+        elif end_dt < start_dt and shifted_dt < end_dt:
+            months += step
+            shifted_dt = add_months(start_dt, months)
+
+        if "years" in units:
+            result['years'] = int(months / MONTHS_PER_YEAR)
+            months -= result['years'] * MONTHS_PER_YEAR
+
+        if "months" in units:
+            result['months'] = months
+
+    # Then fixed units, truncated toward zero.
+    remainder = end_dt - shifted_dt
+    remainder = ((remainder.days * SECONDS_PER_DAY + remainder.seconds) * MICROSECONDS_PER_SECOND
+                 + remainder.microseconds)
+    sign = -1 if remainder < 0 else 1
+    remainder = abs(remainder)
+    for unit in DIFF_UNITS[2:-1]:
+        if unit in units:
+            result[unit], remainder = divmod(remainder, UNIT_MICROSECONDS[unit[:-1]])
+            result[unit] *= sign
+
+    if "business_days" in units:
+        result['business_days'] = count_business_days(start_dt, end_dt, holidays=holidays)
+
+    return result
+
+
 def get_days_in_month(month, year=CURRENT_YEAR):
     """Get the days in a given month.
 
@@ -36,15 +247,292 @@ def get_days_in_month(month, year=CURRENT_YEAR):
     :rtype: int
 
     """
-    days_per_month = DAYS_PER_MONTH.copy()
-    if is_leap_year(year):
-        days_per_month[1] = (2, 29)
+    if month not in VALID_MONTHS:
+        raise ValueError("Not a valid month number: %s" % month)
+
+    if month == 2 and is_leap_year(year):
+        return 29
+
+    return DAYS_PER_MONTH[month - 1][1]
+
+
+def get_fiscal_year(dt, fiscal_start=1):
+    """Get the fiscal year of a date/time. The fiscal year is named for the calendar year in which it ends.
+
+    :param dt: The date/time to be evaluated.
+    :type dt: date | datetime
+
+    :param fiscal_start: The month number that begins the fiscal year.
+    :type fiscal_start: int
+
+    :rtype: int
+
+    """
+    if fiscal_start == 1 or dt.month < fiscal_start:
+        return dt.year
+
+    return dt.year + 1
+
+
+def get_quarter(month, fiscal_start=1):
+    """Get the quarter number for a given month.
+
+    :param month: The month.
+    :type month: int
+
+    :param fiscal_start: The month number that begins the (fiscal) year.
+    :type fiscal_start: int
+
+    :rtype: int
+
+    """
+    return (month - fiscal_start) % MONTHS_PER_YEAR // 3 + 1
+
+
+def get_timedelta(dt, **kwargs):
+    """Get a ``timedelta`` equivalent to incrementing the given date/time with a ``relativedelta``.
+
+    :param dt: The date/time to be incremented.
+    :type dt: date | datetime
+
+    The remaining keyword arguments are the same as those of :py:func:`increment`.
+
+    :rtype: timedelta | None
+    :returns: The ``timedelta``, or ``None`` when a ``relativedelta`` is required; for years, months, absolute values,
+              or non-integer amounts.
+
+    """
+    for key, value in kwargs.items():
+        if key not in TIMEDELTA_KEYS or type(value) is not int:
+            return None
+
+    # relativedelta promotes a date to a datetime when units of time are added, where timedelta would ignore them.
+    if not isinstance(dt, datetime):
+        for key in ("hours", "microseconds", "minutes", "seconds"):
+            if kwargs.get(key):
+                return None
+
+    return timedelta(**kwargs)
+
+
+def get_timezone(timezone):
+    """Get a timezone by name.
+
+    :param timezone: The name of the timezone, such as ``America/New_York``. A ``tzinfo`` is returned as is.
+    :type timezone: str | tzinfo
+
+    :rtype: tzinfo
+
+    :raise: pytz.UnknownTimeZoneError
+
+    """
+    if not isinstance(timezone, str):
+        return timezone
+
+    return TIMEZONE_CACHE.get_or_set(timezone, lambda: pytz.timezone(timezone))
+
+
+def get_holiday_ordinals(holidays):
+    """Get the sorted ordinals of the holidays that fall on weekdays, so that those within a span may be counted by
+    bisection.
+
+    :param holidays: Holidays or other time off.
+    :type holidays: list[date] | set[date] | HolidayCalendar
+
+    :rtype: list[int]
+
+    """
+    key = get_holidays_key(holidays)
+    ordinals = HOLIDAY_ORDINAL_CACHE.get(key)
+    if ordinals is None:
+        ordinals = set(holiday.toordinal() for holiday in holidays)
+        ordinals = HOLIDAY_ORDINAL_CACHE.set(key, sorted(
+            ordinal for ordinal in ordinals if (ordinal - 1) % 7 + 1 not in (SATURDAY, SUNDAY)
+        ))
+
+    return ordinals
+
+
+def get_holidays_key(holidays):
+    """Get a hashable key for holidays, by which tables computed from them may be cached.
+
+    :param holidays: Holidays or other time off.
+    :type holidays: list[date] | set[date] | HolidayCalendar | HolidayRules
+
+    :rtype: collections.Hashable
+
+    .. tip::
+        A ``frozenset``, ``HolidayCalendar``, or ``HolidayRules`` is its own key, and is the fast path; its hash is
+        cached or computed from a handful of rules. A list or set cannot be weakly referenced, so it is copied to a
+        ``frozenset`` on every call, which costs time in the number of holidays. Convert it once when rolling or
+        counting many dates one at a time.
+
+    """
+    if not holidays:
+        return None
+
+    try:
+        hash(holidays)
+    except TypeError:
+        return frozenset(holidays)
+
+    return holidays
+
+
+def get_microseconds(dt):
+    """Get the microseconds from midnight of January 1st of year 1 to the wall clock of a date/time.
+
+    :param dt: The date/time.
+    :type dt: datetime
+
+    :rtype: int
+
+    """
+    seconds = (dt.toordinal() - 1) * SECONDS_PER_DAY + (dt.hour * 60 + dt.minute) * 60 + dt.second
+    return seconds * MICROSECONDS_PER_SECOND + dt.microsecond
+
+
+def get_roll_days(dt, convention, holidays, key):
+    """Get the number of days by which :py:func:`roll` moves a date/time.
+
+    :param dt: The date/time.
+    :type dt: date | datetime
+
+    :param convention: The convention.
+    :type convention: str
+
+    :param holidays: Holidays or other time off.
+    :type holidays: list[date] | set[date] | HolidayCalendar | HolidayRules
+
+    :param key: The key of the holidays. See :py:func:`get_holidays_key`.
+
+    :rtype: int
+
+    """
+    year = dt.year
+    tables = ROLL_CACHE.get((key, year))
+    if tables is None:
+        tables = ROLL_CACHE.get_or_set((key, year), lambda: get_roll_tables(holidays, year))
+
+    first, following, preceding = tables
+    index = dt.toordinal() - first
+    forward = following[index]
+    if forward == 0:
+        return 0
+
+    backward = -preceding[index]
+    if convention == "following":
+        return forward
+    elif convention == "preceding":
+        return backward
+    elif convention == "modified_following":
+        return forward if (dt + timedelta(days=forward)).month == dt.month else backward
+
+    return backward if (dt + timedelta(days=backward)).month == dt.month else forward
+
+
+def get_roll_tables(holidays, year):
+    """Get the number of days from each day of a year to the next and to the previous business day.
+
+    :param holidays: Holidays or other time off.
+    :type holidays: list[date] | set[date] | HolidayCalendar | HolidayRules
+
+    :param year: The year.
+    :type year: int
+
+    :rtype: tuple(int, array, array)
+    :returns: The ordinal of January 1st, and the days to the business day on or after, and on or before, each day of
+              the year; indexed by the day of the year from ``0``.
+
+    """
+    first = date(year, 1, 1).toordinal()
+    last = date(year, 12, 31).toordinal()
+
+    start = max(first - ROLL_MARGIN, 1)
+    end = min(last + ROLL_MARGIN, date.max.toordinal())
+    is_open = [is_business_day(date.fromordinal(ordinal), holidays) for ordinal in range(start, end + 1)]
 
-    for month_number, days_in_month in days_per_month:
-        if month == month_number:
-            return days_in_month
+    following = array("H", bytes(2 * (last - first + 1)))
+    preceding = array("H", bytes(2 * (last - first + 1)))
 
-    raise ValueError("Not a valid month number: %s" % month)
+    # The nearest business day within the margin, or None beyond it.
+    nearest = None
+    for ordinal in range(end, first - 1, -1):
+        if is_open[ordinal - start]:
+            nearest = ordinal
+
+        if ordinal <= last:
+            if nearest is None:
+                nearest = increment(date.fromordinal(ordinal), business_days=1, holidays=holidays).toordinal()
+
+            following[ordinal - first] = nearest - ordinal
+
+    nearest = None
+    for ordinal in range(start, last + 1):
+        if is_open[ordinal - start]:
+            nearest = ordinal
+
+        if ordinal >= first:
+            if nearest is None:
+                nearest = increment(date.fromordinal(ordinal), business_days=-1, holidays=holidays).toordinal()
+
+            preceding[ordinal - first] = ordinal - nearest
+
+    return first, following, preceding
+
+
+def get_truncate_size(unit, step=1, mode="floor"):
+    """Validate the arguments of :py:func:`truncate` and get the size of a step.
+
+    :param unit: The unit.
+    :type unit: str
+
+    :param step: The number of units.
+    :type step: int
+
+    :param mode: The mode.
+    :type mode: str
+
+    :rtype: tuple
+    :returns: The size of the step in microseconds (or ``None``) and in months (or ``None``).
+
+    :raise: ValueError
+
+    """
+    if mode not in TRUNCATE_MODES:
+        raise ValueError("Not a valid mode: %s" % mode)
+
+    if not isinstance(step, int) or step < 1:
+        raise ValueError("The step must be a positive integer: %s" % step)
+
+    if unit.endswith("s"):
+        unit = unit[:-1]
+
+    if unit in UNIT_MICROSECONDS:
+        return UNIT_MICROSECONDS[unit] * step, None
+    elif unit in UNIT_MONTHS:
+        return None, UNIT_MONTHS[unit] * step
+
+    raise ValueError("Not a valid unit: %s" % unit)
+
+
+def get_week_anchor(unit, start_day=MONDAY):
+    """Get the offset in microseconds of the first boundary of a unit, so that weeks begin on the given day.
+
+    :param unit: The unit.
+    :type unit: str
+
+    :param start_day: The ISO weekday that starts a week.
+    :type start_day: int
+
+    :rtype: int
+
+    """
+    if unit.rstrip("s") != "week":
+        return 0
+
+    # Ordinal 1 is a Monday.
+    return (start_day - MONDAY) * UNIT_MICROSECONDS['day']
 
 
 def get_year_range(start, end=None):
@@ -93,17 +581,27 @@ def increment(dt, business_days=0, holidays=None, **kwargs):
 
     :rtype: datetime
 
+    .. note::
+        When only days, weeks, or units of time are given as integers, the ``datetime`` is incremented with a
+        ``timedelta``, which is considerably faster. A ``relativedelta`` is used for everything else (years, months,
+        or absolute values such as ``day``), and the result is the same either way.
+
     """
-    new_dt = dt + relativedelta(**kwargs)
+    delta = get_timedelta(dt, **kwargs)
+    if delta is None:
+        new_dt = dt + relativedelta(**kwargs)
+    else:
+        new_dt = dt + delta
 
     if business_days != 0:
-        i = business_days / abs(business_days)
+        step = 1 if business_days > 0 else -1
+        one_day = timedelta(days=step)
         while business_days != 0:
             while True:
-                new_dt = increment(new_dt, days=i)
+                new_dt += one_day
                 if is_business_day(new_dt, holidays):
                     break
-            business_days -= i
+            business_days -= step
     return new_dt
 
 
@@ -114,7 +612,7 @@ def is_business_day(dt, holidays=None):
     :type dt: datetime
 
     :param holidays: Holidays or other time off.
-    :type holidays: list[date]
+    :type holidays: list[date] | set[date] | HolidayCalendar
 
     :rtype: bool
 
@@ -135,20 +633,24 @@ def is_holiday(dt, holidays):
     :param dt: The date/time to be checked.
     :type dt: datetime.datetime
 
-    :param holidays: Holidays (or other time off) as datetime objects.
-    :type holidays: list[date]
+    :param holidays: Holidays (or other time off) as date objects.
+    :type holidays: list[date] | set[date] | HolidayCalendar
 
     :rtype: bool
 
     .. note::
-        For flexibility, ``holidays`` may be an empty list or ``None``.
+        For flexibility, ``holidays`` may be an empty list or ``None``. Any container of dates that supports ``in`` may
+        be used, including a :py:class:`HolidayCalendar`.
 
     """
-    if type(holidays) == list:
-        return dt.date() in holidays
-    else:
+    if not holidays:
         return False
 
+    if isinstance(dt, datetime):
+        return dt.date() in holidays
+
+    return dt in holidays
+
 
 def is_leap_year(year):
     """Indicates whether the given year is a leap year.
@@ -160,3 +662,157 @@ def is_leap_year(year):
 
     """
     return calendar.isleap(year)
+
+
+def roll(dt, convention="following", holidays=None):
+    """Move a date/time that is not on a business day to a business day. The time of day is kept.
+
+    :param dt: The date/time.
+    :type dt: date | datetime
+
+    :param convention: The business day convention:
+
+                       - ``following``: the next business day.
+                       - ``modified_following``: the next business day, unless it is in the next month, in which case
+                         the previous business day.
+                       - ``preceding``: the previous business day.
+                       - ``modified_preceding``: the previous business day, unless it is in the previous month, in
+                         which case the next business day.
+    :type convention: str
+
+    :param holidays: Holidays or other time off.
+    :type holidays: list[date] | set[date] | HolidayCalendar | HolidayRules
+
+    :rtype: date | datetime
+
+    :raise: ValueError
+    :raises: ``ValueError`` for an unknown convention.
+
+    The distance to the next and previous business day from each day of a year is computed once for the year (and
+    holidays) and cached, so that each roll is a lookup rather than a walk over the days off. Pass holidays as a
+    ``frozenset``, ``HolidayCalendar``, or ``HolidayRules`` to avoid copying them on each call; see
+    :py:func:`get_holidays_key`.
+
+    """
+    if convention not in ROLL_CONVENTIONS:
+        raise ValueError("Invalid convention (%s), must be one of: %s" % (convention, ", ".join(ROLL_CONVENTIONS)))
+
+    days = get_roll_days(dt, convention, holidays, get_holidays_key(holidays))
+    if not days:
+        return dt
+
+    return dt + timedelta(days=days)
+
+
+def roll_many(values, convention="following", holidays=None):
+    """Roll any number of date/times. See :py:func:`roll`.
+
+    :param values: The date/times. A ``DateTimeArray`` is rolled in a single vectorized pass.
+    :type values: list[datetime] | DateTimeArray
+
+    :rtype: list[datetime] | DateTimeArray
+
+    """
+    if hasattr(values, "roll"):
+        return values.roll(convention=convention, holidays=holidays)
+
+    if convention not in ROLL_CONVENTIONS:
+        raise ValueError("Invalid convention (%s), must be one of: %s" % (convention, ", ".join(ROLL_CONVENTIONS)))
+
+    key = get_holidays_key(holidays)
+    results = list()
+    for dt in values:
+        dt = getattr(dt, "dt", dt)
+        days = get_roll_days(dt, convention, holidays, key)
+        results.append(dt + timedelta(days=days) if days else dt)
+
+    return results
+
+
+def truncate(dt, unit, step=1, mode="floor", start_day=MONDAY):
+    """Truncate a date/time to a boundary of a calendar unit.
+
+    :param dt: The date/time to be truncated.
+    :type dt: datetime
+
+    :param unit: The unit; ``second``, ``minute``, ``hour``, ``day``, ``week``, ``month``, ``quarter``, or ``year``.
+    :type unit: str
+
+    :param step: The number of units between boundaries; for example, ``15`` for quarter hours.
+    :type step: int
+
+    :param mode: ``floor`` for the boundary at or before the date/time, ``ceil`` for the boundary at or after it, or
+                 ``round`` for the nearest boundary (halfway rounds up).
+    :type mode: str
+
+    :param start_day: The ISO weekday that starts a week.
+    :type start_day: int
+
+    :rtype: datetime
+
+    :raise: ValueError
+    :raises: ``ValueError`` for an unknown unit or mode, or a step that is not a positive integer.
+
+    Boundaries are counted from midnight of January 1st of year 1 (a Monday), or from the first month of year 0 for
+    months, quarters, and years. For example, a ``step`` of 10 years floors to a decade.
+
+    .. note::
+        The wall clock of the date/time is truncated and its ``tzinfo`` is kept, as for the other methods of
+        :py:class:`DateTime`.
+
+    """
+    size, months = get_truncate_size(unit, step, mode)
+
+    if size is not None:
+        remainder = (get_microseconds(dt) - get_week_anchor(unit, start_day)) % size
+        if not remainder:
+            return dt
+
+        if mode == "ceil" or (mode == "round" and remainder * 2 >= size):
+            return dt + timedelta(microseconds=size - remainder)
+
+        return dt - timedelta(microseconds=remainder)
+
+    index = dt.year * MONTHS_PER_YEAR + dt.month - 1
+    floor_index = index - index % months
+    floor_dt = dt.replace(year=floor_index // MONTHS_PER_YEAR, month=floor_index % MONTHS_PER_YEAR + 1, day=1, hour=0,
+                          minute=0, second=0, microsecond=0)
+    if mode == "floor" or floor_dt == dt:
+        return floor_dt
+
+    ceil_index = floor_index + months
+    ceil_dt = floor_dt.replace(year=ceil_index // MONTHS_PER_YEAR, month=ceil_index % MONTHS_PER_YEAR + 1)
+    if mode == "ceil" or dt - floor_dt >= ceil_dt - dt:
+        return ceil_dt
+
+    return floor_dt
+
+
+def truncate_many(values, unit, step=1, mode="floor", start_day=MONDAY):
+    """Truncate any number of date/times. See :py:func:`truncate`.
+
+    :param values: The date/times. A ``DateTimeArray`` is truncated in a single vectorized pass.
+    :type values: list[datetime] | DateTimeArray
+
+    :rtype: list[datetime] | DateTimeArray
+
+    """
+    if hasattr(values, "truncate"):
+        return values.truncate(unit, step=step, mode=mode, start_day=start_day)
+
+    size, _ = get_truncate_size(unit, step, mode)
+    if size is None or mode != "floor":
+        return [truncate(getattr(dt, "dt", dt), unit, step=step, mode=mode, start_day=start_day) for dt in values]
+
+    # The common case of bucketing by a fixed interval, with the arithmetic inlined.
+    anchor = get_week_anchor(unit, start_day)
+    _timedelta = timedelta
+    results = list()
+    for dt in values:
+        dt = getattr(dt, "dt", dt)
+        remainder = (((((dt.toordinal() - 1) * 24 + dt.hour) * 60 + dt.minute) * 60 + dt.second) * 1000000
+                     + dt.microsecond)
+        remainder = (remainder - anchor) % size
+        results.append(dt - _timedelta(microseconds=remainder) if remainder else dt)
+
+    return results
@@ -0,0 +1,215 @@
+"""
+The windows module aggregates sorted streams of events over trailing windows, such as "events in the trailing 30
+calendar days" or "the sum over the trailing 10 business days".
+
+.. code-block:: python
+
+    from datetime_machine import SlidingWindow
+
+    window = SlidingWindow(business_days=10, holidays=holidays)
+    for dt, count in window.apply(timestamps):
+        print(dt, count)
+
+    window = SlidingWindow("sum", days=30)
+    for dt, total in window.apply(timestamps, amounts):
+        print(dt, total)
+
+The window of an event is the :py:class:`DateTimeRange` from its start to the event, including both ends. The start is
+found by decrementing the event with :py:func:`increment`. Events must arrive in order, so that each one is added and
+removed from the window exactly once; the whole stream is evaluated in linear time. Minimums and maximums are kept with
+a monotonic queue.
+
+.. note::
+    The start of a window never moves backward, since events that have left the window are not added again. The start
+    computed for an event may be before that of an earlier event; for example, one month before both May 30th and 31st
+    is April 30th, and two business days before a Sunday are later than two before the following Monday morning. In
+    that case the start of the earlier window is kept.
+
+"""
+# Imports
+
+from collections import deque
+from .library import DateTimeRange, to_datetime
+from .utils import increment
+
+# Exports
+
+__all__ = (
+    "SlidingWindow",
+)
+
+# Constants
+
+AGGREGATES = ("count", "max", "min", "sum")
+
+# Keyword arguments to increment() for which the start of a window is the same distance from every event on a day.
+DAY_KEYS = ("days", "months", "weeks", "years")
+
+# Classes
+
+
+class SlidingWindow(object):
+    """A trailing window over a sorted stream of events."""
+
+    def __init__(self, aggregate="count", business_days=0, holidays=None, **kwargs):
+        """Initialize the window.
+
+        :param aggregate: ``count``, ``sum``, ``min``, or ``max``.
+        :type aggregate: str
+
+        :param business_days: The number of business days covered by the window.
+        :type business_days: int
+
+        :param holidays: Holidays or other time off.
+        :type holidays: list[date] | HolidayCalendar
+
+        The remaining keyword arguments give the calendar length of the window as for :py:func:`increment`; ``days``,
+        ``hours``, ``months``, and so on.
+
+        :raise: ValueError
+        :raises: ``ValueError`` for an unknown aggregate or a window without a length.
+
+        """
+        if aggregate not in AGGREGATES:
+            raise ValueError("Not a valid aggregate: %s" % aggregate)
+
+        if not business_days and not any(kwargs.values()):
+            raise ValueError("A window requires a length.")
+
+        self.aggregate = aggregate
+        self.business_days = business_days
+        self.holidays = holidays
+        self.kwargs = kwargs
+
+        self._decrement = dict((key, -value) for key, value in kwargs.items() if value)
+
+        # The start of a window is always the same distance from an event on the same day when no time units are given,
+        # so it is computed once per day.
+        self._daily = all(key in DAY_KEYS for key in self._decrement)
+
+        self.reset()
+
+    def add(self, dt, value=None):
+        """Add an event and aggregate the window that ends with it.
+
+        :param dt: The date/time of the event. This must not be before the previous event.
+        :type dt: datetime | DateTime
+
+        :param value: The value of the event. Required for ``sum``, ``min``, and ``max``.
+        :type value: int | float
+
+        :returns: The aggregate of the window.
+
+        :raise: ValueError
+        :raises: ``ValueError`` when events are out of order or a required value is missing.
+
+        """
+        dt = to_datetime(dt, strict=True)
+        if self._last_dt is not None and dt < self._last_dt:
+            raise ValueError("Events must be sorted: %s is before %s" % (dt, self._last_dt))
+
+        if value is None and self.aggregate != "count":
+            raise ValueError("A value is required to aggregate by %s." % self.aggregate)
+
+        self._last_dt = dt
+        self._events.append((dt, value))
+
+        if self.aggregate == "sum":
+            self._total += value
+        elif self.aggregate in ("max", "min"):
+            extrema = self._extrema
+            if self.aggregate == "max":
+                while extrema and extrema[-1][1] <= value:
+                    extrema.pop()
+            else:
+                while extrema and extrema[-1][1] >= value:
+                    extrema.pop()
+
+            extrema.append((dt, value))
+
+        # Events leave the window in the order they arrived.
+        start_dt = self.get_start_dt(dt)
+        if self._start_dt is not None and start_dt < self._start_dt:
+            start_dt = self._start_dt
+
+        self._start_dt = start_dt
+        events = self._events
+        while events[0][0] < start_dt:
+            _, old_value = events.popleft()
+            if self.aggregate == "sum":
+                self._total -= old_value
+
+        extrema = self._extrema
+        while extrema and extrema[0][0] < start_dt:
+            extrema.popleft()
+
+        if self.aggregate == "count":
+            return len(events)
+        elif self.aggregate == "sum":
+            return self._total
+
+        return extrema[0][1]
+
+    def apply(self, dts, values=None):
+        """Aggregate the window ending with each event. Results are produced as the events are consumed, so the events
+        may be a stream.
+
+        :param dts: The date/times of the events, in order.
+        :type dts: collections.Iterable[datetime | DateTime]
+
+        :param values: The value of each event, in the same order.
+        :type values: collections.Iterable[int | float]
+
+        :rtype: collections.Iterable[tuple]
+        :returns: The date/time of each event and the aggregate of its window.
+
+        """
+        if values is None:
+            for dt in dts:
+                yield dt, self.add(dt)
+        else:
+            for dt, value in zip(dts, values):
+                yield dt, self.add(dt, value)
+
+    def get_range(self, dt):
+        """Get the window that ends with the given date/time.
+
+        :param dt: The date/time.
+        :type dt: datetime | DateTime
+
+        :rtype: DateTimeRange
+
+        """
+        dt = to_datetime(dt, strict=True)
+        return DateTimeRange(self.get_start_dt(dt), dt)
+
+    def get_start_dt(self, dt):
+        """Get the start of the window that ends with the given date/time.
+
+        :param dt: The date/time.
+        :type dt: datetime
+
+        :rtype: datetime
+
+        """
+        if not self._daily:
+            return increment(dt, business_days=-self.business_days, holidays=self.holidays, **self._decrement)
+
+        ordinal = dt.toordinal()
+        if ordinal != self._ordinal:
+            midnight = dt.replace(hour=0, minute=0, second=0, microsecond=0)
+            start_dt = increment(midnight, business_days=-self.business_days, holidays=self.holidays, **self._decrement)
+            self._offset = start_dt - midnight
+            self._ordinal = ordinal
+
+        return dt + self._offset
+
+    def reset(self):
+        """Remove all events so that the window may be used for another stream."""
+        self._events = deque()
+        self._extrema = deque()
+        self._last_dt = None
+        self._offset = None
+        self._ordinal = None
+        self._start_dt = None
+        self._total = 0
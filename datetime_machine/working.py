@@ -0,0 +1,371 @@
+"""
+The working module adds and measures working time; the hours of business days, less holidays.
+
+.. code-block:: python
+
+    from datetime import time
+    from datetime_machine import WorkingHours
+
+    hours = WorkingHours(start=time(9), end=time(17, 30), holidays=holidays, timezone="America/New_York")
+
+    # Respond within 6 working hours.
+    due = hours.add(received_dt, hours=6)
+
+    # How long did it actually take?
+    elapsed = hours.between(received_dt, responded_dt)
+
+Working intervals are precomputed for each day of the week, so long durations are added by jumping whole weeks and then
+whole days rather than stepping hour by hour.
+
+"""
+# Imports
+
+from bisect import bisect_left
+from datetime import date, datetime, time, timedelta
+from .constants import FRIDAY, MONDAY, THURSDAY, TUESDAY, WEDNESDAY
+from .holidays import HolidayRules
+from .utils import get_timezone
+
+# Exports
+
+__all__ = (
+    "WorkingHours",
+)
+
+# Constants
+
+ONE_DAY = timedelta(days=1)
+
+RESOLUTION = timedelta(microseconds=1)
+
+ZERO = timedelta()
+
+# Classes
+
+
+class WorkingHours(object):
+    """Working hours on business days, less holidays."""
+
+    def __init__(self, start=time(9), end=time(17), holidays=None, schedule=None, timezone=None,
+                 weekdays=(MONDAY, TUESDAY, WEDNESDAY, THURSDAY, FRIDAY)):
+        """Initialize working hours.
+
+        :param start: The time at which work begins. A string may be given as ``HH:MM``.
+        :type start: time | str
+
+        :param end: The time at which work ends. A string may be given as ``HH:MM``.
+        :type end: time | str
+
+        :param holidays: Holidays or other time off.
+        :type holidays: list[date] | set[date] | HolidayCalendar | HolidayRules
+
+        :param schedule: Overrides the start and end times for specific ISO weekdays. For example,
+                         ``{FRIDAY: (time(9), time(13))}``. A weekday given as ``None`` is not worked.
+        :type schedule: dict
+
+        :param timezone: The local timezone of the working hours. Aware date/times are converted to this timezone and
+                         results are returned in it. If omitted, the wall clock of the given date/time is used.
+        :type timezone: str | tzinfo
+
+        :param weekdays: The ISO weekdays that are worked. By default these are the same as for
+                         :py:func:`is_business_day`.
+        :type weekdays: tuple[int]
+
+        :raise: ValueError
+        :raises: ``ValueError`` when a working interval ends before it starts, or no day is worked.
+
+        """
+        _schedule = dict()
+        for weekday in weekdays:
+            _schedule[weekday] = (start, end)
+
+        if schedule:
+            _schedule.update(schedule)
+
+        # The working interval for each ISO weekday as offsets from midnight, indexed from Monday.
+        self._intervals = list()
+        for weekday in range(1, 8):
+            interval = _schedule.get(weekday)
+            if interval is None:
+                self._intervals.append(None)
+                continue
+
+            _start, _end = [to_timedelta(value) for value in interval]
+            if _end <= _start:
+                raise ValueError("Working hours must end after they start: %s - %s" % interval)
+
+            self._intervals.append((_start, _end))
+
+        self._lengths = [(interval[1] - interval[0]) if interval else ZERO for interval in self._intervals]
+        self.week_length = sum(self._lengths, ZERO)
+        if not self.week_length:
+            raise ValueError("No working hours are defined.")
+
+        # Holiday ordinals are kept sorted so that those within a span may be found by bisection. Rules have no last
+        # year, so their holidays are instead generated (and cached) for each year as it is reached.
+        if isinstance(holidays, HolidayRules):
+            self._rules = holidays
+            self._holidays = list()
+        else:
+            self._rules = None
+            self._holidays = sorted(set(d.toordinal() for d in holidays or list()))
+
+        self._holiday_set = frozenset(self._holidays)
+
+        self.timezone = get_timezone(timezone)
+
+    def add(self, dt, duration=None, **kwargs):
+        """Add working time to a date/time.
+
+        :param dt: The starting date/time.
+        :type dt: datetime
+
+        :param duration: The working time to add.
+        :type duration: timedelta
+
+        The remaining keyword arguments (``hours``, ``minutes``, and so on) are used to create the duration when it is
+        not given.
+
+        :rtype: datetime
+
+        """
+        if duration is None:
+            duration = timedelta(**kwargs)
+
+        if duration < ZERO:
+            return self.subtract(dt, -duration)
+
+        if duration == ZERO:
+            return dt
+
+        local_dt, tzinfo = self._to_local(dt)
+        ordinal = local_dt.toordinal()
+        offset = local_dt - datetime.fromordinal(ordinal)
+        remaining = duration
+
+        # Finish the first day.
+        interval = self._get_interval(ordinal)
+        if interval is not None:
+            position = max(offset, interval[0])
+            if position < interval[1]:
+                available = interval[1] - position
+                if remaining <= available:
+                    return self._from_local(ordinal, position + remaining, tzinfo)
+
+                remaining -= available
+
+        ordinal += 1
+
+        # Jump whole weeks, then add back the working time lost to holidays within them.
+        while remaining > self.week_length:
+            weeks = (remaining - RESOLUTION) // self.week_length
+            remaining -= self.week_length * weeks
+            remaining += self._get_holiday_length(ordinal, ordinal + weeks * 7)
+            ordinal += weeks * 7
+
+        # Then whole days.
+        while True:
+            interval = self._get_interval(ordinal)
+            if interval is not None:
+                length = interval[1] - interval[0]
+                if remaining <= length:
+                    return self._from_local(ordinal, interval[0] + remaining, tzinfo)
+
+                remaining -= length
+
+            ordinal += 1
+
+    def between(self, start_dt, end_dt):
+        """Measure the working time between two date/times.
+
+        :param start_dt: The starting date/time.
+        :type start_dt: datetime
+
+        :param end_dt: The ending date/time.
+        :type end_dt: datetime
+
+        :rtype: timedelta
+        :returns: The working time, which is negative when ``end_dt`` is before ``start_dt``.
+
+        """
+        if end_dt < start_dt:
+            return -self.between(end_dt, start_dt)
+
+        start_dt, _ = self._to_local(start_dt)
+        end_dt, _ = self._to_local(end_dt)
+
+        start_ordinal = start_dt.toordinal()
+        end_ordinal = end_dt.toordinal()
+        start_offset = start_dt - datetime.fromordinal(start_ordinal)
+        end_offset = end_dt - datetime.fromordinal(end_ordinal)
+
+        if start_ordinal == end_ordinal:
+            return self._get_overlap(start_ordinal, start_offset, end_offset)
+
+        total = self._get_overlap(start_ordinal, start_offset, ONE_DAY)
+        total += self._get_overlap(end_ordinal, ZERO, end_offset)
+
+        # Whole days in between; whole weeks first, then the remainder, less holidays.
+        first = start_ordinal + 1
+        weeks = (end_ordinal - first) // 7
+        total += self.week_length * weeks
+        for ordinal in range(first + weeks * 7, end_ordinal):
+            total += self._lengths[(ordinal - 1) % 7]
+
+        total -= self._get_holiday_length(first, end_ordinal)
+
+        return total
+
+    def is_working_time(self, dt):
+        """Determine whether the given date/time falls within working hours.
+
+        :param dt: The date/time to be checked.
+        :type dt: datetime
+
+        :rtype: bool
+
+        """
+        local_dt, _ = self._to_local(dt)
+        ordinal = local_dt.toordinal()
+        interval = self._get_interval(ordinal)
+        if interval is None:
+            return False
+
+        offset = local_dt - datetime.fromordinal(ordinal)
+        return interval[0] <= offset < interval[1]
+
+    def subtract(self, dt, duration=None, **kwargs):
+        """Subtract working time from a date/time.
+
+        :param dt: The starting date/time.
+        :type dt: datetime
+
+        :param duration: The working time to subtract.
+        :type duration: timedelta
+
+        The remaining keyword arguments (``hours``, ``minutes``, and so on) are used to create the duration when it is
+        not given.
+
+        :rtype: datetime
+
+        """
+        if duration is None:
+            duration = timedelta(**kwargs)
+
+        if duration < ZERO:
+            return self.add(dt, -duration)
+
+        if duration == ZERO:
+            return dt
+
+        local_dt, tzinfo = self._to_local(dt)
+        ordinal = local_dt.toordinal()
+        offset = local_dt - datetime.fromordinal(ordinal)
+        remaining = duration
+
+        # Finish the first day.
+        interval = self._get_interval(ordinal)
+        if interval is not None:
+            position = min(offset, interval[1])
+            if position > interval[0]:
+                available = position - interval[0]
+                if remaining <= available:
+                    return self._from_local(ordinal, position - remaining, tzinfo)
+
+                remaining -= available
+
+        ordinal -= 1
+
+        # Jump whole weeks, then add back the working time lost to holidays within them.
+        while remaining > self.week_length:
+            weeks = (remaining - RESOLUTION) // self.week_length
+            remaining -= self.week_length * weeks
+            remaining += self._get_holiday_length(ordinal - weeks * 7 + 1, ordinal + 1)
+            ordinal -= weeks * 7
+
+        # Then whole days.
+        while True:
+            interval = self._get_interval(ordinal)
+            if interval is not None:
+                length = interval[1] - interval[0]
+                if remaining <= length:
+                    return self._from_local(ordinal, interval[1] - remaining, tzinfo)
+
+                remaining -= length
+
+            ordinal -= 1
+
+    def _from_local(self, ordinal, offset, tzinfo):
+        """Create a date/time from a day and an offset from midnight in local time."""
+        dt = datetime.fromordinal(ordinal) + offset
+
+        if self.timezone is not None:
+            if hasattr(self.timezone, "localize"):
+                return self.timezone.localize(dt)
+
+            return dt.replace(tzinfo=self.timezone)
+
+        return dt.replace(tzinfo=tzinfo)
+
+    def _get_holiday_length(self, start_ordinal, end_ordinal):
+        """Get the working time that would have been worked on holidays from the start up to (not including) the end."""
+        total = ZERO
+        if self._rules is not None:
+            if end_ordinal > start_ordinal:
+                for value in self._rules.between(date.fromordinal(start_ordinal), date.fromordinal(end_ordinal - 1)):
+                    total += self._lengths[(value.toordinal() - 1) % 7]
+
+            return total
+
+        index = bisect_left(self._holidays, start_ordinal)
+        while index < len(self._holidays) and self._holidays[index] < end_ordinal:
+            total += self._lengths[(self._holidays[index] - 1) % 7]
+            index += 1
+
+        return total
+
+    def _get_interval(self, ordinal):
+        """Get the working interval of a day, or ``None`` when it is not worked."""
+        if ordinal in self._holiday_set:
+            return None
+
+        if self._rules is not None and date.fromordinal(ordinal) in self._rules:
+            return None
+
+        # Ordinal 1 (January 1st of year 1) is a Monday.
+        return self._intervals[(ordinal - 1) % 7]
+
+    def _get_overlap(self, ordinal, start_offset, end_offset):
+        """Get the working time of a day between two offsets from midnight."""
+        interval = self._get_interval(ordinal)
+        if interval is None:
+            return ZERO
+
+        start_offset = max(start_offset, interval[0])
+        end_offset = min(end_offset, interval[1])
+
+        return max(end_offset - start_offset, ZERO)
+
+    def _to_local(self, dt):
+        """Get the naive local date/time and the tzinfo to be restored on results."""
+        if self.timezone is not None and dt.tzinfo is not None:
+            dt = dt.astimezone(self.timezone)
+
+        return dt.replace(tzinfo=None), dt.tzinfo
+
+# Functions
+
+
+def to_timedelta(value):
+    """Convert a time of day to an offset from midnight.
+
+    :param value: The time of day. A string may be given as ``HH:MM``.
+    :type value: time | str
+
+    :rtype: timedelta
+
+    """
+    if isinstance(value, str):
+        value = datetime.strptime(value, "%H:%M").time()
+
+    return timedelta(hours=value.hour, minutes=value.minute, seconds=value.second, microseconds=value.microsecond)
@@ -26,6 +26,15 @@ setup(
         "python-dateutil",
         "pytz",
     ],
+    entry_points={
+        "console_scripts": [
+            "datetime_machine = datetime_machine.cli:main",
+        ],
+    },
+    extras_require={
+        "arrow": ["numpy", "pyarrow"],
+        "numpy": ["numpy"],
+    },
     classifiers=[
         'Development Status :: 2 - Pre Alpha',
         'Intended Audience :: Developers',
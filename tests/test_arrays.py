@@ -0,0 +1,253 @@
+from array import array
+from datetime import date, datetime, timedelta
+from datetime_machine.holidays import HolidayCalendar, HolidayRule, HolidayRules
+from datetime_machine.library import DateTime
+from datetime_machine.constants import MONDAY, SUNDAY
+from datetime_machine.utils import diff, increment, is_business_day, roll, roll_many, truncate, truncate_many
+import pytest
+import pytz
+import random
+import subprocess
+import sys
+
+np = pytest.importorskip("numpy")
+
+from datetime_machine.arrays import *
+from datetime_machine.arrays import local_to_utc, utc_to_local
+
+HOLIDAYS = [
+    date(2021, 1, 1),
+    date(2021, 7, 5),
+    date(2021, 12, 24),
+]
+
+
+def get_datetimes(count=500):
+    generator = random.Random(20210301)
+    start = datetime(2020, 1, 1)
+    return [
+        start + timedelta(days=generator.randint(0, 730), microseconds=generator.randint(0, 86400 * 10 ** 6 - 1))
+        for _ in range(count)
+    ]
+
+
+class TestDateTimeArray(object):
+
+    def test_init(self):
+        dts = get_datetimes(10)
+        values = DateTimeArray(dts)
+        assert len(values) == 10
+        assert values.to_datetimes() == dts
+        assert values[0].dt == dts[0]
+        assert [d.dt for d in values[2:4]] == dts[2:4]
+
+        microseconds = values.values.view("int64")
+        assert DateTimeArray(microseconds).to_datetimes() == dts
+        assert DateTimeArray(np.array(dts, dtype="datetime64[ms]")).values.dtype == np.dtype("datetime64[us]")
+
+        values = DateTimeArray([DateTime(datetime(2021, 7, 1, 16, tzinfo=pytz.UTC))], timezone="America/New_York")
+        assert values.to_datetimes()[0].replace(tzinfo=None) == datetime(2021, 7, 1, 12)
+        assert values.to_datetimes()[0].utcoffset() == timedelta(hours=-4)
+
+    def test_get_day_of_week(self):
+        dts = get_datetimes()
+        values = DateTimeArray(dts)
+        assert list(values.get_day_of_week()) == [DateTime(dt).get_day_of_week() for dt in dts]
+        assert list(values.get_day_of_week(offset=True)) == [DateTime(dt).get_day_of_week(offset=True) for dt in dts]
+
+    def test_in_range(self):
+        values = DateTimeArray([datetime(2021, 1, 15), datetime(2021, 2, 15)])
+        mask = values.in_range(datetime(2021, 1, 1), datetime(2021, 1, 31, 23, 59))
+        assert list(mask) == [True, False]
+
+    def test_increment(self):
+        dts = get_datetimes()
+        values = DateTimeArray(dts)
+
+        cases = [
+            dict(days=3),
+            dict(weeks=-2, hours=5, minutes=1),
+            dict(months=1),
+            dict(years=-1, months=13, days=1),
+            dict(seconds=1.5),
+            dict(business_days=7, holidays=HOLIDAYS),
+            dict(business_days=-3, holidays=HOLIDAYS),
+            dict(months=2, business_days=1),
+        ]
+        for kwargs in cases:
+            expected = [increment(dt, **kwargs) for dt in dts]
+            assert values.increment(**kwargs).to_datetimes() == expected, kwargs
+
+        with pytest.raises(TypeError):
+            values.increment(day=1)
+
+        with pytest.raises(ValueError):
+            values.increment(months=1.5)
+
+    def test_is_business_day(self):
+        dts = get_datetimes()
+        values = DateTimeArray(dts)
+        assert list(values.is_business_day(HOLIDAYS)) == [is_business_day(dt, HOLIDAYS) for dt in dts]
+
+    def test_periods(self):
+        dts = get_datetimes()
+        values = DateTimeArray(dts)
+        for name in ("end_of_day_dt", "end_of_month_dt", "end_of_year_dt", "start_of_day_dt", "start_of_month_dt",
+                     "start_of_year_dt"):
+            expected = [getattr(DateTime(dt), name)() for dt in dts]
+            assert getattr(values, name)().to_datetimes() == expected, name
+
+    def test_diff_many(self):
+        starts = get_datetimes()
+        ends = list(reversed(get_datetimes()))
+        units = ("years", "months", "weeks", "days", "hours", "minutes", "seconds", "microseconds", "business_days")
+        for _units in (units, ("years", "days"), ("months", "business_days"), ("hours",)):
+            result = diff_many(starts, DateTimeArray(ends), units=_units, holidays=HOLIDAYS)
+            assert list(result) == list(_units)
+            for index, (start, end) in enumerate(zip(starts, ends)):
+                expected = diff(start, end, units=_units, holidays=HOLIDAYS)
+                assert dict((unit, int(result[unit][index])) for unit in _units) == expected, (start, end)
+
+        # The ends are converted to the timezone of the starts.
+        start = pytz.timezone("America/New_York").localize(datetime(2021, 3, 1, 20))
+        end = datetime(2021, 3, 2, 2, tzinfo=pytz.UTC)
+        assert diff_many(DateTimeArray([start]), DateTimeArray([end]), units=("hours",))["hours"][0] == 1
+
+        with pytest.raises(ValueError):
+            diff_many(starts, ends[1:])
+
+    def test_truncate(self):
+        dts = get_datetimes() + [datetime(2021, 3, 1), datetime(2021, 3, 8, 12), datetime(1960, 5, 17, 10, 7, 30)]
+        values = DateTimeArray(dts)
+        for unit, step in (("second", 1), ("minute", 15), ("hour", 1), ("hour", 5), ("day", 1), ("day", 3),
+                           ("week", 1), ("month", 1), ("month", 2), ("quarter", 1), ("year", 10)):
+            for mode in ("ceil", "floor", "round"):
+                for start_day in (MONDAY, SUNDAY):
+                    expected = [truncate(dt, unit, step=step, mode=mode, start_day=start_day) for dt in dts]
+                    result = values.truncate(unit, step=step, mode=mode, start_day=start_day)
+                    assert result.to_datetimes() == expected, (unit, step, mode, start_day)
+
+        assert values.floor("hour").to_datetimes() == truncate_many(dts, "hour")
+        assert values.ceil("day").to_datetimes() == truncate_many(dts, "day", mode="ceil")
+        assert values.round("minute", 5).to_datetimes() == truncate_many(dts, "minute", 5, mode="round")
+        assert truncate_many(values, "month").to_datetimes() == truncate_many(dts, "month")
+
+    def test_roll(self):
+        dts = get_datetimes() + [datetime(2021, 7, 31, 10), datetime(2021, 12, 31, 12)]
+        holidays = HolidayRules([
+            HolidayRule.fixed("New Year's Day", 1, 1, observed="nearest"),
+            HolidayRule.fixed("Independence Day", 7, 4, observed="nearest"),
+        ])
+
+        values = DateTimeArray(dts)
+        for convention in ("following", "modified_following", "preceding", "modified_preceding"):
+            expected = [roll(dt, convention, holidays=holidays) for dt in dts]
+            assert values.roll(convention, holidays=holidays).to_datetimes() == expected, convention
+            assert roll_many(values, convention, holidays=holidays).to_datetimes() == expected
+
+        with pytest.raises(ValueError):
+            values.roll("nearest")
+
+    def test_buffers(self):
+        dts = get_datetimes(10)
+        microseconds = DateTimeArray(dts).values.view("int64")
+
+        # An int64 buffer of microseconds is shared rather than copied.
+        buffer = array("q", microseconds.tolist())
+        values = DateTimeArray(buffer)
+        assert values.to_datetimes() == dts
+        buffer[0] += 1
+        assert values.to_datetimes()[0] == dts[0] + timedelta(microseconds=1)
+
+        values = DateTimeArray(microseconds * 1000, unit="ns")
+        assert values.to_datetimes() == dts
+
+        source = np.array(dts, dtype="datetime64[us]")
+        values = DateTimeArray(source)
+        assert values.to_numpy() is source or np.shares_memory(values.to_numpy(), source)
+
+    def test_holiday_rules(self):
+        rules = HolidayRules([
+            HolidayRule.fixed("New Year's Day", 1, 1, observed="nearest"),
+            HolidayRule.fixed("Independence Day", 7, 4, observed="nearest"),
+            HolidayRule.fixed("Christmas Day", 12, 25, observed="nearest"),
+        ])
+        dts = get_datetimes()
+        values = DateTimeArray(dts)
+
+        assert list(values.is_business_day(rules)) == [is_business_day(dt, rules) for dt in dts]
+        expected = [increment(dt, business_days=30, holidays=rules) for dt in dts]
+        assert values.increment(business_days=30, holidays=rules).to_datetimes() == expected
+
+        ends = list(reversed(dts))
+        result = diff_many(dts, ends, units=("business_days",), holidays=rules)["business_days"]
+        assert list(result) == [diff(start, end, units=("business_days",), holidays=rules)["business_days"]
+                                for start, end in zip(dts, ends)]
+
+    def test_holiday_calendar(self):
+        calendar = HolidayCalendar.from_dates(HOLIDAYS)
+        dts = get_datetimes()
+        values = DateTimeArray(dts)
+        assert list(values.is_business_day(calendar)) == [is_business_day(dt, HOLIDAYS) for dt in dts]
+
+    def test_timezones(self):
+        timezone = pytz.timezone("America/New_York")
+        local = [datetime(2021, 3, 14, 1, 30), datetime(2021, 7, 1, 12), datetime(2021, 11, 7, 3)]
+        values = np.array(local, dtype="datetime64[us]")
+
+        utc = local_to_utc(values, timezone)
+        expected = [timezone.localize(dt).astimezone(pytz.UTC).replace(tzinfo=None) for dt in local]
+        assert list(utc.astype(datetime)) == expected
+        assert list(utc_to_local(utc, timezone).astype(datetime)) == local
+
+        assert list(utc_to_local(utc, pytz.UTC)) == list(utc)
+
+
+class TestArrow(object):
+
+    def test_from_arrow(self):
+        pyarrow = pytest.importorskip("pyarrow")
+        dts = get_datetimes(10)
+
+        column = pyarrow.array(dts, type=pyarrow.timestamp("us"))
+        values = DateTimeArray(column)
+        assert values.to_datetimes() == dts
+        assert values.timezone is None
+
+        chunked = pyarrow.chunked_array([column[:5], column[5:]])
+        assert DateTimeArray(chunked).to_datetimes() == dts
+
+        utc = [datetime(2021, 7, 1, 16)]
+        column = pyarrow.array(utc, type=pyarrow.timestamp("ms", tz="America/New_York"))
+        values = DateTimeArray(column)
+        assert values.timezone.zone == "America/New_York"
+        assert values.to_numpy()[0].astype(datetime) == datetime(2021, 7, 1, 12)
+
+        with pytest.raises(TypeError):
+            DateTimeArray(pyarrow.array([1, 2]))
+
+        with pytest.raises(ValueError):
+            DateTimeArray(pyarrow.array([dts[0], None], type=pyarrow.timestamp("us")))
+
+    def test_to_arrow(self):
+        pyarrow = pytest.importorskip("pyarrow")
+        dts = get_datetimes(10)
+
+        values = DateTimeArray(dts)
+        column = values.to_arrow()
+        assert column.to_pylist() == dts
+        assert column.buffers()[1].address == values.to_numpy().ctypes.data
+
+        values = DateTimeArray([datetime(2021, 7, 1, 12)], timezone="America/New_York")
+        column = values.to_arrow()
+        assert column.type.tz == "America/New_York"
+        assert column.cast(pyarrow.timestamp("us")).to_pylist() == [datetime(2021, 7, 1, 16)]
+
+
+def test_lazy_import():
+    # NumPy and PyArrow are slow to import, so the package imports them only when arrays are used.
+    code = "import datetime_machine, sys; print('numpy' in sys.modules, 'pyarrow' in sys.modules)"
+    assert subprocess.check_output([sys.executable, "-c", code]).split() == [b"False", b"False"]
+
+    code = "from datetime_machine import DateTimeArray, resample, schedule_many; print(DateTimeArray.__name__)"
+    assert subprocess.check_output([sys.executable, "-c", code]).strip() == b"DateTimeArray"
@@ -0,0 +1,114 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from datetime_machine.cache import *
+from datetime_machine.library import DateTime, Month, PARSE_CACHE
+from datetime_machine.utils import get_timezone, increment
+import pytz
+
+STRINGS = ["2021-%02d-%02d 10:30" % (month, day) for month in range(1, 13) for day in range(1, 29)]
+
+
+def get_results(values):
+    """Parse, increment, and create months in the way that a worker would."""
+    results = list()
+    for value in values:
+        dt = DateTime.from_string(value).dt
+        results.append((dt, increment(dt, months=1, business_days=2), Month(dt).total_days))
+
+    return results
+
+
+class TestCache(object):
+
+    def test_clear(self):
+        cache = Cache("test_clear")
+        cache.set("a", 1)
+        cache.get("a")
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.stats() == {'evictions': 0, 'hits': 0, 'max_size': 1024, 'misses': 0, 'size': 0}
+
+    def test_get(self):
+        cache = Cache("test_get")
+        assert cache.get("a") is None
+        assert cache.get("a", 0) == 0
+
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert "a" in cache
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 2
+
+    def test_get_or_set(self):
+        cache = Cache("test_get_or_set")
+        calls = list()
+
+        def factory():
+            calls.append(1)
+            return "value"
+
+        assert cache.get_or_set("a", factory) == "value"
+        assert cache.get_or_set("a", factory) == "value"
+        assert len(calls) == 1
+
+    def test_get_stats(self):
+        cache = Cache("test_get_stats", max_size=2)
+        cache.set("a", 1)
+
+        stats = get_stats()
+        assert stats["test_get_stats"] == {'evictions': 0, 'hits': 0, 'max_size': 2, 'misses': 0, 'size': 1}
+        assert "parsed_strings" in stats
+        assert "timezones" in stats
+
+    def test_set(self):
+        cache = Cache("test_set", max_size=2)
+        assert cache.set("a", 1) == 1
+
+        # The first value stored wins.
+        assert cache.set("a", 2) == 1
+
+        # The oldest entry is evicted.
+        cache.set("b", 2)
+        cache.set("c", 3)
+        assert len(cache) == 2
+        assert "a" not in cache
+        assert cache.stats()['evictions'] == 1
+
+        disabled = Cache("test_set_disabled", max_size=0)
+        assert disabled.set("a", 1) == 1
+        assert len(disabled) == 0
+
+
+class TestConcurrency(object):
+
+    def test_get_timezone(self):
+        assert get_timezone("America/New_York") is pytz.timezone("America/New_York")
+        assert get_timezone(pytz.UTC) is pytz.UTC
+
+    def test_workers(self):
+        PARSE_CACHE.clear()
+        expected = get_results(STRINGS)
+
+        # Each worker parses every string, so the caches are read and written concurrently.
+        workers = 8
+        PARSE_CACHE.clear()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(get_results, [STRINGS] * workers))
+
+        for result in results:
+            assert result == expected
+
+        assert len(PARSE_CACHE) == len(STRINGS)
+        assert DateTime.from_string("2021-01-01 10:30").dt == datetime(2021, 1, 1, 10, 30)
+
+    def test_partial_strings(self):
+        PARSE_CACHE.clear()
+        today = date.today()
+
+        # Partial strings are completed from today, and cached only for today.
+        assert DateTime.from_string("10:30").dt == datetime(today.year, today.month, today.day, 10, 30)
+        assert ("10:30", today) in PARSE_CACHE
+
+        assert DateTime.from_string("10:30", input_format="%H:%M").dt == datetime(1900, 1, 1, 10, 30)
+        assert ("10:30", "%H:%M") in PARSE_CACHE
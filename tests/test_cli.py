@@ -0,0 +1,122 @@
+from datetime import date, datetime
+from datetime_machine.cli import Transform, TransformError, bucket, main, parse_increments
+from datetime_machine.holidays import HolidayCalendar
+import io
+import pytest
+
+
+def run(args, text):
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    code = main(args, stdin=io.StringIO(text), stdout=stdout, stderr=stderr)
+    return code, stdout.getvalue(), stderr.getvalue()
+
+
+def test_bucket():
+    dt = datetime(2021, 3, 3, 13, 30)
+    assert bucket(dt, "day") == "2021-03-03"
+    assert bucket(dt, "hour") == "2021-03-03T13"
+    assert bucket(dt, "month") == "2021-03"
+    assert bucket(dt, "quarter") == "2021-Q1"
+    assert bucket(dt, "week") == "2021-03-01"
+    assert bucket(dt, "year") == "2021"
+
+
+def test_main_csv(tmp_path):
+    text = "id,created\n1,2021-07-02 16:00:00\n2,2021-07-09 16:00:00\n"
+    code, output, _ = run(["--column", "created", "--header", "--start-of", "month", "-"], text)
+    assert code == 0
+    assert output == "id,created\n1,2021-07-01T00:00:00\n2,2021-07-01T00:00:00\n"
+
+    code, output, _ = run(["--column", "2", "--bucket", "week"], "1,2021-07-02\n")
+    assert output == "1,2021-06-28\n"
+
+    code, _, error = run(["--column", "created"], text)
+    assert code == 1
+    assert "requires --header" in error
+
+
+def test_main_lines(tmp_path):
+    path = str(tmp_path / "us.holidays")
+    HolidayCalendar.write(path, [date(2021, 7, 5)])
+
+    text = "2021-07-02T16:00:00\n\n2021-07-06T09:00:00\n"
+    code, output, _ = run(["--increment", "business_days=1", "--holidays", path], text)
+    assert code == 0
+    assert output == "2021-07-06T16:00:00\n\n2021-07-07T09:00:00\n"
+
+    text_path = tmp_path / "holidays.txt"
+    text_path.write_text("# US\n2021-07-05\n")
+    code, output, _ = run(["-i", "business_days=1", "-H", str(text_path), "-o", "%Y-%m-%d"], text)
+    assert output == "2021-07-06\n\n2021-07-07\n"
+
+    code, output, _ = run(["--tz", "America/New_York", "--end-of", "day"], "2021-07-02T02:00:00Z\n")
+    assert output == "2021-07-01T23:59:59-04:00\n"
+
+    # The offset follows daylight saving time.
+    code, output, _ = run(["--tz", "America/New_York", "--start-of", "month"], "2021-11-15T12:00:00Z\n")
+    assert output == "2021-11-01T00:00:00-04:00\n"
+
+    code, output, _ = run(["--tz", "America/New_York", "--increment", "days=2"], "2021-03-13T12:00:00Z\n")
+    assert output == "2021-03-15T07:00:00-04:00\n"
+
+    input_path = tmp_path / "input.log"
+    input_path.write_text("07/02/2021\n")
+    code, output, _ = run(["--input-format", "%m/%d/%Y", "--bucket", "quarter", str(input_path)], "")
+    assert output == "2021-Q3\n"
+
+
+def test_main_errors():
+    code, output, error = run([], "2021-07-02\nnot a date\n2021-07-03\n")
+    assert code == 1
+    assert output == "2021-07-02T00:00:00\n"
+    assert "Line 2" in error
+
+    code, output, _ = run(["--on-error", "skip"], "2021-07-02\nnot a date\n")
+    assert code == 0
+    assert output == "2021-07-02T00:00:00\n"
+
+    code, output, _ = run(["--on-error", "keep"], "not a date\n")
+    assert output == "not a date\n"
+
+    assert run(["--increment", "fortnights=1"], "")[0] == 2
+    assert run(["--tz", "Mars/Olympus_Mons"], "")[0] == 2
+    assert run(["--start-of", "day", "--end-of", "day"], "")[0] == 2
+
+    code, _, error = run(["--holidays", "/nonexistent/us.holidays"], "")
+    assert code == 2
+    assert "Could not load holidays" in error
+
+    # A value that overflows when transformed follows --on-error like one that cannot be parsed.
+    code, output, error = run(["--increment", "days=1"], "2021-07-02\n9999-12-31\n")
+    assert code == 1
+    assert output == "2021-07-03T00:00:00\n"
+    assert "Line 2" in error
+
+    code, output, _ = run(["--increment", "days=1", "--on-error", "keep"], "9999-12-31\n")
+    assert code == 0
+    assert output == "9999-12-31\n"
+
+
+def test_main_partial_holidays(tmp_path):
+    path = tmp_path / "holidays.txt"
+    path.write_text("2021-01-01\n2021-04\n")
+
+    code, _, error = run(["--holidays", str(path)], "")
+    assert code == 2
+    assert "line 2" in error
+
+
+def test_parse_increments():
+    assert parse_increments(["business_days=5", "days=-1", "days=3"]) == {'business_days': 5, 'days': 2}
+
+    with pytest.raises(ValueError):
+        parse_increments(["days=one"])
+
+
+def test_transform():
+    transform = Transform(increments={'months': 1}, start_of="quarter")
+    assert transform.apply("2021-03-31") == "2021-04-01T00:00:00"
+
+    with pytest.raises(TransformError):
+        transform.apply("")
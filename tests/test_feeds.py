@@ -0,0 +1,117 @@
+from datetime import date, datetime, timedelta
+from datetime_machine.feeds import *
+from datetime_machine.library import DateTime
+import pytest
+import pytz
+import random
+
+HOLIDAYS = [
+    date(2021, 7, 5),
+]
+
+
+def get_gaps(checker, dts, **kwargs):
+    return [(kind, value) if kind == "duplicate" else (kind, (value.start.dt, value.end.dt))
+            for kind, value in checker.check(dts, **kwargs)]
+
+
+class TestFeedChecker(object):
+
+    def test_business_day(self):
+        checker = FeedChecker("business_day", holidays=HOLIDAYS)
+
+        # Friday, then Tuesday after the holiday; the weekend and the holiday are not missing.
+        dts = [datetime(2021, 7, 2, 9), datetime(2021, 7, 3, 9), datetime(2021, 7, 6, 9), datetime(2021, 7, 9, 9)]
+        assert get_gaps(checker, dts) == [
+            ("gap", (datetime(2021, 7, 7), datetime(2021, 7, 8, 23, 59, 59))),
+        ]
+
+    def test_bounds(self):
+        checker = FeedChecker("day")
+
+        dts = [datetime(2021, 1, 3, 12), datetime(2021, 1, 4, 12), datetime(2021, 1, 20)]
+        assert get_gaps(checker, dts, start_dt=datetime(2021, 1, 1), end_dt=datetime(2021, 1, 6, 12)) == [
+            ("gap", (datetime(2021, 1, 1), datetime(2021, 1, 2, 23, 59, 59))),
+            ("gap", (datetime(2021, 1, 5), datetime(2021, 1, 6, 23, 59, 59))),
+        ]
+
+        assert get_gaps(checker, [], start_dt=datetime(2021, 1, 1), end_dt=datetime(2021, 1, 1, 12)) == [
+            ("gap", (datetime(2021, 1, 1), datetime(2021, 1, 1, 23, 59, 59))),
+        ]
+
+    def test_disorder(self):
+        generator = random.Random(20210701)
+        dts = [datetime(2021, 1, 1) + timedelta(hours=i) for i in range(500) if i not in (10, 11, 300)]
+        dts.append(dts[50])
+
+        shuffled = sorted(dts)
+        for index in range(0, len(shuffled) - 4, 4):
+            chunk = shuffled[index:index + 4]
+            generator.shuffle(chunk)
+            shuffled[index:index + 4] = chunk
+
+        checker = FeedChecker("hour", disorder=4)
+        assert get_gaps(checker, shuffled) == [
+            ("gap", (datetime(2021, 1, 1, 10), datetime(2021, 1, 1, 11, 59, 59))),
+            ("duplicate", dts[50]),
+            ("gap", (datetime(2021, 1, 13, 12), datetime(2021, 1, 13, 12, 59, 59))),
+        ]
+
+        with pytest.raises(ValueError):
+            list(FeedChecker("hour").check(shuffled))
+
+    def test_duplicates(self):
+        checker = FeedChecker("day")
+        dts = [datetime(2021, 1, 1, 9), DateTime(datetime(2021, 1, 1, 17)), datetime(2021, 1, 2), datetime(2021, 1, 2)]
+        assert list(checker.check(dts)) == [
+            ("duplicate", datetime(2021, 1, 1, 17)),
+            ("duplicate", datetime(2021, 1, 2)),
+        ]
+
+    def test_init(self):
+        with pytest.raises(ValueError):
+            FeedChecker("fortnight")
+
+        with pytest.raises(ValueError):
+            FeedChecker(disorder=-1)
+
+    def test_daylight_saving_time(self):
+        timezone = pytz.timezone("America/New_York")
+
+        # A complete feed across the end of daylight time has no gaps.
+        dts = [timezone.localize(datetime(2021, 11, day, 12)) for day in range(6, 10)]
+        assert list(FeedChecker("day").check(dts)) == []
+
+        # Periods that start with different offsets are the same on the wall clock.
+        dts = [timezone.localize(datetime(2021, 3, 14, 1)), timezone.localize(datetime(2021, 3, 14, 12))]
+        assert list(FeedChecker("day").check(dts)) == [("duplicate", dts[1])]
+        dts = [timezone.localize(datetime(2021, 3, 1, 1)), timezone.localize(datetime(2021, 3, 20, 12))]
+        assert list(FeedChecker("month").check(dts)) == [("duplicate", dts[1])]
+
+        # Gaps take the offset of each end.
+        dts = [timezone.localize(datetime(2021, 11, 5, 12)), timezone.localize(datetime(2021, 11, 9, 12))]
+        assert get_gaps(FeedChecker("day"), dts) == [
+            ("gap", (timezone.localize(datetime(2021, 11, 6)), timezone.localize(datetime(2021, 11, 8, 23, 59, 59)))),
+        ]
+        assert get_gaps(FeedChecker("day"), dts)[0][1][1].utcoffset() == timedelta(hours=-5)
+
+    def test_month(self):
+        checker = FeedChecker("month")
+        dts = [datetime(2020, 11, 30), datetime(2021, 3, 1), datetime(2021, 4, 15)]
+        assert get_gaps(checker, dts) == [
+            ("gap", (datetime(2020, 12, 1), datetime(2021, 2, 28, 23, 59, 59))),
+        ]
+
+    def test_stream(self):
+        checker = FeedChecker("day")
+        dts = (datetime(2000, 1, 1) + timedelta(days=i) for i in range(0, 20000, 2))
+        results = checker.check(dts)
+        assert next(results)[1].start.dt == datetime(2000, 1, 2)
+
+    def test_week(self):
+        checker = FeedChecker("week")
+        dts = [datetime(2021, 1, 4), datetime(2021, 1, 10, 23), datetime(2021, 1, 27)]
+        assert get_gaps(checker, dts) == [
+            ("duplicate", datetime(2021, 1, 10, 23)),
+            ("gap", (datetime(2021, 1, 11), datetime(2021, 1, 24, 23, 59, 59))),
+        ]
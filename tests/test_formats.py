@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta
+from datetime_machine.formats import *
+from datetime_machine.formats import BATCH_SIZE
+from datetime_machine.library import DateTime
+import pytest
+import pytz
+import random
+
+FORMATS = (
+    "%Y-%m-%d",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%d/%m/%y %H:%M",
+    "%j",
+    "100%% on %Y%m%d",
+    "%a, %d %b %Y %H:%M:%S %z",
+)
+
+
+def get_datetimes(count=500, tzinfo=None):
+    generator = random.Random(20210228)
+    start = datetime(1999, 1, 1, tzinfo=tzinfo)
+    return [
+        start + timedelta(seconds=generator.randint(0, 86400 * 365 * 30), microseconds=generator.randint(0, 999999))
+        for _ in range(count)
+    ]
+
+
+class TestFormat(object):
+
+    def test_apply(self):
+        dts = get_datetimes(tzinfo=pytz.UTC)
+        for fmt in FORMATS:
+            f = Format(fmt)
+            for dt in dts:
+                assert f.apply(dt) == dt.strftime(fmt)
+
+        assert Format("%Y").apply(DateTime(datetime(2021, 1, 1))) == "2021"
+
+    def test_apply_many(self):
+        dts = get_datetimes(count=BATCH_SIZE * 2 + 3)
+        for fmt in FORMATS[:-1] + ("iso8601",):
+            f = Format(fmt)
+            expected = [f.apply(dt) for dt in dts]
+            assert f.apply_many(dts) == expected
+            assert f.apply_many(dts, separator="\n") == "\n".join(expected)
+            assert f.apply_many(dts, separator="%,") == "%,".join(expected)
+
+        assert Format("%Y").apply_many([]) == []
+        assert Format("%Y").apply_many([], separator=",") == ""
+
+    def test_compile(self):
+        assert Format("%Y-%m-%d").template == "%04d-%02d-%02d"
+        assert Format("100%% %H").template == "100%% %02d"
+        assert Format("%a %H").template is None
+        assert Format("iso8601").template is None
+
+    def test_iso8601(self):
+        dt = datetime(2021, 2, 28, 11, 30, 15, 250)
+        assert Format("iso8601").apply(dt) == "2021-02-28T11:30:15.000250"
+
+    def test_rfc3339(self):
+        f = Format("rfc3339")
+        assert f.apply(datetime(2021, 2, 28, 11, 30, tzinfo=pytz.UTC)) == "2021-02-28T11:30:00Z"
+
+        dt = pytz.timezone("America/New_York").localize(datetime(2021, 2, 28, 11, 30))
+        assert f.apply(dt) == "2021-02-28T11:30:00-05:00"
+
+        with pytest.raises(ValueError):
+            f.apply(datetime(2021, 2, 28))
+
+
+def test_compile_format():
+    assert compile_format("%Y-%m-%d") is compile_format("%Y-%m-%d")
+
+
+def test_format_many():
+    dts = [datetime(2021, 1, 1), DateTime(datetime(2021, 1, 2))]
+    assert format_many(dts, "%Y-%m-%d") == ["2021-01-01", "2021-01-02"]
+    assert format_many(dts, "%Y-%m-%d", separator=",") == "2021-01-01,2021-01-02"
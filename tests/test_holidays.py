@@ -0,0 +1,153 @@
+from datetime import date, datetime
+from datetime_machine.constants import FRIDAY, MONDAY, THURSDAY
+from datetime_machine.holidays import *
+from datetime_machine.utils import count_business_days, increment, is_business_day
+import pytest
+
+HOLIDAYS = [
+    date(2021, 12, 25),
+    date(2021, 1, 1),
+    date(2021, 7, 5),
+    date(2021, 1, 1),
+]
+
+
+class TestHolidayCalendar(object):
+
+    def test_from_dates(self):
+        calendar = HolidayCalendar.from_dates(HOLIDAYS)
+        assert len(calendar) == 3
+        assert list(calendar) == [date(2021, 1, 1), date(2021, 7, 5), date(2021, 12, 25)]
+        assert date(2021, 7, 5) in calendar
+        assert datetime(2021, 7, 5, 11, 30) in calendar
+        assert date(2021, 7, 4) not in calendar
+        assert date(2022, 1, 1) not in calendar
+
+        empty = HolidayCalendar.from_dates(list())
+        assert len(empty) == 0
+        assert date(2021, 1, 1) not in empty
+
+    def test_init(self):
+        with pytest.raises(ValueError):
+            HolidayCalendar(b"DTMH")
+
+        with pytest.raises(ValueError):
+            HolidayCalendar(b"XXXX" + b"\x00" * 8)
+
+        with pytest.raises(ValueError):
+            HolidayCalendar(b"DTMH\x01\x00\x00\x00\x02\x00\x00\x00")
+
+    def test_open(self, tmp_path):
+        path = str(tmp_path / "us.holidays")
+        HolidayCalendar.write(path, HOLIDAYS)
+
+        with HolidayCalendar.open(path) as calendar:
+            assert len(calendar) == 3
+            assert date(2021, 12, 25) in calendar
+
+            # Friday, July 2nd plus 1 business day skips the weekend and the observed holiday.
+            assert increment(datetime(2021, 7, 2), business_days=1, holidays=calendar) == datetime(2021, 7, 6)
+            assert is_business_day(datetime(2021, 7, 5), holidays=calendar) is False
+            assert is_business_day(datetime(2021, 7, 6), holidays=calendar) is True
+
+        bad_path = str(tmp_path / "bad.holidays")
+        with open(bad_path, "wb") as f:
+            f.write(b"not a calendar")
+
+        with pytest.raises(ValueError):
+            HolidayCalendar.open(bad_path)
+
+    def test_load(self, tmp_path):
+        path = str(tmp_path / "us.holidays")
+        HolidayCalendar.write(path, HOLIDAYS)
+
+        calendar = HolidayCalendar.load(path)
+        assert HolidayCalendar.load(path) is calendar
+        assert date(2021, 7, 5) in calendar
+
+        # A changed file is opened again.
+        HolidayCalendar.write(path, HOLIDAYS + [date(2021, 11, 25)])
+        changed = HolidayCalendar.load(path)
+        assert changed is not calendar
+        assert len(changed) == 4
+
+
+def get_rules():
+    return HolidayRules([
+        HolidayRule.fixed("New Year's Day", 1, 1, observed="nearest"),
+        HolidayRule.nth_weekday("Memorial Day", 5, MONDAY, -1),
+        HolidayRule.fixed("Juneteenth", 6, 19, observed="nearest", start_year=2021),
+        HolidayRule.fixed("Independence Day", 7, 4, observed="nearest"),
+        HolidayRule.nth_weekday("Thanksgiving Day", 11, THURSDAY, 4),
+        HolidayRule.fixed("Christmas Day", 12, 25, observed="next"),
+        HolidayRule.easter("Good Friday", days=-2),
+    ])
+
+
+class TestHolidayRule(object):
+
+    def test_get_date(self):
+        assert HolidayRule.easter("Easter Monday", days=1).get_date(2021) == date(2021, 4, 5)
+        assert HolidayRule.fixed("Leap Day", 2, 29).get_date(2021) is None
+        assert HolidayRule.nth_weekday("Labor Day", 9, MONDAY, 1).get_date(2021) == date(2021, 9, 6)
+        assert HolidayRule.nth_weekday("Memorial Day", 5, MONDAY, -1).get_date(2021) == date(2021, 5, 31)
+        assert HolidayRule.nth_weekday("Fifth Monday", 2, MONDAY, 5).get_date(2021) is None
+        assert HolidayRule.nth_weekday("Last Friday", 12, FRIDAY, -1).get_date(2021) == date(2021, 12, 31)
+        assert HolidayRule.fixed("Juneteenth", 6, 19, start_year=2021).get_date(2020) is None
+
+        # Saturday, July 4th 2020.
+        assert HolidayRule.fixed("Independence Day", 7, 4, observed="nearest").get_date(2020) == date(2020, 7, 3)
+        assert HolidayRule.fixed("Independence Day", 7, 4, observed="next").get_date(2020) == date(2020, 7, 6)
+        assert HolidayRule.fixed("Independence Day", 7, 4).get_date(2020) == date(2020, 7, 4)
+
+    def test_init(self):
+        with pytest.raises(ValueError):
+            HolidayRule.fixed("New Year's Day", 1, 1, observed="previous")
+
+        with pytest.raises(ValueError):
+            HolidayRule.nth_weekday("Never", 1, MONDAY, 0)
+
+
+class TestHolidayRules(object):
+
+    def test_contains(self):
+        rules = get_rules()
+
+        # New Year's Day 2022 is a Saturday, so it is observed on Friday, December 31st 2021.
+        assert date(2021, 12, 31) in rules
+        assert date(2022, 1, 1) not in rules
+        assert datetime(2021, 11, 25, 10) in rules
+        assert date(2020, 6, 19) not in rules
+        assert date(2021, 6, 18) in rules
+        assert date(2099, 11, 26) in rules
+
+        assert rules.get_dates(2021) == (
+            date(2021, 1, 1),
+            date(2021, 4, 2),
+            date(2021, 5, 31),
+            date(2021, 6, 18),
+            date(2021, 7, 5),
+            date(2021, 11, 25),
+            date(2021, 12, 27),
+            date(2021, 12, 31),
+        )
+        assert rules.get_holidays(2021)[1] == (date(2021, 4, 2), "Good Friday")
+        assert rules.between(date(2021, 12, 1), date(2022, 1, 31)) == [date(2021, 12, 27), date(2021, 12, 31)]
+
+    def test_business_days(self):
+        rules = get_rules()
+        listed = rules.between(date(2020, 1, 1), date(2023, 12, 31))
+
+        # Friday, July 2nd plus 1 business day skips the weekend and the observed holiday.
+        assert increment(datetime(2021, 7, 2), business_days=1, holidays=rules) == datetime(2021, 7, 6)
+        assert is_business_day(datetime(2021, 7, 5), holidays=rules) is False
+        assert count_business_days(datetime(2021, 1, 1), datetime(2021, 12, 31), holidays=rules) == \
+            count_business_days(datetime(2021, 1, 1), datetime(2021, 12, 31), holidays=listed)
+
+    def test_cache(self):
+        rules = get_rules()
+        assert rules == get_rules()
+        assert hash(rules) == hash(get_rules())
+
+        # Equal rules share the cached years.
+        assert get_rules()._get_year(2040) is rules._get_year(2040)
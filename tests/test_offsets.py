@@ -0,0 +1,104 @@
+from datetime import date, datetime, timedelta
+from datetime_machine.constants import SUNDAY
+from datetime_machine.library import DateTime
+from datetime_machine.offsets import *
+import pytest
+import random
+
+HOLIDAYS = [
+    date(2021, 7, 5),
+]
+
+
+def get_datetimes(count=200):
+    generator = random.Random(20210405)
+    start = datetime(2020, 1, 1)
+    return [start + timedelta(days=generator.randint(0, 730), seconds=generator.randint(0, 86399))
+            for _ in range(count)]
+
+
+class TestOffset(object):
+
+    def test_amount(self):
+        dt = datetime(2021, 7, 2, 10, 30)
+        assert Offset("+3 business days").apply(dt, holidays=HOLIDAYS) == datetime(2021, 7, 8, 10, 30)
+        assert Offset("-1 business day").apply(datetime(2021, 7, 6), holidays=HOLIDAYS) == datetime(2021, 7, 2)
+        assert Offset("2 weeks").apply(dt) == datetime(2021, 7, 16, 10, 30)
+        assert Offset("+1 quarter").apply(dt) == datetime(2021, 10, 2, 10, 30)
+        assert Offset("-90 minutes").apply(dt) == datetime(2021, 7, 2, 9)
+
+    def test_apply(self):
+        offset = Offset("+1 day")
+
+        value = DateTime(datetime(2021, 1, 1))
+        result = offset.apply(value)
+        assert isinstance(result, DateTime)
+        assert result.dt == datetime(2021, 1, 2)
+        assert value.dt == datetime(2021, 1, 1)
+
+        assert offset.apply([datetime(2021, 1, 1), datetime(2021, 1, 31)]) == [
+            datetime(2021, 1, 2),
+            datetime(2021, 2, 1),
+        ]
+
+    def test_apply_array(self):
+        np = pytest.importorskip("numpy")
+        from datetime_machine.arrays import DateTimeArray
+
+        datetimes = get_datetimes()
+        values = DateTimeArray(datetimes)
+        expressions = [
+            "+3 business days then 09:00",
+            "-1 month then end of month",
+            "next monday 09:00",
+            "last friday",
+            "start of week",
+            "end of week",
+            "+2 days, start of day",
+        ]
+        for expression in expressions:
+            offset = Offset(expression)
+            expected = [offset.apply(dt, holidays=HOLIDAYS) for dt in datetimes]
+            assert offset.apply(values, holidays=HOLIDAYS).to_datetimes() == expected, expression
+
+        offset = Offset("end of week", start_day=SUNDAY)
+        assert offset.apply(values).to_datetimes() == [offset.apply(dt) for dt in datetimes]
+
+    def test_boundary(self):
+        dt = datetime(2021, 3, 10, 10, 30)
+        assert Offset("-1 month then end of month").apply(dt) == datetime(2021, 2, 28, 23, 59, 59)
+        assert Offset("start of the week").apply(dt) == datetime(2021, 3, 8)
+        assert Offset("end of week").apply(dt) == datetime(2021, 3, 14, 23, 59, 59)
+        assert Offset("start of week", start_day=SUNDAY).apply(dt) == datetime(2021, 3, 7)
+
+    def test_init(self):
+        offset = Offset("  -1 Month THEN end  of month ")
+        assert offset.steps == (("amount", {'months': -1}), ("boundary", ("end", "month")))
+
+        for expression in ("", "+3 fortnights", "next someday", "25:00", "start of decade", "1 month then"):
+            with pytest.raises(ValueError):
+                Offset(expression)
+
+    def test_time(self):
+        dt = datetime(2021, 3, 10, 10, 30, 15, 500)
+        assert Offset("09:00").apply(dt) == datetime(2021, 3, 10, 9)
+        assert Offset("at 23:59:59").apply(dt) == datetime(2021, 3, 10, 23, 59, 59)
+
+    def test_weekday(self):
+        # Wednesday.
+        dt = datetime(2021, 3, 10, 10, 30)
+        assert Offset("next monday 09:00").apply(dt) == datetime(2021, 3, 15, 9)
+        assert Offset("next wednesday").apply(dt) == datetime(2021, 3, 17, 10, 30)
+        assert Offset("last wednesday").apply(dt) == datetime(2021, 3, 3, 10, 30)
+        assert Offset("previous monday at 08:00").apply(dt) == datetime(2021, 3, 8, 8)
+
+
+class TestCompileOffset(object):
+
+    def test_compile_offset(self):
+        offset = compile_offset("+3 business days")
+        assert compile_offset("+3 business days") is offset
+        assert compile_offset("+3 business days", start_day=SUNDAY) is not offset
+
+        with pytest.raises(ValueError):
+            compile_offset("sometime")
@@ -0,0 +1,103 @@
+import asyncio
+from datetime import datetime
+from datetime_machine.scheduler import *
+import pytest
+
+
+class TestJob(object):
+
+    def test_init(self):
+        with pytest.raises(ValueError):
+            Job("invalid", anchor="decade")
+
+        with pytest.raises(ValueError):
+            Job("never")
+
+        with pytest.raises(ValueError):
+            Job("backward", hours=-1)
+
+    def test_get_next_dt(self):
+        job = Job("hourly", hours=1)
+        assert job.get_next_dt(datetime(2021, 2, 26, 11, 30)) == datetime(2021, 2, 26, 12, 30)
+
+        # Friday plus 1 business day is Monday.
+        job = Job("daily", business_days=1)
+        assert job.get_next_dt(datetime(2021, 2, 26, 11, 30)) == datetime(2021, 3, 1, 11, 30)
+
+        job = Job("monthly", anchor="month")
+        assert job.get_next_dt(datetime(2021, 2, 26, 11, 30)) == datetime(2021, 3, 1)
+        assert job.get_next_dt(datetime(2021, 3, 1)) == datetime(2021, 4, 1)
+
+        # The 3rd business day of March 2021 is Wednesday the 3rd, and of April 2021 is Monday the 5th.
+        job = Job("payroll", anchor="month", business_days=3)
+        assert job.get_next_dt(datetime(2021, 3, 1)) == datetime(2021, 3, 3)
+        assert job.get_next_dt(datetime(2021, 3, 3)) == datetime(2021, 4, 5)
+
+        # The last business day of each month falls before the start of the next.
+        job = Job("month-end", anchor="month", business_days=-1)
+        assert job.get_next_dt(datetime(2021, 3, 15)) == datetime(2021, 3, 31)
+        assert job.get_next_dt(datetime(2021, 3, 31)) == datetime(2021, 4, 30)
+        assert job.get_next_dt(datetime(2021, 4, 30)) == datetime(2021, 5, 31)
+
+        job = Job("weekly", anchor="week", hours=9)
+        assert job.get_next_dt(datetime(2021, 2, 26, 11, 30)) == datetime(2021, 3, 1, 9)
+
+
+class TestScheduler(object):
+
+    def test_add(self):
+        scheduler = Scheduler()
+        job = Job("hourly", hours=1)
+        assert scheduler.add(job, now=datetime(2021, 3, 1)) == datetime(2021, 3, 1, 1)
+        assert len(scheduler) == 1
+        assert scheduler.peek() == datetime(2021, 3, 1, 1)
+
+    def test_pop_due(self):
+        hourly = Job("hourly", hours=1, start_dt=datetime(2021, 3, 1, 1))
+        daily = Job("daily", days=1, start_dt=datetime(2021, 3, 2))
+        scheduler = Scheduler([hourly, daily])
+
+        assert scheduler.pop_due(datetime(2021, 3, 1, 0, 30)) == list()
+
+        assert scheduler.pop_due(datetime(2021, 3, 1, 1)) == [hourly]
+        assert hourly.due_dt == datetime(2021, 3, 1, 1)
+        assert hourly.next_dt == datetime(2021, 3, 1, 2)
+
+        # Missed runs are coalesced.
+        due = scheduler.pop_due(datetime(2021, 3, 2, 0, 30))
+        assert due == [hourly, daily]
+        assert hourly.next_dt == datetime(2021, 3, 2, 1)
+        assert daily.next_dt == datetime(2021, 3, 3)
+
+    def test_pop_due_anchored(self):
+        job = Job("month-end", anchor="month", business_days=-1, start_dt=datetime(2021, 3, 31))
+        scheduler = Scheduler([job])
+
+        assert scheduler.pop_due(datetime(2021, 3, 31)) == [job]
+        assert job.next_dt == datetime(2021, 4, 30)
+
+    def test_remove(self):
+        job = Job("hourly", hours=1, start_dt=datetime(2021, 3, 1, 1))
+        scheduler = Scheduler([job])
+        scheduler.remove(job)
+        assert len(scheduler) == 0
+        assert scheduler.peek() is None
+        assert scheduler.pop_due(datetime(2021, 3, 2)) == list()
+
+        scheduler.add(job)
+        assert len(scheduler) == 1
+        assert scheduler.pop_due(datetime(2021, 3, 1, 1)) == [job]
+
+    def test_run(self):
+        job = Job("hourly", hours=1, start_dt=datetime(2021, 3, 1, 1))
+        scheduler = Scheduler([job])
+
+        async def collect():
+            fired = list()
+            async for _job in scheduler.run(clock=lambda: datetime(2021, 3, 1, 1)):
+                fired.append(_job.due_dt)
+                scheduler.remove(_job)
+
+            return fired
+
+        assert asyncio.run(collect()) == [datetime(2021, 3, 1, 1)]
@@ -0,0 +1,121 @@
+from datetime import date, datetime, timedelta
+from datetime_machine.library import DateTime
+from datetime_machine.schedules import *
+import pytest
+import random
+
+HOLIDAYS = [
+    date(2021, 7, 5),
+]
+
+
+class TestSchedule(object):
+
+    def test_convention(self):
+        schedule = Schedule(datetime(2021, 1, 31), datetime(2021, 12, 31), months=3, end_of_month=True,
+                            convention="modified_following", holidays=HOLIDAYS)
+
+        # July 31st is a Saturday, and rolling forward would leave the month.
+        assert schedule.get_dates() == [
+            datetime(2021, 1, 29),
+            datetime(2021, 4, 30),
+            datetime(2021, 7, 30),
+            datetime(2021, 10, 29),
+            datetime(2021, 12, 31),
+        ]
+        assert schedule.get_dates(adjusted=False)[2] == datetime(2021, 7, 31)
+
+    def test_end_of_month(self):
+        start_dt = datetime(2021, 2, 28, 9)
+        end_dt = datetime(2021, 7, 1, 9)
+
+        assert Schedule(start_dt, end_dt).get_dates() == [
+            datetime(2021, 2, 28, 9),
+            datetime(2021, 3, 28, 9),
+            datetime(2021, 4, 28, 9),
+            datetime(2021, 5, 28, 9),
+            datetime(2021, 6, 28, 9),
+            datetime(2021, 7, 1, 9),
+        ]
+
+        assert Schedule(start_dt, end_dt, end_of_month=True).get_dates() == [
+            datetime(2021, 2, 28, 9),
+            datetime(2021, 3, 31, 9),
+            datetime(2021, 4, 30, 9),
+            datetime(2021, 5, 31, 9),
+            datetime(2021, 6, 30, 9),
+            datetime(2021, 7, 1, 9),
+        ]
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            Schedule(datetime(2021, 1, 1), datetime(2021, 1, 1))
+
+        with pytest.raises(ValueError):
+            Schedule(datetime(2021, 1, 1), datetime(2022, 1, 1), months=0)
+
+        with pytest.raises(ValueError):
+            Schedule(datetime(2021, 1, 1), datetime(2022, 1, 1), convention="nearest")
+
+        with pytest.raises(ValueError):
+            Schedule(datetime(2021, 1, 1), datetime(2022, 1, 1), stub="middle")
+
+    def test_no_drift(self):
+        schedule = Schedule(DateTime(datetime(2021, 1, 31)), datetime(2022, 1, 31), months=1)
+        dates = schedule.get_dates()
+
+        assert len(schedule) == 13
+        assert [dt.day for dt in dates] == [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31, 31]
+
+    def test_periods(self):
+        periods = Schedule(datetime(2021, 1, 15), datetime(2021, 4, 1), months=1).get_periods()
+        assert [(period.start.dt, period.end.dt) for period in periods] == [
+            (datetime(2021, 1, 15), datetime(2021, 2, 15)),
+            (datetime(2021, 2, 15), datetime(2021, 3, 15)),
+            (datetime(2021, 3, 15), datetime(2021, 4, 1)),
+        ]
+
+    def test_stub(self):
+        start_dt = datetime(2021, 1, 15)
+        end_dt = datetime(2022, 3, 31)
+
+        assert Schedule(start_dt, end_dt, years=1).get_dates() == [start_dt, datetime(2022, 1, 15), end_dt]
+        assert Schedule(start_dt, end_dt, months=6, stub="start", end_of_month=True).get_dates() == [
+            start_dt,
+            datetime(2021, 3, 31),
+            datetime(2021, 9, 30),
+            datetime(2022, 3, 31),
+        ]
+
+
+def test_schedule_many():
+    pytest.importorskip("numpy")
+
+    generator = random.Random(20210131)
+    starts = list()
+    ends = list()
+    for _ in range(100):
+        start_dt = datetime(2020, 1, 1) + timedelta(days=generator.randint(0, 730), hours=generator.randint(0, 23))
+        if generator.random() < 0.3:
+            start_dt = start_dt.replace(day=1) - timedelta(days=1)
+
+        starts.append(start_dt)
+        ends.append(start_dt + timedelta(days=generator.randint(1, 2000)))
+
+    for months in (1, 3, 12):
+        for stub in ("end", "start"):
+            for end_of_month in (False, True):
+                for convention in (None, "modified_following"):
+                    kwargs = dict(months=months, end_of_month=end_of_month, convention=convention, holidays=HOLIDAYS,
+                                  stub=stub)
+                    indices, dates = schedule_many(starts, ends, **kwargs)
+                    dates = dates.to_datetimes()
+                    for index, (start_dt, end_dt) in enumerate(zip(starts, ends)):
+                        expected = Schedule(start_dt, end_dt, **kwargs).get_dates()
+                        assert [dt for i, dt in zip(indices, dates) if i == index] == expected, (index, kwargs)
+
+    with pytest.raises(ValueError):
+        schedule_many(starts, ends[:-1])
+
+    with pytest.raises(ValueError):
+        schedule_many(ends, starts)
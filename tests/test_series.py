@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta
+from datetime_machine.arrays import DateTimeArray
+from datetime_machine.library import DateTime, DateTimeRange
+from datetime_machine.series import *
+import pytest
+import pytz
+import random
+
+
+def get_series(count=1000):
+    generator = random.Random(20210801)
+    dts = sorted(datetime(2021, 1, 1) + timedelta(minutes=generator.randint(0, 60 * 24 * 400)) for _ in range(count))
+    values = [generator.randint(-50, 50) for _ in range(count)]
+    return dts, values
+
+
+class TestResample(object):
+
+    def test_aggregates(self):
+        dts = [datetime(2021, 1, 1, 9), datetime(2021, 1, 1, 17), datetime(2021, 1, 3)]
+        values = [4, 2, 7]
+
+        assert resample(dts, values, aggregate="sum") == [
+            (datetime(2021, 1, 1), 6),
+            (datetime(2021, 1, 2), 0),
+            (datetime(2021, 1, 3), 7),
+        ]
+        assert [value for _, value in resample(dts, values, aggregate="mean")] == [3, None, 7]
+        assert [value for _, value in resample(dts, values, aggregate="min")] == [2, None, 7]
+        assert [value for _, value in resample(dts, values, aggregate="max")] == [4, None, 7]
+
+    def test_array(self):
+        np = pytest.importorskip("numpy")
+
+        dts, values = get_series()
+        dt_range = DateTimeRange(datetime(2021, 3, 1), datetime(2021, 12, 31))
+        array = DateTimeArray(dts)
+
+        for by in ("day", "week", "month", "quarter", "year"):
+            for aggregate in ("count", "sum", "mean", "min", "max"):
+                expected = resample(dts, values, by=by, aggregate=aggregate)
+                assert resample(array, np.array(values), by=by, aggregate=aggregate) == expected
+
+                expected = resample(dts, values, by=by, dt_range=dt_range, aggregate=aggregate)
+                assert resample(array, np.array(values), by=by, dt_range=dt_range, aggregate=aggregate) == expected
+
+        # Arrays need not be sorted.
+        order = np.random.RandomState(1).permutation(len(dts))
+        shuffled = np.array(dts, dtype="datetime64[us]")[order]
+        assert resample(shuffled, np.array(values)[order], aggregate="sum") == resample(dts, values, aggregate="sum")
+
+        assert resample(np.array([], dtype="datetime64[us]")) == []
+
+    def test_array_timezone(self):
+        pytest.importorskip("numpy")
+
+        timezone = pytz.timezone("America/New_York")
+        dts = [timezone.localize(datetime(2021, 3, 13, 12)), timezone.localize(datetime(2021, 3, 15, 12))]
+        assert resample(DateTimeArray(dts)) == resample(dts)
+
+    def test_count(self):
+        dts, _ = get_series()
+        results = resample(dts, by="month")
+
+        assert [dt for dt, _ in results][:3] == [datetime(2021, 1, 1), datetime(2021, 2, 1), datetime(2021, 3, 1)]
+        assert sum(count for _, count in results) == len(dts)
+        for start_dt, count in results:
+            assert count == len([dt for dt in dts if (dt.year, dt.month) == (start_dt.year, start_dt.month)])
+
+    def test_empty(self):
+        assert resample([]) == []
+
+        dt_range = DateTimeRange(datetime(2021, 1, 1), datetime(2021, 6, 30))
+        assert resample([], by="quarter", dt_range=dt_range) == [(datetime(2021, 1, 1), 0), (datetime(2021, 4, 1), 0)]
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            resample([], by="fortnight")
+
+        with pytest.raises(ValueError):
+            resample([], aggregate="median")
+
+        with pytest.raises(ValueError):
+            resample([], aggregate="sum")
+
+        with pytest.raises(ValueError):
+            resample([datetime(2021, 1, 2), datetime(2021, 1, 1)])
+
+    def test_range(self):
+        dts = [datetime(2020, 12, 31), DateTime(datetime(2021, 1, 5)), datetime(2021, 1, 12), datetime(2021, 2, 1)]
+        dt_range = DateTimeRange(datetime(2021, 1, 1), datetime(2021, 1, 20))
+
+        assert resample(dts, by="week", dt_range=dt_range) == [
+            (datetime(2020, 12, 28), 1),
+            (datetime(2021, 1, 4), 1),
+            (datetime(2021, 1, 11), 1),
+            (datetime(2021, 1, 18), 0),
+        ]
+
+    def test_timezone(self):
+        timezone = pytz.timezone("America/New_York")
+        dts = [timezone.localize(datetime(2021, 3, 13, 12)), timezone.localize(datetime(2021, 3, 15, 12))]
+
+        results = resample(dts)
+        assert [dt for dt, _ in results] == [timezone.localize(datetime(2021, 3, day)) for day in (13, 14, 15)]
@@ -1,7 +1,12 @@
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from dateutil.relativedelta import relativedelta
+from datetime_machine.constants import SUNDAY
+from datetime_machine.holidays import HolidayRule, HolidayRules
 from datetime_machine.variables import CURRENT_YEAR
 from datetime_machine.utils import *
 import pytest
+import pytz
+import random
 
 
 def test_get_days_in_month():
@@ -15,6 +20,19 @@ def test_get_days_in_month():
         get_days_in_month(13)
 
 
+def test_get_fiscal_year():
+    assert get_fiscal_year(datetime(2021, 9, 30)) == 2021
+    assert get_fiscal_year(datetime(2021, 9, 30), fiscal_start=10) == 2021
+    assert get_fiscal_year(datetime(2021, 10, 1), fiscal_start=10) == 2022
+
+
+def test_get_quarter():
+    assert get_quarter(1) == 1
+    assert get_quarter(12) == 4
+    assert get_quarter(10, fiscal_start=10) == 1
+    assert get_quarter(9, fiscal_start=10) == 4
+
+
 def test_get_year_range():
     a = get_year_range(2015)
     assert a[0] == 2015
@@ -25,8 +43,48 @@ def test_get_year_range():
     assert a[-1] == 2019
 
 
+def test_get_timedelta():
+    dt = datetime(2021, 2, 28, 11, 30)
+    assert get_timedelta(dt, days=1, hours=2) == timedelta(days=1, hours=2)
+    assert get_timedelta(dt, months=1) is None
+    assert get_timedelta(dt, day=1) is None
+    assert get_timedelta(dt, days=1.5) is None
+    assert get_timedelta(dt.date(), days=1) == timedelta(days=1)
+    assert get_timedelta(dt.date(), hours=1) is None
+
+
 def test_increment():
-    pass
+    dt = datetime(2021, 2, 26, 11, 30)
+    assert increment(dt, days=1) == datetime(2021, 2, 27, 11, 30)
+    assert increment(dt, months=1) == datetime(2021, 3, 26, 11, 30)
+    assert increment(dt, business_days=1) == datetime(2021, 3, 1, 11, 30)
+    assert increment(dt, business_days=-5) == datetime(2021, 2, 19, 11, 30)
+
+    holidays = [date(2021, 3, 1)]
+    assert increment(dt, business_days=1, holidays=holidays) == datetime(2021, 3, 2, 11, 30)
+
+
+def test_increment_matches_relativedelta():
+    keys = ("days", "hours", "microseconds", "minutes", "seconds", "weeks")
+    starts = [
+        date(2020, 2, 29),
+        datetime(2021, 12, 31, 23, 59, 59, 999999),
+        pytz.timezone("US/Eastern").localize(datetime(2021, 3, 14, 1, 30)),
+        datetime(2020, 2, 29, 12, tzinfo=pytz.UTC),
+    ]
+
+    generator = random.Random(20211031)
+    for _ in range(2000):
+        start = generator.choice(starts)
+        kwargs = dict()
+        for key in generator.sample(keys, generator.randint(0, len(keys))):
+            kwargs[key] = generator.randint(-10000, 10000)
+
+        if not isinstance(start, datetime):
+            for key in ("hours", "microseconds", "minutes", "seconds"):
+                kwargs.pop(key, None)
+
+        assert increment(start, **kwargs) == start + relativedelta(**kwargs), kwargs
 
 
 def test_is_business_day():
@@ -59,3 +117,170 @@ def test_is_holiday():
 def test_is_leap_year():
     assert is_leap_year(2019) is False
     assert is_leap_year(2020) is True
+
+
+def test_truncate():
+    dt = datetime(2021, 3, 10, 10, 37, 30, 250)
+    assert truncate(dt, "second") == datetime(2021, 3, 10, 10, 37, 30)
+    assert truncate(dt, "minute", 5) == datetime(2021, 3, 10, 10, 35)
+    assert truncate(dt, "minute", 5, mode="ceil") == datetime(2021, 3, 10, 10, 40)
+    assert truncate(dt, "minute", 5, mode="round") == datetime(2021, 3, 10, 10, 40)
+    assert truncate(dt, "day", mode="round") == datetime(2021, 3, 10)
+    assert truncate(dt, "week", start_day=SUNDAY) == datetime(2021, 3, 7)
+    assert truncate(dt, "month", mode="ceil") == datetime(2021, 4, 1)
+    assert truncate(dt, "quarter", mode="ceil") == datetime(2021, 4, 1)
+    assert truncate(dt, "year", 10) == datetime(2020, 1, 1)
+    assert truncate(datetime(2021, 12, 20), "month", mode="ceil") == datetime(2022, 1, 1)
+    assert truncate(datetime(2021, 3, 16, 12), "month", mode="round") == datetime(2021, 4, 1)
+
+    # Boundaries are unchanged.
+    boundary = datetime(2021, 3, 1, tzinfo=pytz.UTC)
+    for unit in ("second", "minute", "hour", "day", "month"):
+        for mode in ("ceil", "floor", "round"):
+            assert truncate(boundary, unit, mode=mode) == boundary
+
+    with pytest.raises(ValueError):
+        truncate(dt, "fortnight")
+
+    with pytest.raises(ValueError):
+        truncate(dt, "minute", 0)
+
+    with pytest.raises(ValueError):
+        truncate(dt, "minute", mode="nearest")
+
+
+def test_truncate_many():
+    generator = random.Random(20210310)
+    start = datetime(2020, 1, 1)
+    dts = [start + timedelta(seconds=generator.randint(0, 86400 * 730)) for _ in range(500)]
+    for unit, step in (("minute", 5), ("hour", 1), ("day", 1), ("week", 1), ("month", 3)):
+        for mode in ("ceil", "floor", "round"):
+            assert truncate_many(dts, unit, step, mode=mode) == [truncate(dt, unit, step, mode=mode) for dt in dts]
+
+
+def test_count_business_days():
+    holidays = [date(2021, 7, 5), date(2021, 7, 3)]
+    assert count_business_days(datetime(2021, 7, 2), datetime(2021, 7, 6), holidays=holidays) == 1
+    assert count_business_days(datetime(2021, 7, 6), datetime(2021, 7, 2), holidays=holidays) == -1
+    assert count_business_days(datetime(2021, 7, 6), datetime(2021, 7, 6, 23)) == 0
+
+    # Backward from a Sunday, the Friday before is 1 business day back, as for increment().
+    sunday = datetime(2018, 12, 9)
+    assert count_business_days(sunday, datetime(2018, 12, 7)) == -1
+    assert count_business_days(sunday, datetime(2017, 4, 19)) == -428
+    assert increment(sunday, business_days=-428) == datetime(2017, 4, 19)
+
+    generator = random.Random(20210705)
+    for _ in range(200):
+        start = datetime(2021, 6, 1) + timedelta(days=generator.randint(0, 60))
+        end = start + timedelta(days=generator.randint(-40, 40))
+
+        if end < start:
+            expected = -sum(
+                1 for days in range((end - start).days, 0)
+                if is_business_day(start + timedelta(days=days), holidays=holidays)
+            )
+        else:
+            expected = sum(
+                1 for days in range(1, (end - start).days + 1)
+                if is_business_day(start + timedelta(days=days), holidays=holidays)
+            )
+
+        count = count_business_days(start, end, holidays=holidays)
+        assert count == expected, (start, end)
+
+        # Where the end is a business day, increment() lands on it.
+        if is_business_day(end, holidays=holidays):
+            assert increment(start, business_days=count, holidays=holidays) == end, (start, end)
+
+
+def test_diff():
+    assert diff(datetime(2019, 1, 31), datetime(2021, 3, 1)) == {'years': 2, 'months': 1, 'days': 1}
+    assert diff(datetime(2021, 3, 1), datetime(2019, 1, 31)) == {'years': -2, 'months': -1, 'days': -1}
+    assert diff(datetime(2021, 3, 1), datetime(2021, 3, 9, 12), units=("weeks", "days", "hours")) == {
+        'weeks': 1,
+        'days': 1,
+        'hours': 12,
+    }
+    assert diff(datetime(2020, 2, 29), datetime(2021, 2, 28), units=("years", "days")) == {'years': 1, 'days': 0}
+    assert diff(datetime(2021, 3, 5), datetime(2021, 3, 12), units=("business_days",)) == {'business_days': 5}
+
+    # Aware date/times are compared in the timezone of the start.
+    start = pytz.timezone("America/New_York").localize(datetime(2021, 3, 1, 20))
+    end = datetime(2021, 3, 2, 2, tzinfo=pytz.UTC)
+    assert diff(start, end, units=("hours",)) == {'hours': 1}
+
+    with pytest.raises(ValueError):
+        diff(start, end, units=("fortnights",))
+
+    generator = random.Random(20210301)
+    units = ("years", "months", "days", "hours", "minutes", "seconds", "microseconds")
+    for _ in range(500):
+        start = datetime(2020, 1, 1) + timedelta(days=generator.randint(0, 1000), seconds=generator.randint(0, 86399))
+        end = datetime(2020, 1, 1) + timedelta(days=generator.randint(0, 1000), seconds=generator.randint(0, 86399))
+        delta = relativedelta(end, start)
+        expected = dict((unit, getattr(delta, unit)) for unit in units)
+        assert diff(start, end, units=units) == expected, (start, end)
+
+
+def test_roll():
+    holidays = [date(2021, 4, 30), date(2021, 12, 31), date(2022, 1, 3)]
+
+    # Saturday, July 31st.
+    dt = datetime(2021, 7, 31, 10)
+    assert roll(dt) == datetime(2021, 8, 2, 10)
+    assert roll(dt, "modified_following") == datetime(2021, 7, 30, 10)
+    assert roll(dt, "preceding") == datetime(2021, 7, 30, 10)
+    assert roll(dt, "modified_preceding") == datetime(2021, 7, 30, 10)
+
+    # Saturday, May 1st, after a holiday on Friday.
+    dt = datetime(2021, 5, 1)
+    assert roll(dt, "preceding", holidays=holidays) == datetime(2021, 4, 29)
+    assert roll(dt, "modified_preceding", holidays=holidays) == datetime(2021, 5, 3)
+
+    # Across the end of the year.
+    assert roll(date(2021, 12, 31), holidays=holidays) == date(2022, 1, 4)
+    assert roll(date(2022, 1, 1), "preceding", holidays=holidays) == date(2021, 12, 30)
+
+    # A business day is not moved.
+    assert roll(datetime(2021, 7, 30, 10), "preceding") == datetime(2021, 7, 30, 10)
+
+    with pytest.raises(ValueError):
+        roll(dt, "nearest")
+
+
+def test_roll_changed_rules():
+    rule = HolidayRule.fixed("Bank Holiday", 8, 2)
+    rules = HolidayRules([rule])
+    assert roll(date(2021, 7, 31), holidays=rules) == date(2021, 8, 3)
+
+    # Tables are not reused once a rule is changed.
+    rule.day = 3
+    assert roll(date(2021, 7, 31), holidays=rules) == date(2021, 8, 2)
+
+
+def test_roll_many():
+    holidays = set(date(2021, 1, 1) + timedelta(days=days) for days in range(0, 365, 9))
+
+    def step(dt, days):
+        while not is_business_day(dt, holidays):
+            dt += timedelta(days=days)
+
+        return dt
+
+    generator = random.Random(20210731)
+    dts = [datetime(2020, 11, 1) + timedelta(days=generator.randint(0, 500), hours=generator.randint(0, 23))
+           for _ in range(500)]
+    for convention in ("following", "modified_following", "preceding", "modified_preceding"):
+        expected = list()
+        for dt in dts:
+            following, preceding = step(dt, 1), step(dt, -1)
+            if convention.endswith("following"):
+                result = following if convention == "following" or following.month == dt.month else preceding
+            else:
+                result = preceding if convention == "preceding" or preceding.month == dt.month else following
+
+            expected.append(result)
+
+        assert roll_many(dts, convention, holidays=holidays) == expected, convention
+        assert [roll(dt, convention, holidays=holidays) for dt in dts] == expected, convention
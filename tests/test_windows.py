@@ -0,0 +1,82 @@
+from datetime import date, datetime, timedelta
+from datetime_machine.library import DateTime
+from datetime_machine.utils import increment
+from datetime_machine.windows import *
+import pytest
+import random
+
+HOLIDAYS = [
+    date(2021, 1, 1),
+    date(2021, 7, 5),
+]
+
+
+def get_events(count=400):
+    generator = random.Random(20210501)
+    dts = sorted(datetime(2021, 1, 1) + timedelta(minutes=generator.randint(0, 60 * 24 * 200)) for _ in range(count))
+    values = [generator.randint(-50, 50) for _ in range(count)]
+    return dts, values
+
+
+def get_expected(dts, values, aggregate, **kwargs):
+    """Aggregate each window by scanning every earlier event."""
+    results = list()
+    previous_dt = None
+    for index, dt in enumerate(dts):
+        start_dt = increment(dt, **kwargs)
+        if previous_dt is not None:
+            start_dt = max(start_dt, previous_dt)
+
+        previous_dt = start_dt
+        window = [values[i] for i in range(index + 1) if dts[i] >= start_dt]
+        if aggregate == "count":
+            results.append(len(window))
+        else:
+            results.append({'max': max, 'min': min, 'sum': sum}[aggregate](window))
+
+    return results
+
+
+class TestSlidingWindow(object):
+
+    def test_add(self):
+        window = SlidingWindow(days=2)
+        assert window.add(datetime(2021, 3, 1)) == 1
+        assert window.add(DateTime(datetime(2021, 3, 2))) == 2
+        assert window.add(datetime(2021, 3, 3)) == 3
+        assert window.add(datetime(2021, 3, 3, 0, 0, 1)) == 3
+
+        with pytest.raises(ValueError):
+            window.add(datetime(2021, 3, 1))
+
+        window.reset()
+        assert window.add(datetime(2021, 3, 1)) == 1
+
+    def test_aggregates(self):
+        dts, values = get_events()
+        for aggregate in ("count", "max", "min", "sum"):
+            for kwargs in ({'days': 30}, {'hours': 36}, {'months': 1}, {'business_days': 10, 'holidays': HOLIDAYS},
+                           {'business_days': 2, 'hours': 12}):
+                window = SlidingWindow(aggregate, **kwargs)
+                results = [result for _, result in window.apply(dts, values if aggregate != "count" else None)]
+
+                _kwargs = dict((key, -value) if key != "holidays" else (key, value) for key, value in kwargs.items())
+                assert results == get_expected(dts, values, aggregate, **_kwargs), (aggregate, kwargs)
+
+    def test_get_range(self):
+        window = SlidingWindow(business_days=2)
+
+        # Monday, so the window starts on the Thursday before.
+        dt_range = window.get_range(datetime(2021, 3, 8, 10))
+        assert dt_range.start.dt == datetime(2021, 3, 4, 10)
+        assert dt_range.end.dt == datetime(2021, 3, 8, 10)
+
+    def test_init(self):
+        with pytest.raises(ValueError):
+            SlidingWindow("median", days=1)
+
+        with pytest.raises(ValueError):
+            SlidingWindow()
+
+        with pytest.raises(ValueError):
+            SlidingWindow("sum", days=1).add(datetime(2021, 3, 1))
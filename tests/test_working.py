@@ -0,0 +1,133 @@
+from datetime import date, datetime, time, timedelta
+from datetime_machine.constants import FRIDAY, SATURDAY
+from datetime_machine.holidays import HolidayRule, HolidayRules
+from datetime_machine.utils import is_business_day
+from datetime_machine.working import *
+import pytest
+import pytz
+
+HOLIDAYS = [
+    date(2021, 7, 5),
+    date(2021, 12, 24),
+]
+
+
+def step_add(working_hours, dt, duration):
+    """Add working time minute by minute, as a reference for the jumping implementation."""
+    step = timedelta(minutes=1)
+    while duration > timedelta():
+        if working_hours.is_working_time(dt):
+            duration -= step
+        dt += step
+
+    return dt
+
+
+class TestWorkingHours(object):
+
+    def test_init(self):
+        with pytest.raises(ValueError):
+            WorkingHours(start=time(17), end=time(9))
+
+        with pytest.raises(ValueError):
+            WorkingHours(weekdays=())
+
+        working_hours = WorkingHours(start="09:00", end="17:30", schedule={FRIDAY: ("09:00", "13:00")})
+        assert working_hours.week_length == timedelta(hours=8.5 * 4 + 4)
+
+    def test_add(self):
+        working_hours = WorkingHours(start=time(9), end=time(17, 30), holidays=HOLIDAYS)
+
+        # Within the same day.
+        assert working_hours.add(datetime(2021, 7, 1, 9), hours=6) == datetime(2021, 7, 1, 15)
+
+        # Exactly to the end of the day.
+        assert working_hours.add(datetime(2021, 7, 1, 9), hours=8.5) == datetime(2021, 7, 1, 17, 30)
+
+        # Before work begins.
+        assert working_hours.add(datetime(2021, 7, 1, 6), hours=1) == datetime(2021, 7, 1, 10)
+
+        # Friday afternoon rolls over the weekend and the holiday on Monday.
+        assert working_hours.add(datetime(2021, 7, 2, 16), hours=6) == datetime(2021, 7, 6, 13, 30)
+
+        # From a Saturday.
+        assert working_hours.add(datetime(2021, 7, 3, 12), hours=1) == datetime(2021, 7, 6, 10)
+
+        assert working_hours.add(datetime(2021, 7, 3, 12)) == datetime(2021, 7, 3, 12)
+
+    def test_add_matches_stepping(self):
+        working_hours = WorkingHours(start=time(9), end=time(17, 30), holidays=HOLIDAYS,
+                                     schedule={FRIDAY: (time(9), time(13)), SATURDAY: (time(10), time(12))})
+
+        starts = [
+            datetime(2021, 6, 28, 8),
+            datetime(2021, 7, 2, 12, 15),
+            datetime(2021, 7, 4, 23),
+            datetime(2021, 12, 20, 17, 30),
+        ]
+        for start in starts:
+            for hours in (1, 7.5, 8.5, 40, 300):
+                duration = timedelta(hours=hours)
+                end = working_hours.add(start, duration)
+                assert end == step_add(working_hours, start, duration), (start, hours)
+                assert working_hours.between(start, end) == duration
+                assert working_hours.subtract(end, duration) >= start
+                assert working_hours.between(working_hours.subtract(end, duration), end) == duration
+
+    def test_between(self):
+        working_hours = WorkingHours(start=time(9), end=time(17, 30), holidays=HOLIDAYS)
+
+        start_dt = datetime(2021, 7, 2, 16)
+        end_dt = datetime(2021, 7, 6, 13, 30)
+        assert working_hours.between(start_dt, end_dt) == timedelta(hours=6)
+        assert working_hours.between(end_dt, start_dt) == timedelta(hours=-6)
+
+        # Four weeks less one holiday.
+        start_dt = datetime(2021, 6, 28)
+        end_dt = datetime(2021, 7, 26)
+        assert working_hours.between(start_dt, end_dt) == timedelta(hours=8.5 * 19)
+
+    def test_holiday_rules(self):
+        rules = HolidayRules([HolidayRule.fixed("Independence Day", 7, 5), HolidayRule.fixed("Christmas Eve", 12, 24)])
+        working_hours = WorkingHours(start=time(9), end=time(17, 30), holidays=rules)
+        expected = WorkingHours(start=time(9), end=time(17, 30), holidays=rules.between(date(2020, 1, 1),
+                                                                                        date(2023, 12, 31)))
+
+        # Long durations cross the end of the year, so the holidays of the next year are generated as needed.
+        start_dt = datetime(2021, 6, 28, 8)
+        for hours in (8.5, 40, 300, 2000):
+            end_dt = working_hours.add(start_dt, hours=hours)
+            assert end_dt == expected.add(start_dt, hours=hours)
+            assert working_hours.subtract(end_dt, hours=hours) == expected.subtract(end_dt, hours=hours)
+            assert working_hours.between(start_dt, end_dt) == timedelta(hours=hours)
+
+        assert working_hours.is_working_time(datetime(2021, 12, 24, 12)) is False
+        assert working_hours.between(datetime(2021, 12, 20), datetime(2021, 12, 27)) == timedelta(hours=8.5 * 4)
+
+    def test_is_working_time(self):
+        working_hours = WorkingHours(holidays=HOLIDAYS)
+        assert working_hours.is_working_time(datetime(2021, 7, 2, 9)) is True
+        assert working_hours.is_working_time(datetime(2021, 7, 2, 17)) is False
+        assert working_hours.is_working_time(datetime(2021, 7, 3, 12)) is False
+        assert working_hours.is_working_time(datetime(2021, 7, 5, 12)) is False
+
+        # The default working days agree with is_business_day().
+        for day in range(1, 32):
+            dt = datetime(2021, 7, day, 12)
+            assert working_hours.is_working_time(dt) is is_business_day(dt, holidays=HOLIDAYS)
+
+    def test_subtract(self):
+        working_hours = WorkingHours(start=time(9), end=time(17, 30), holidays=HOLIDAYS)
+        assert working_hours.subtract(datetime(2021, 7, 6, 13, 30), hours=6) == datetime(2021, 7, 2, 16)
+        assert working_hours.add(datetime(2021, 7, 6, 13, 30), hours=-6) == datetime(2021, 7, 2, 16)
+        assert working_hours.subtract(datetime(2021, 7, 6, 20), hours=1) == datetime(2021, 7, 6, 16, 30)
+
+    def test_timezone(self):
+        working_hours = WorkingHours(start=time(9), end=time(17, 30), timezone="America/New_York")
+
+        # 20:00 UTC is 16:00 in New York during daylight time.
+        start_dt = datetime(2021, 7, 1, 20, tzinfo=pytz.UTC)
+        due = working_hours.add(start_dt, hours=6)
+        assert due.replace(tzinfo=None) == datetime(2021, 7, 2, 13, 30)
+        assert due.utcoffset() == timedelta(hours=-4)
+        assert working_hours.between(start_dt, due) == timedelta(hours=6)